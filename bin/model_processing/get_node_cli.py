@@ -8,13 +8,28 @@ with the time series
 """
 
 import argparse
+import functools
 
-from ofs_skill.model_processing import model_properties
-from ofs_skill.model_processing.get_node_ofs import get_node_ofs
-from ofs_skill.model_processing.model_source import get_model_source
+from bin.utils.cli_args import DATUMS, VARS, CsvAction, split_csv
 
-if __name__ == '__main__':
+WHICHCASTS = ('nowcast', 'forecast_a', 'forecast_b', 'hindcast')
+
+
+def _load():
+    """Import the extraction stack on demand.
+
+    Deferred until after argument parsing so that ``-h`` and argument
+    errors return without loading netCDF4/xarray/shapely.
+    """
+    from ofs_skill.model_processing import model_properties
+    from ofs_skill.model_processing.get_node_ofs import get_node_ofs
+    from ofs_skill.model_processing.model_source import get_model_source
+    return model_properties, get_node_ofs, get_model_source
 
+
+@functools.cache
+def build_parser():
+    """Build the argument parser for this entry point."""
     parser = argparse.ArgumentParser(
         prog='python get_node_ofs.py',
         usage='%(prog)s',
@@ -44,13 +59,17 @@ if __name__ == '__main__':
         '-d', '--Datum',
         required=False,
         default='MLLW',
+        type=str.upper,
+        choices=DATUMS,
         help="datum options: 'MHW', 'MHHW' \
         'MLW', 'MLLW', 'NAVD88', 'XGEOID20B', 'IGLD85', 'LWD'")
     parser.add_argument(
         '-ws', '--Whichcast',
         required=False,
         default='nowcast',
-        help="whichcasts: 'nowcast', 'forecast_b', 'forecast_a'", )
+        type=str.lower,
+        choices=WHICHCASTS,
+        help="whichcasts: 'nowcast', 'forecast_b', 'forecast_a', 'hindcast'", )
     parser.add_argument(
         '-t', '--FileType',
         required=False,
@@ -73,7 +92,9 @@ if __name__ == '__main__':
         '-vs',
         '--Var_Selection',
         required=False,
-        default='water_level,water_temperature,salinity,currents',
+        action=CsvAction,
+        allowed=VARS,
+        default=split_csv('water_level,water_temperature,salinity,currents'),
         help='Which variables do you want to skill assess? Options are: '
             'water_level, water_temperature, salinity, and currents. Choose '
             'any combination. Default (no argument) is all variables.')
@@ -86,26 +107,18 @@ if __name__ == '__main__':
     parser.add_argument(
         '-c', '--config',
         help='Path to configuration file (default: conf/ofs_dps.conf)')
+    return parser
 
 
-    args = parser.parse_args()
-    prop1 = model_properties.ModelProperties()
-    prop1.ofs = args.OFS.lower()
-    prop1.path = args.Path
-    prop1.config_file = args.config
-    prop1.start_date_full = args.StartDate_full
-    prop1.end_date_full = args.EndDate_full
-    prop1.whichcast = args.Whichcast
-    prop1.datum = args.Datum.upper()
-    prop1.model_source = get_model_source(args.OFS)
-    prop1.ofsfiletype = args.FileType
-    prop1.horizonskill = args.Horizon_Skill
-    prop1.forecast_hr = args.Forecast_Hr
-    prop1.var_list = args.Var_Selection
-    prop1.user_input_location = args.User_Input
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    model_properties, get_node_ofs, get_model_source = _load()
 
-    # Switch default datum if GLOFS
-    if 'l' in prop1.ofs[0] and prop1.datum == 'MLLW':
-        prop1.datum = 'IGLD85'
+    prop1 = model_properties.ModelProperties.from_namespace(args)
+    prop1.model_source = get_model_source(prop1.ofs)
 
     get_node_ofs(prop1, None)
+
+
+if __name__ == '__main__':
+    main()
@@ -23,6 +23,7 @@ import argparse
 import logging
 import logging.config
 import os
+import shutil
 import sys
 import urllib.request
 from collections import Counter
@@ -38,6 +39,8 @@ import xarray as xr
 from ofs_skill.model_processing import model_properties
 from ofs_skill.obs_retrieval import utils
 
+TIMEOUT_SEC = 60  # per-read download timeout in seconds
+
 
 def hours_range(start_date, end_date):
     """
@@ -92,6 +95,27 @@ def list_of_urls_glsea(hours_range1, logger, config_file=None):
     return url_list, url_list_backup
 
 
+def _download_file(url, dest):
+    """
+    Stream ``url`` into ``dest`` in 1 MiB reads.
+
+    urlretrieve copies in 8 KiB blocks; larger reads mean far fewer
+    read/write calls per file. The body goes to a ``.part`` file that is
+    renamed once complete, and removed if the download fails, so a failed
+    download never leaves a truncated file behind.
+    """
+    partial = dest + '.part'
+    try:
+        with urllib.request.urlopen(url, timeout=TIMEOUT_SEC) as response, \
+                open(partial, 'wb') as out:
+            shutil.copyfileobj(response, out, length=1 << 20)
+        os.replace(partial, dest)
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+
+
 def get_sat(list_of_urls1, list_of_urls2, obs2d_dir, logger):
     """
     This function gets the GLSEA analysiss from API and appends
@@ -102,7 +126,7 @@ def get_sat(list_of_urls1, list_of_urls2, obs2d_dir, logger):
     # First try the main Thredds data source
     try:
         logger.info('Try GLSEA Thredds download...')
-        urllib.request.urlretrieve(
+        _download_file(
             list_of_urls1[0], obs2d_dir + r'/' +\
                 f'{list_of_urls1[0]}'.split('/')[-1]
             )
@@ -117,7 +141,7 @@ def get_sat(list_of_urls1, list_of_urls2, obs2d_dir, logger):
         try:
             logger.info(f'Downloading GLSEA satellite data: {sat_dat}')
             if not os.path.isfile(obs2d_dir+r'/'+f'{sat_dat}'.split('/')[-1]):
-                urllib.request.urlretrieve(
+                _download_file(
                     sat_dat, obs2d_dir + r'/' + f'{sat_dat}'.split('/')[-1]
                     )
         except (ValueError, HTTPError, Exception) as ex:
@@ -191,15 +215,18 @@ def masksat_by_ofs(sat_path, shape_file, prop):
     )
     poly = regionmask.Regions(list(shp_mask.geometry))
 
+    # One time step per dask chunk, so clipping and masking stream
+    # through the file instead of loading the whole GLSEA record
     sat_nc = xr.open_dataset(
         sat_path,
+        chunks={'time': 1},
         # engine='netcdf4'
     )
 
     sat_nc_slice = sat_nc.sel(lon=slice(minx, maxx), lat=slice(miny, maxy))
     mask_sat = poly.mask(sat_nc_slice.isel(time=0))
 
-    masked_sat = sat_nc.where(mask_sat == 0)
+    masked_sat = sat_nc_slice.where(mask_sat == 0)
 
     # Now mask 2D climatology dataset
     filename = os.path.join(prop.path,'conf','gl_2d_clim.npy')
@@ -381,10 +408,14 @@ def get_icecover_observations(prop, logger):
         shape_file = f'{prop.ofs_extents_path}/{prop.ofs}.shp'
         logger.info('Begin clipping satellite data for %s', prop.ofs)
         masked_sat,ice_clim = masksat_by_ofs(concated_sat[-1], shape_file, prop)
-        masked_sat.to_netcdf(
-            f'{prop.data_observations_2d_satellite_path}/{prop.ofs}_ice.nc',
-            mode='w'
-        )
+        clipped_path = (
+            f'{prop.data_observations_2d_satellite_path}/{prop.ofs}_ice.nc')
+        masked_sat.to_netcdf(clipped_path, mode='w')
+        # Hand back the clipped file, read into memory, rather than
+        # recomputing the masked dataset from the full GLSEA file. The file
+        # is closed here so a later call in the same run can overwrite it.
+        with xr.open_dataset(clipped_path) as clipped:
+            masked_sat = clipped.load()
         logger.info('Finished clipping satellite data for %s', prop.ofs)
     except ValueError as ex:
         error_message = f"""Error: {str(ex)}. Failed clipping sat data'."""
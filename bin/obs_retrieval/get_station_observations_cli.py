@@ -93,22 +93,41 @@ Revisions:
 
 """
 import argparse
-import socket
+import functools
 
-from ofs_skill.obs_retrieval.get_station_observations import get_station_observations
-from ofs_skill.model_processing import model_properties
+from bin.utils.cli_args import DATUMS, VARS, CsvAction
 
-# Import directly from module to avoid circular import
+STATION_OWNERS = frozenset({'co-ops', 'ndbc', 'usgs', 'chs', 'list'})
 
-# parse_arguments_to_list is now in utils module
 
-TIMEOUT_SEC = 120 # default API timeout in seconds
-socket.setdefaulttimeout(TIMEOUT_SEC)
+def _positive_int(value):
+    """argparse type for worker counts: an integer >= 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(
+            f'must be a positive integer, got {value!r}')
+    return number
 
 
-### Execution:
-if __name__ == '__main__':
+def _load():
+    """Import the retrieval stack on demand.
+
+    Deferred until after argument parsing so that ``-h`` and argument
+    errors return without loading pandas/shapely/searvey.
+    """
+    from ofs_skill.model_processing import model_properties
+    from ofs_skill.obs_retrieval.get_station_observations import (
+        get_station_observations,
+    )
+    return model_properties, get_station_observations
 
+
+@functools.cache
+def build_parser():
+    """Build the argument parser for this entry point."""
     # Parse (optional and required) command line arguments
     parser = argparse.ArgumentParser(
         prog='python write_obs_ctlfile.py',
@@ -134,6 +153,8 @@ if __name__ == '__main__':
         '-d',
         '--Datum',
         required=True,
+        type=str.upper,
+        choices=DATUMS,
         help="prop.datum: 'MHHW', 'MHW', 'MLW', 'MLLW', 'NAVD88', 'LWD', "
         "'IGLD85', 'xgeoid20b'",
     )
@@ -141,11 +162,15 @@ if __name__ == '__main__':
         '-so',
         '--Station_Owner',
         required=False,
+        action=CsvAction,
+        allowed=STATION_OWNERS,
         help="'CO-OPS', 'NDBC', 'USGS', 'CHS'", )
     parser.add_argument(
         '-vs',
         '--Var_Selection',
         required=False,
+        action=CsvAction,
+        allowed=VARS,
         help='Which variables do you want to skill assess? Options are: '
             'water_level, water_temperature, salinity, and currents. Choose '
             'any combination. Default (no argument) is all variables.')
@@ -156,33 +181,42 @@ if __name__ == '__main__':
         help='Optional path to a CSV that pins which CO-OPS ADCP bins are '
              'processed and/or overrides their depth/orientation. Columns: '
              'station_id,bin,depth,orientation,name. See the wiki: '
-             'https://github.com/NOAA-CO-OPS/dev-Next-Gen-NOS-OFS-Skill-Assessment/wiki/CO%E2%80%90OPS-ADCP-current-processing')
+             'https://github.com/NOAA-CO-OPS/dev-Next-Gen-NOS-OFS-Skill-Assessment/wiki/CO%%E2%%80%%90OPS-ADCP-current-processing')
+    parser.add_argument(
+        '-j',
+        '--Jobs',
+        required=False,
+        type=_positive_int,
+        help='Maximum concurrent station downloads per data source. '
+             'Default: the obs_*_workers counts in the [parallelization] '
+             'section of the configuration file.')
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore cached OFS extent geometry and re-read the shapefile '
+             'if the station inventory has to be rebuilt.')
     parser.add_argument(
         '-c', '--config',
         help='Path to configuration file (default: conf/ofs_dps.conf)')
+    return parser
+
 
-    args = parser.parse_args()
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    model_properties, get_station_observations = _load()
 
-    prop1 = model_properties.ModelProperties()
-    prop1.ofs = args.OFS.lower()
-    prop1.path = args.Path
-    prop1.config_file = args.config
-    prop1.start_date_full = args.StartDate_full
-    prop1.end_date_full = args.EndDate_full
-    prop1.datum = args.Datum.upper()
-    prop1.currents_bins_csv = args.Currents_Bins_Csv
+    prop1 = model_properties.ModelProperties.from_namespace(args)
+    prop1.use_cache = not args.no_cache
 
-    # Make all station owners default, unless user specifies station owners
+    # Default to all station owners and variables unless user specifies
     if args.Station_Owner is None:
         prop1.stationowner = 'co-ops,ndbc,usgs,chs'
-    elif args.Station_Owner is not None:
-        prop1.stationowner = args.Station_Owner.lower()
-
-    #Handle variable selection
     if args.Var_Selection is None:
-        # Default: include all vars
         prop1.var_list = 'water_level,water_temperature,salinity,currents'
-    elif args.Var_Selection is not None:
-        prop1.var_list = args.Var_Selection.lower()
 
     get_station_observations(prop1, None)
+
+
+### Execution:
+if __name__ == '__main__':
+    main()
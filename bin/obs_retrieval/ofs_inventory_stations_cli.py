@@ -122,6 +122,10 @@ if __name__ == '__main__':
         required=False,
         default = 'co-ops,ndbc,usgs,chs',
         help="'CO-OPS','NDBC','USGS', 'CHS'", )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore cached OFS extent geometry and re-read the shapefile.')
     parser.add_argument(
         '-c', '--config',
         help='Path to configuration file (default: conf/ofs_dps.conf)')
@@ -135,4 +139,5 @@ if __name__ == '__main__':
         args.Path,
         args.Station_Owner.lower(),
         None,
-        config_file=args.config)
+        config_file=args.config,
+        use_cache=not args.no_cache)
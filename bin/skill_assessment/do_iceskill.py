@@ -78,16 +78,17 @@ import logging.config
 import os
 import sys
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
 from pathlib import Path
 
+import dask
+import dask.array as da
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import scipy.interpolate as interp
 from mpl_toolkits.basemap import Basemap
 from numpy import isnan
-from sklearn.metrics import confusion_matrix
 
 from bin.model_processing import get_icecover_model
 from bin.obs_retrieval import get_icecover_observations
@@ -97,64 +98,18 @@ from ofs_skill.model_processing import (
     model_source,
 )
 from ofs_skill.obs_retrieval import find_ofs_ice_stations, utils
-from ofs_skill.skill_assessment import nos_metrics
+from ofs_skill.skill_assessment.do_iceskill import (
+    critical_success_index,
+    extent_contingency,
+    ice_cover_stats,
+    iceonoff,
+    nan_time_sums,
+    nearest_index_map,
+    pair_days_index,
+)
 from ofs_skill.visualization import make_ice_boxplots, make_ice_map
 
 
-def make_2d_mask(array_to_mask, conditional_array, threshold):
-    '''
-    '''
-    if conditional_array is not None:
-        array_to_mask[conditional_array < threshold] = np.nan
-    else:
-        array_to_mask[array_to_mask < threshold] = np.nan
-    return array_to_mask
-
-
-def iceonoff(time_all_dt, meanicecover, logger):
-    '''
-    Finds and returns ice onset and thaw dates for ice conc
-    time series. Returns 'None' if dates cannot be found.
-    '''
-    counter = 0
-    iceon = None
-    iceoff = None
-    # Find ice onset date
-    for i in range(len(time_all_dt)):
-        if meanicecover[i] >= 10:
-            counter = counter + 1
-        else:
-            counter = 0
-        if counter == 5:
-            iceon = time_all_dt[i]
-            logger.info('Ice onset date found!')
-            break
-    if iceon is None:
-        logger.info('Ice onset date not found!')
-    # Find ice thaw date
-    try:
-        logger.info('Trying ice thaw enumerate...')
-        idx = len(meanicecover) - next(
-            i for i, val in
-            enumerate(reversed(meanicecover), 1)
-            if val >= 10
-        )
-        logger.info('Completed ice thaw enumerate!')
-        if (
-            len([idx]) > 0
-            and (len(meanicecover)-1)-idx >= 5
-            and sum(np.isnan(meanicecover[idx:])) <= 2
-        ):
-            iceoff = time_all_dt[idx+5]
-            logger.info('Ice thaw date found!')
-        else:
-            logger.info('Ice thaw date not found!')
-    except StopIteration:
-        logger.error('StopIteration exception: ice thaw date not found!')
-    logger.info('Completed ice onset/thaw date-finding, return to main...')
-    return iceon, iceoff
-
-
 def ice_climatology(prop, time_all_dt, ice_clim):
     '''
     Handles loading and parsing 1D and 2D Great Lakes ice
@@ -166,18 +121,13 @@ def ice_climatology(prop, time_all_dt, ice_clim):
         df[['Year', 'Month', 'Day']],
     )
 
-    # Select dates
-    dateindex = []
-    for i in range(0, len(time_all_dt)):
-        tempindex = df.index[(
-            df['DateTime'].dt.month ==
-            time_all_dt[i].month
-        )
-            & (
-            df['DateTime'].dt.day ==
-            time_all_dt[i].day
-        )]
-        dateindex.append(tempindex[0])
+    days = pd.DatetimeIndex(time_all_dt)
+
+    # Select dates: first climatology row for each month-day
+    monthday = df['DateTime'].dt.strftime('%m-%d')
+    first_row = pd.Series(df.index, index=monthday)[
+        ~monthday.duplicated().to_numpy()]
+    dateindex = first_row.loc[days.strftime('%m-%d')].to_numpy()
 
     dfsubset = df.iloc[dateindex]
     icecover_hist = dfsubset[prop.ofs.removesuffix('2')].to_numpy()
@@ -190,20 +140,12 @@ def ice_climatology(prop, time_all_dt, ice_clim):
     clim_dates = pd.read_csv(filename)
     uniq = clim_dates['unique_dates'].tolist()
 
-    # Get climatology days that correspond to time_all_dt
-    slices = []
-    for i in range(0, len(time_all_dt)):
-        datesstr = str(time_all_dt[i].month) + '-' +\
-            str(time_all_dt[i].day)
-        for j in range(0, len(uniq)):
-            if datesstr == uniq[j]:
-                slices.append(np.array(ice_clim[j, :, :]))
-                # print(datesstr[i])
-    if slices is not None:
-        if len(time_all_dt) == len(slices):
-            icecover_hist_2d = np.stack(slices)
-        elif len(time_all_dt) != len(slices):
-            icecover_hist_2d = []
+    # Get climatology days that correspond to time_all_dt ('m-d' labels,
+    # -1 where a day has no climatology)
+    idxs = pd.Index(uniq).get_indexer(
+        days.month.astype(str) + '-' + days.day.astype(str))
+    if (idxs >= 0).all():
+        icecover_hist_2d = np.asarray(ice_clim[idxs, :, :], dtype=np.float32)
     else:
         icecover_hist_2d = []
 
@@ -218,39 +160,23 @@ def pair_ice(
     Pairs the observed and modeled ice conc time series, and
     makes sure time is correct between time, obs, and mod
     '''
-    time_all = []
-    time_all_dt = []
-    icecover_o_pair = []
-    icecover_m_pair = []
-    for j in range(0, len(time_o)):
-        my_obs_date = pd.to_datetime(time_o[j])
-
-        if prop.ice_dt == 'daily':
-            time_all.append(my_obs_date)
-            time_all_dt.append(
-                datetime.strptime(str(my_obs_date), '%Y-%m-%d %H:%M:%S').date())
-            icecover_o_pair.append(np.array(icecover_o[j][:][:]))
-            try:
-                icecover_m_pair.append(np.array(icecover_m[j][:]))
-            except IndexError:
-                logger.error('Model and GLSEA ice arrays are different sizes!')
-        if prop.ice_dt == 'hourly':
-            for i in range(0, len(time_m)):
-                my_mod_date = pd.to_datetime(time_m[i])
-                if (
-                    my_mod_date.day == my_obs_date.day
-                    and my_mod_date.year == my_obs_date.year
-                    and my_mod_date.month == my_obs_date.month
-                ):
-                    time_all.append(my_mod_date)
-                    time_all_dt.append(
-                        datetime.strptime(str(my_mod_date),
-                            '%Y-%m-%d %H:%M:%S').date())
-                    icecover_o_pair.append(np.array(icecover_o[j][:][:]))
-                    icecover_m_pair.append(np.array(icecover_m[i][:]))
-
-    icecover_o_pair = np.stack(icecover_o_pair)
-    icecover_m_pair = np.stack(icecover_m_pair)
+    if prop.ice_dt == 'daily':
+        # GLSEA and model output are both daily, so they pair one-to-one
+        times = pd.to_datetime(np.asarray(time_o))
+        icecover_o_pair = np.asarray(icecover_o)
+        if len(icecover_m) < len(time_o):
+            logger.error('Model and GLSEA ice arrays are different sizes!')
+        icecover_m_pair = np.asarray(icecover_m)[:len(time_o)]
+    elif prop.ice_dt == 'hourly':
+        # Join model hours to GLSEA days in one pass instead of comparing
+        # every model time to every GLSEA time
+        o_idx, m_idx = pair_days_index(time_o, time_m)
+        times = pd.to_datetime(np.asarray(time_m))[m_idx]
+        icecover_o_pair = np.asarray(icecover_o)[o_idx]
+        icecover_m_pair = np.asarray(icecover_m)[m_idx]
+    time_all = list(times)
+    time_all_dt = list(times.date)
+
     # Load climatology
     icecover_hist = None
     icecover_hist_2d = None
@@ -490,6 +416,8 @@ def do_iceskill(prop, logger):
         prop.dailyavg = False
 
     ########################################################
+    # Parsed GLSEA observations, keyed by (start date, end date)
+    glsea_cache = {}
     # Loop through whichcasts --> GO!
     for cast in prop.whichcasts:
         prop.whichcast = cast.lower()
@@ -532,30 +460,45 @@ def do_iceskill(prop, logger):
                     )
                     sys.exit(-1)
     # -------------------------------------------------------------------------
-        # Download, concatenate, and mask/clip satellite and 2D climatology
-        obsice, ice_clim = get_icecover_observations.get_icecover_observations(
-            prop, logger,
-        )
-        logger.info('Grabbed ice cover observations')
+        # Download, concatenate, and mask/clip satellite and 2D climatology.
+        # GLSEA only depends on the date range, so casts that share one
+        # (e.g. nowcast and forecast_a) reuse the parsed observations.
+        glsea_key = (prop.start_date_full, prop.end_date_full)
+        if glsea_key not in glsea_cache:
+            obsice, ice_clim = \
+                get_icecover_observations.get_icecover_observations(
+                    prop, logger,
+                )
+            logger.info('Grabbed ice cover observations')
+            # -- Read lat, lon and ice cover from GLSEA netCDF file
+            lon_o = np.asarray(obsice.variables['lon'][:])
+            lat_o = np.asarray(obsice.variables['lat'][:])
+            # Ice concentration is a percentage with ~1% resolution, so
+            # float32 is plenty and halves the memory every daily pass
+            # touches
+            icecover_o = \
+                obsice['ice_concentration'].astype(np.float32).to_numpy()
+            # Shared between casts, so make sure nothing edits it in place
+            icecover_o.setflags(write=False)
+            time_o = np.asarray(obsice.variables['time'][:])
+            # Broadcast lat & lon to the (lat, lon) grid as read-only views
+            # rather than tiled copies
+            lon_o, lat_o = np.broadcast_arrays(lon_o[np.newaxis, :],
+                                               lat_o[:, np.newaxis])
+            glsea_cache[glsea_key] = (
+                lon_o, lat_o, icecover_o, time_o, ice_clim,
+            )
+            logger.info('GLSEA parsing complete')
+        else:
+            logger.info('Reusing GLSEA observations for %s', prop.whichcast)
+        lon_o, lat_o, icecover_o, time_o, ice_clim = glsea_cache[glsea_key]
         # Concatenate existing model output
         icecover_m, lon_m, lat_m, time_m = get_icecover_model.\
         get_icecover_model(prop, logger)
+        icecover_m = np.asarray(icecover_m, dtype=np.float32)
         logger.info('Grabbed ice cover model output')
     # -------------------------------------------------------------------------
 
-        # -- Read lat, lon and ice cover from GLSEA netCDF file (observations)
-        lon_o = np.asarray(obsice.variables['lon'][:])
-        lat_o = np.asarray(obsice.variables['lat'][:])
-        icecover_o = np.asarray(obsice.variables['ice_concentration'][:, :, :])
-        time_o = np.asarray(obsice.variables['time'][:])
-        # Tile lat & lon into arrays
-        latsize = np.size(lat_o)
-        lonsize = np.size(lon_o)
-        lon_o = np.tile(lon_o, (latsize, 1))
-        lat_o = np.tile(lat_o, (lonsize, 1))
-        lat_o = np.transpose(lat_o)
-        logger.info('GLSEA parsing complete')
-
         # First check time arrays for size compatibility
         set_o = set(time_o)
         set_m = set(time_m)
@@ -593,181 +536,163 @@ def do_iceskill(prop, logger):
     # -------------------------------------------------------------------------
         # ---> Let's do some statistics now, ok? ok.
 
-        # -- 1D obs & model statistics through time
+        # -- 1D obs & model statistics through time, one preallocated
+        # value per time step
         ice_1d_stats = {
-            'mod_meanicecover': [],
-            'mod_stdmic': [],
-            'mod_extent': [],
-            'obs_meanicecover': [],
-            'obs_stdmic': [],
-            'obs_extent': [],
-            'extent_error': [],
-            'r_all': [],
-            'rmse_either': [],
-            'rmse_all': [],
-            'skill_score': [],
-            'csi_all': [],
-            'csi_misses': [],
-            'csi_falsealarms': [],
+            key: np.full(len(time_all), np.nan) for key in (
+                'mod_meanicecover',
+                'mod_stdmic',
+                'mod_extent',
+                'obs_meanicecover',
+                'obs_stdmic',
+                'obs_extent',
+                'extent_error',
+                'r_all',
+                'rmse_either',
+                'rmse_all',
+                'skill_score',
+                'csi_all',
+                'csi_misses',
+                'csi_falsealarms',
+            )
         }
 
-        # -- 2D statistics through time
+        # -- 2D statistics through time, one preallocated float32
+        # (time, lat, lon) block per field
+        grid_shape = (len(time_all),) + np.shape(icecover_o)[1:]
         ice_2d_stats = {
-            'obsmoddiff_all': [],
-            'icecover_m_interp_all': [],
-            'obs_all': [],
-            'mod_all': [],
-            'obs_extent_map_all': [],
-            'mod_extent_map_all': [],
-            'overlap_map_all': [],
-            'obs_icedays_all': [],
-            'mod_icedays_all': [],
-            'falarm_map_all': [],
-            'miss_map_all': [],
-            'total_extent': [],
+            key: np.empty(grid_shape, dtype=np.float32) for key in (
+                'obsmoddiff_all',
+                'obs_all',
+                'mod_all',
+            )
         }
 
-        # --- 2D masks, collect 'em all
+        # --- Number of days each cell is in the observed/modeled ice
+        # extent, in either, in both (hits), in the model only (false
+        # alarms) and in the observations only (misses). The daily binary
+        # extent maps are only ever counted over time, so each block of
+        # days adds its counts here instead of keeping the maps.
+        ice_days = {
+            key: np.zeros(grid_shape[1:], dtype=np.int64) for key in (
+                'obs', 'mod', 'total', 'hits', 'falarms', 'misses',
+            )
+        }
+
+        # --- 2D masks: True where, on any day, obs and/or model exceed
+        # the threshold. Updated in place each day; turned into 0/NaN
+        # masks over the whole period after the last day.
         ice_2d_masks = {
-            'noiceobs_all': [],
-            'noicemod_all': [],
-            'noiceobs_ext_all': [],
-            'noicemod_ext_all': [],
-            'openwater_all': [],
-            'openwater_ext_all': [],
+            key: np.zeros(grid_shape[1:], dtype=bool) for key in (
+                'noiceobs_all',
+                'noicemod_all',
+                'noiceobs_ext_all',
+                'noicemod_ext_all',
+                'openwater_all',
+                'openwater_ext_all',
+            )
         }
 
         # Loop through each day and compare GLSEA and model output
         dayrange = ((time_all_dt[-1] - time_all_dt[0]).days)+1
-        for i in range(0, len(time_all)):
-            # print(i)
-            # percentcomplete = ((i+1)/dayrange)*100
-            logger.info(
-                '%s percent complete: %s',
-                prop.whichcast,
-                np.round((i/dayrange)*100, decimals=0),
+
+        # The grids don't change from day to day, so create the map,
+        # project both grids and find the nearest model node for each
+        # GLSEA cell once, before the loop.
+        ice_map = Basemap(
+            projection='merc',
+            resolution='i', area_thresh=1.0,
+            llcrnrlon=lon_o.min()-brdr,
+            llcrnrlat=lat_o.min()-brdr,
+            urcrnrlon=lon_o.max()+brdr,
+            urcrnrlat=lat_o.max()+brdr,
+        )
+        # Project GLSEA lon&lat onto xo&yo
+        xo, yo = ice_map(lon_o, lat_o)
+        # Project model lon&lat onto xm&ym
+        xm, ym = ice_map(lon_m, lat_m)
+        nearest_idx = nearest_index_map(xm, ym, xo, yo)
+
+        def _is_map_day(i):
+            return shouldimakemaps and (
+                (prop.ice_dt == 'hourly' and time_all[i].hour == 12)
+                or (
+                    prop.ice_dt == 'daily' and
+                    (time_all_dt[-1]-time_all_dt[i]).days <= dailyplotdays
+                )
             )
+
+        def _compare_days(days):
+            """
+            Compare GLSEA and model output for a block of days (a slice
+            of the time axis) as whole-block array operations. Writes the
+            block's slice of each ice_2d_stats field and returns its 1D
+            stats, "ever above threshold" masks and daily map data;
+            blocks are independent, so this runs in worker threads.
+            """
+            block = {'days': days}
             # Extract ice concentration info from GLSEA data
-            icecover_o_mask = np.array(icecover_o[i][:][:])
+            icecover_o_mask = ice_2d_stats['obs_all'][days]
+            icecover_o_mask[...] = icecover_o[days]
+            water = ~np.isnan(icecover_o_mask)
+            ndays = len(icecover_o_mask)
 
             # ---------INTERPOLATION-----------------
-            # Create a map
-            ice_map = Basemap(
-                projection='merc',
-                resolution='i', area_thresh=1.0,
-                llcrnrlon=lon_o.min()-brdr,
-                llcrnrlat=lat_o.min()-brdr,
-                urcrnrlon=lon_o.max()+brdr,
-                urcrnrlat=lat_o.max()+brdr,
-            )
-
-            # Project GLSEA lon&lat onto xo&yo
-            xo, yo = ice_map(lon_o, lat_o)
-            # Project model lon&lat onto xm&ym
-            xm, ym = ice_map(lon_m, lat_m)
-            # Interpolate model data to GLSEA grid
-            icecover_m_interp = interp.griddata(
-                (xm, ym), np.array(icecover_m[i, :]*100), (xo, yo),
-                method='nearest',
+            # Interpolate model data to GLSEA grid, gathering straight
+            # into the block's mod_all slice
+            icecover_m_mask = ice_2d_stats['mod_all'][days]
+            np.take(
+                np.asarray(icecover_m[days]).reshape(ndays, -1),
+                nearest_idx, axis=1,
+                out=icecover_m_mask.reshape(ndays, -1),
             )
-            ice_2d_stats['icecover_m_interp_all'].append(icecover_m_interp)
-            # Apply land mask to interpolated model grid
-            # (this is a sneaky way to do it!)
-            icecover_m_mask = icecover_m_interp - (icecover_o_mask*0)
+            icecover_m_mask *= 100
+            # Apply land mask to interpolated model grid (NaN over land)
+            np.putmask(icecover_m_mask, ~water, np.nan)
+            # Non-NaN cells of the masked model field, found once and
+            # shared by the stats below
+            mod_valid = ~isnan(icecover_m_mask)
             # -----------------------------------------
 
             # Statistics
 
             #Pre-processing
-            logger.info('Stats pre-processing -- make masks for open water...')
             # Mask where there is open water (both model AND
             # observation have no ice!!)
+            icecover_add = icecover_o_mask + icecover_m_mask
+            openwater_conc = icecover_add < stathresh
+            either_ice = ~openwater_conc
             # First do openwater mask for conc
-            icecover_add = np.array(icecover_o_mask + icecover_m_mask)
-            ice_2d_masks['openwater_all'].append(
-                make_2d_mask(
-                    np.array(icecover_o_mask)*0, icecover_add, stathresh,
-                ),
-            )
+            block['openwater_all'] = np.any(either_ice & water, axis=0)
             # Now do openwater mask for extent
-            ice_2d_masks['openwater_ext_all'].append(
-                make_2d_mask(
-                    np.array(icecover_o_mask)*0, icecover_add, threshold_exte,
-                ),
-            )
-            # Now remove ice conc below stathresh
-            icecover_o_mask2 = make_2d_mask(
-                np.array(icecover_o_mask),
-                icecover_add, stathresh,
-            )
-            icecover_m_mask2 = make_2d_mask(
-                np.array(icecover_m_mask),
-                icecover_add, stathresh,
-            )
+            block['openwater_ext_all'] = np.any(
+                ~(icecover_add < threshold_exte) & water, axis=0)
             # Mask where open water for observation only, ice conc
-            ice_2d_masks['noiceobs_all'].append(
-                make_2d_mask(
-                    np.array(icecover_o_mask), None, stathresh,
-                ),
-            )
+            block['noiceobs_all'] = np.any(
+                icecover_o_mask >= stathresh, axis=0)
             # Mask where open water for model only, ice conc
-            ice_2d_masks['noicemod_all'].append(
-                make_2d_mask(
-                    np.array(icecover_m_mask), None, stathresh,
-                ),
-            )
+            block['noicemod_all'] = np.any(
+                icecover_m_mask >= stathresh, axis=0)
             # Mask where open water for observation only, ice extent
-            ice_2d_masks['noiceobs_ext_all'].append(
-                make_2d_mask(
-                    np.array(icecover_o_mask), None, threshold_exte,
-                ),
-            )
+            block['noiceobs_ext_all'] = np.any(
+                icecover_o_mask >= threshold_exte, axis=0)
             # Mask where open water for model only, ice extent
-            ice_2d_masks['noicemod_ext_all'].append(
-                make_2d_mask(
-                    np.array(icecover_m_mask), None, threshold_exte,
-                ),
-            )
-
-            # Flatten arrays to calculate corr coefficient amd remove nans
-            obs_flat = icecover_o_mask2.flatten()
-            mod_flat = icecover_m_mask2.flatten()
-            badnans = ~np.logical_or(np.isnan(obs_flat), np.isnan(mod_flat))
-            obs_flat = np.array(np.compress(badnans, obs_flat))
-            mod_flat = np.array(np.compress(badnans, mod_flat))
+            block['noicemod_ext_all'] = np.any(
+                icecover_m_mask >= threshold_exte, axis=0)
 
-            # Calculate stats
-            logger.info('Calculating stats!')
             ###############################################
-            # Mean ice cover & standard deviation
-            ice_1d_stats['mod_meanicecover'].append(
-                np.nanmean(icecover_m_mask))
-            ice_1d_stats['mod_stdmic'].append(np.nanstd(icecover_m_mask))
-            ice_1d_stats['obs_meanicecover'].append(
-                np.nanmean(icecover_o_mask))
-            ice_1d_stats['obs_stdmic'].append(np.nanstd(icecover_o_mask))
-
-            # Percent ice cover (extent)
-            # MODEL
-            if (((icecover_m_mask >= 0).sum())*100) > 0:
-                ice_1d_stats['mod_extent'].append(
-                    ((
-                        icecover_m_mask >= threshold_exte
-                    ).sum() /
-                        (icecover_m_mask >= 0).sum())*100,
-                )
-            else:
-                ice_1d_stats['mod_extent'].append(0)
-            # OBS
-            if (((icecover_o_mask >= 0).sum())*100) > 0:
-                ice_1d_stats['obs_extent'].append(
-                    ((
-                        icecover_o_mask >= threshold_exte
-                    ).sum() /
-                        (icecover_o_mask >= 0).sum())*100,
-                )
-            else:
-                ice_1d_stats['obs_extent'].append(0)
+            # Mean ice cover, standard deviation and extent, one value per
+            # day of the block
+            (
+                block['obs_meanicecover'],
+                block['obs_stdmic'],
+                block['obs_extent'],
+            ) = ice_cover_stats(icecover_o_mask, threshold_exte)
+            (
+                block['mod_meanicecover'],
+                block['mod_stdmic'],
+                block['mod_extent'],
+            ) = ice_cover_stats(icecover_m_mask, threshold_exte)
 
             # Pearson's R where either model or observations have ice
             # if np.nansum(~isnan(icecover_m_mask2)) > 5 and np.nansum(
@@ -776,426 +701,423 @@ def do_iceskill(prop, logger):
 
             #     r_all.append(np.around(r_value1, decimals=3))
             # else:
-            ice_1d_stats['r_all'].append(np.nan)
-
-            # RMSE all pixels
-            if np.nansum(~isnan(icecover_m_mask)) >= 2 and np.nansum(
-                    ~isnan(icecover_o_mask),
-            ) >= 2:
-                ice_1d_stats['rmse_all'].append(
-                    nos_metrics.rmse(icecover_m_mask, icecover_o_mask),
+            block['r_all'] = np.full(ndays, np.nan)
+
+            # 2D -- diff between obs and mod, computed once: over all
+            # pixels, and with ice conc below stathresh removed
+            diff = icecover_m_mask - icecover_o_mask
+            obsmoddiff = ice_2d_stats['obsmoddiff_all'][days]
+            obsmoddiff.fill(np.nan)
+            np.copyto(obsmoddiff, diff, where=either_ice)
+
+            # Days with at least 2 valid cells in both fields, for all
+            # pixels and for pixels where either has ice
+            axes = (1, 2)
+            enough_all = (
+                (np.count_nonzero(mod_valid, axis=axes) >= 2)
+                & (np.count_nonzero(water, axis=axes) >= 2)
+            )
+            enough_either = (
+                (np.count_nonzero(either_ice & mod_valid, axis=axes) >= 2)
+                & (np.count_nonzero(either_ice & water, axis=axes) >= 2)
+            )
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', category=RuntimeWarning)
+                # RMSE all pixels
+                block['rmse_all'] = np.where(
+                    enough_all,
+                    np.sqrt(np.nanmean(diff**2, axis=axes)),
+                    np.nan,
                 )
-            else:
-                ice_1d_stats['rmse_all'].append(np.nan)
-
-            # RMSE ice where either model or observations
-            if np.nansum(~isnan(icecover_m_mask2)) >= 2 and np.nansum(
-                    ~isnan(icecover_o_mask2),
-            ) >= 2:
-                ice_1d_stats['rmse_either'].append(
-                    nos_metrics.rmse(icecover_m_mask2, icecover_o_mask2),
+                # RMSE ice where either model or observations
+                block['rmse_either'] = np.where(
+                    enough_either,
+                    np.sqrt(np.nanmean(obsmoddiff**2, axis=axes)),
+                    np.nan,
                 )
-            else:
-                ice_1d_stats['rmse_either'].append(np.nan)
-
-            # Skill score from Hebert et al. (2015)
-            # DOI: 10.1002/2015JC011283
-            # Do it in 2D
-            if np.nansum(~isnan(icecover_m_mask)) >= 2 and np.nansum(
-                    ~isnan(icecover_o_mask),
-            ) >= 2:
-                mse2_fO = ice_1d_stats['rmse_all'][i]**2
+                # Skill score from Hebert et al. (2015)
+                # DOI: 10.1002/2015JC011283
+                # Do it in 2D. Days without enough valid cells have a NaN
+                # RMSE, and so a NaN skill score.
+                mse2_fO = block['rmse_all']**2
                 mse2_fC = np.nanmean(
-                    (
-                        icecover_m_mask-icecover_hist_2d[i, :, :]
-                    )**2,
+                    (icecover_m_mask - icecover_hist_2d[days])**2, axis=axes,
                 )
-                if mse2_fC > 0:
-                    skillscore = 1 - (mse2_fO/mse2_fC)
-                else:
-                    skillscore = np.nan
-                ice_1d_stats['skill_score'].append(skillscore)
-            else:
-                ice_1d_stats['skill_score'].append(np.nan)
-
-            # Daily ice extent & total ice days
-            # Do observations
-            obs_extent_map = np.array(icecover_o_mask)
-            obs_extent_map[obs_extent_map < threshold_exte] = 0
-            obs_extent_map[obs_extent_map >= threshold_exte] = 1
-            ice_2d_stats['obs_extent_map_all'].append(obs_extent_map)
-            # Do model
-            mod_extent_map = np.array(icecover_m_mask)
-            mod_extent_map[mod_extent_map < threshold_exte] = 0
-            mod_extent_map[mod_extent_map >= threshold_exte] = 1
-            ice_2d_stats['mod_extent_map_all'].append(mod_extent_map)
-            # Collect obs OR model extent to get total ice days for either obs
-            # or model
-            total_extent = np.array(mod_extent_map + obs_extent_map)
-            total_extent[total_extent > 1] = 1
-            ice_2d_stats['total_extent'].append(total_extent)
-            # Do extent overlap (hits), misses, and false alarms
-            overlap_map = np.array(mod_extent_map + obs_extent_map)
-            overlap_map[overlap_map <= 1] = 0
-            overlap_map[overlap_map == 2] = 1
-            ice_2d_stats['overlap_map_all'].append(overlap_map)
-            csi_map = np.array(mod_extent_map - obs_extent_map)
-            falarm_map = np.array(csi_map)
-            falarm_map[falarm_map != 1] = 0
-            ice_2d_stats['falarm_map_all'].append(falarm_map)
-            miss_map = np.array(csi_map)
-            miss_map[miss_map != -1] = 0
-            miss_map = miss_map * -1
-            ice_2d_stats['miss_map_all'].append(miss_map)
-            # Do CSI
-            # hits: cm[1][1]
-            # false alarms: cm[0][1]
-            # misses: cm[1][0]
-            try:
-                cm = confusion_matrix(
-                    obs_extent_map[~isnan(obs_extent_map)].flatten(),
-                    mod_extent_map[~isnan(mod_extent_map)].flatten(),
-                    labels=[0, 1],
+            block['skill_score'] = np.full(ndays, np.nan)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                np.subtract(
+                    1, mse2_fO/mse2_fC, out=block['skill_score'],
+                    where=mse2_fC > 0,
                 )
-                if (cm[1][1] + cm[0][1] + cm[1][0]) > 0:
-                    csi = cm[1][1]/(cm[1][1] + cm[0][1] + cm[1][0])
-                    misses = cm[0][1]/(cm[1][1] + cm[0][1] + cm[1][0])
-                    falarms = cm[1][0]/(cm[1][1] + cm[0][1] + cm[1][0])
-                else:
-                    csi = 0
-                    misses = 0
-                    falarms = 0
-                ice_1d_stats['csi_all'].append(csi)
-                ice_1d_stats['csi_misses'].append(falarms)
-                ice_1d_stats['csi_falsealarms'].append(misses)
-                ice_1d_stats['extent_error'].append(falarms+misses)
-            except ValueError:
-                ice_1d_stats['csi_all'].append(np.nan)
-                ice_1d_stats['csi_misses'].append(np.nan)
-                ice_1d_stats['csi_falsealarms'].append(np.nan)
-                ice_1d_stats['extent_error'].append(np.nan)
-
-            # 2D -- diff between obs and mod
-            ice_2d_stats['obsmoddiff_all'].append(
-                icecover_m_mask2 -
-                icecover_o_mask2,
-            )
-            # Also keep model interpolated and observation arrays
-            ice_2d_stats['obs_all'].append(icecover_o_mask)
-            ice_2d_stats['mod_all'].append(icecover_m_mask)
 
-            # Make a map once each day, and save it
-            if shouldimakemaps:
-                if ((
-                    prop.ice_dt == 'hourly' and
-                    time_all[i].hour == 12
-                )
-                    or
-                    (
-                        prop.ice_dt == 'daily' and
-                        (time_all_dt[-1]-time_all_dt[i]).days <= dailyplotdays
-                )):
-                    # Static maps
-                    mapdata = np.stack(
+            # Running (lat, lon) sums of the diff for the period mean and
+            # RMSE maps, so the stacked diff need not be scanned again
+            (
+                block['diff_count'], block['diff_sum'], block['diff_sumsq'],
+            ) = nan_time_sums(obsmoddiff)
+
+            # Daily ice extent & total ice days, from one set of boolean
+            # extent masks shared by the maps and the CSI counts
+            ext = extent_contingency(
+                icecover_o_mask, icecover_m_mask, threshold_exte,
+                obs_valid=water, mod_valid=mod_valid,
+            )
+            # Count each cell's ice days over the block: obs, model, either
+            # (where both are valid), and overlap (hits), false alarms and
+            # misses
+            block['ice_days'] = {
+                'obs': np.count_nonzero(ext['obs_ice'], axis=0),
+                'mod': np.count_nonzero(ext['mod_ice'], axis=0),
+                'total': np.count_nonzero(
+                    (ext['obs_ice'] | ext['mod_ice']) & ext['mod_valid'],
+                    axis=0,
+                ),
+                'hits': np.count_nonzero(ext['hits'], axis=0),
+                'falarms': np.count_nonzero(ext['falarms'], axis=0),
+                'misses': np.count_nonzero(ext['misses'], axis=0),
+            }
+            # Do CSI, one value per day
+            csi, falarms, misses = critical_success_index(ext, axis=axes)
+            block['csi_all'] = csi
+            block['csi_misses'] = misses
+            block['csi_falsealarms'] = falarms
+            block['extent_error'] = falarms+misses
+
+            # Keep the arrays for the daily maps, with ice conc below
+            # stathresh removed
+            block['mapdata'] = {}
+            for i in range(days.start, days.stop):
+                if _is_map_day(i):
+                    d = i-days.start
+                    block['mapdata'][i] = np.stack(
                         (
-                            icecover_o_mask2, icecover_m_mask2,
-                            ice_2d_stats['obsmoddiff_all'][i],
+                            np.where(
+                                openwater_conc[d], np.nan, icecover_o_mask[d]),
+                            np.where(
+                                openwater_conc[d], np.nan, icecover_m_mask[d]),
+                            obsmoddiff[d],
                         ),
                     )
-                    make_ice_map.make_ice_map(
-                        prop, lon_o, lat_o, xo, yo, mapdata,
-                        time_all[i],
-                        'daily', logger,
-                    )
+            return block
 
-            # If last time step, do 2D stats and maps and plots etc.
-            #    over time period
-            ###
-            if i == len(time_all)-1 and dayrange >= 5:
-                # Keep these separate as numpy arrays
-                obsmoddiff_all = np.stack(ice_2d_stats['obsmoddiff_all'])
-                obs_all = np.stack(ice_2d_stats['obs_all'])
-                mod_all = np.stack(ice_2d_stats['mod_all'])
-
-                # Average 3D arrays through time to make 2D arrays
-                # First make new masks to mask out open water
-                # for obs and/or model averaged arrays.
-                # First do ice concentration masks
-                with warnings.catch_warnings():
-                    warnings.simplefilter('ignore', category=RuntimeWarning)
-                    ice_2d_masks['noiceobs_mask'] = np.array(
-                        np.nanmean(
-                            np.stack(ice_2d_masks['noiceobs_all']), axis=0,
-                        ),
-                    )*0
-                    ice_2d_masks['noicemod_mask'] = np.array(
-                        np.nanmean(
-                            np.stack(ice_2d_masks['noicemod_all']), axis=0,
-                        ),
-                    )*0
-                    ice_2d_masks['openwater_mask'] = np.array(
-                        np.nanmean(
-                            np.stack(ice_2d_masks['openwater_all']), axis=0,
-                        ),
-                    )  # Already multiplied by zero earlier
-                    # Now do ice extent masks
-                    ice_2d_masks['noiceobs_ext_mask'] = np.array(
-                        np.nanmean(
-                            np.stack(ice_2d_masks['noiceobs_ext_all']), axis=0,
-                        ),
-                    )*0
-                    ice_2d_masks['noicemod_ext_mask'] = np.array(
-                        np.nanmean(
-                            np.stack(ice_2d_masks['noicemod_ext_all']), axis=0,
-                        ),
-                    )*0
-                    ice_2d_masks['openwater_ext_mask'] = np.array(
-                        np.nanmean(
-                            np.stack(ice_2d_masks['openwater_ext_all']),axis=0,
-                        ),
-                    )  # Already multiplied by zero earlier
+        parallel_config = utils.get_parallel_config(
+            logger,
+            config_file=getattr(prop, 'config_file', None),
+        )
+        # Days per block: enough to amortize the per-call overhead while
+        # keeping the block's temporary (day, lat, lon) arrays small, but
+        # split short runs so that every worker gets a block
+        days_per_block = max(1, min(
+            16, -(-len(time_all) // parallel_config['skill_workers']),
+        ))
+        diff_sums = {
+            'diff_count': np.zeros(grid_shape[1:], dtype=np.int64),
+            'diff_sum': np.zeros(grid_shape[1:]),
+            'diff_sumsq': np.zeros(grid_shape[1:]),
+        }
+        # Time series of the OFS-wide stats, written a block of rows at a
+        # time as the days come in (same layout as DataFrame.to_csv)
+        stats_columns = {
+            'time_all_dt': time_all_dt,
+            'obs_meanicecover': ice_1d_stats['obs_meanicecover'],
+            'mod_meanicecover': ice_1d_stats['mod_meanicecover'],
+            'obs_stdmic': ice_1d_stats['obs_stdmic'],
+            'mod_stdmic': ice_1d_stats['mod_stdmic'],
+            'icecover_hist': (
+                icecover_hist if icecover_hist is not None
+                else [None]*len(time_all)
+            ),
+            'SS': ice_1d_stats['skill_score'],
+            'rmse_all': ice_1d_stats['rmse_all'],
+            'rmse_either': ice_1d_stats['rmse_either'],
+            'obs_extent': ice_1d_stats['obs_extent'],
+            'mod_extent': ice_1d_stats['mod_extent'],
+            'r_all': ice_1d_stats['r_all'],
+            'csi_all': ice_1d_stats['csi_all'],
+            'csi_falsealarms': ice_1d_stats['csi_falsealarms'],
+            'csi_misses': ice_1d_stats['csi_misses'],
+            'extent_error': ice_1d_stats['extent_error'],
+        }
 
-                    # Now proceed and do mean, min, and max diffs & means for
-                    # ice cover
-                    ice_2d_stats['obsmoddiff_allmean'] = np.array(
-                        np.nanmean(obsmoddiff_all, axis=0),
-                    )
-                    ice_2d_stats['obsmoddiff_allmax'] = np.array(
-                        np.nanmax(obsmoddiff_all, axis=0),
-                    )
-                    ice_2d_stats['obsmoddiff_allmin'] = np.array(
-                        np.nanmin(obsmoddiff_all, axis=0),
-                    )
-                    ice_2d_stats['obs_allmean'] = np.array(
-                        np.nanmean(obs_all, axis=0),
-                    )+ice_2d_masks['noiceobs_mask']
-                    ice_2d_stats['mod_allmean'] = np.array(
-                        np.nanmean(mod_all, axis=0),
-                    )+ice_2d_masks['noicemod_mask']
-                    # Do RMSE
-                    ice_2d_stats['rmse_2d'] = np.array(
-                        np.sqrt(
-                            np.nanmean(
-                                ((obsmoddiff_all)**2), axis=0,
-                            ),
-                        ),
-                    )
-                    ice_2d_stats['rmse_2d'] = ice_2d_stats['rmse_2d'] + \
-                        ice_2d_masks['openwater_mask']
-
-                    # Make ice extents & days of ice cover
-                    # NOTE! numpy nansum returns zeros when
-                    # summing across nans! Yargh! So we gotta re-apply
-                    # masks.
-                    # Do obs --
-                    obs_extent_map_allsum = np.array(
-                        np.nansum(ice_2d_stats['obs_extent_map_all'], axis=0),
-                    )
-                    ice_2d_stats['obs_icedays_all'] = np.array(
-                        obs_extent_map_allsum +
-                        (ice_2d_masks['noiceobs_ext_mask']),
-                    )
-                    obs_extent_map_allsum[obs_extent_map_allsum > 0] = 1
-                    ice_2d_stats['obs_extent_map_allsum'] = np.array(
-                        obs_extent_map_allsum +
-                        (ice_2d_masks['noiceobs_ext_mask']),
-                    )
-                    # Do model --
-                    mod_extent_map_allsum = np.array(
-                        np.nansum(ice_2d_stats['mod_extent_map_all'], axis=0),
-                    )
-                    ice_2d_stats['mod_icedays_all'] = np.array(
-                        mod_extent_map_allsum +
-                        (ice_2d_masks['noicemod_ext_mask']),
+        def _stats_row(i):
+            # Index, then the day's value in each column. Missing values
+            # (None, NaN) are left blank, as DataFrame.to_csv writes them
+            return [i] + [
+                '' if pd.isna(value) else value
+                for value in (column[i] for column in stats_columns.values())
+            ]
+
+        # Written to a temporary file that only replaces the real one once
+        # every block is done, so a failed run leaves no partial stats CSV
+        stats_path = (
+            f'{prop.data_skill_stats_path}/skill_{prop.ofs}_'
+            f'icestatstseries_{prop.whichcast}.csv'
+        )
+        stats_partial = stats_path + '.part'
+        try:
+            with open(stats_partial, 'w', newline='') as stats_csv, \
+                    ThreadPoolExecutor(
+                        max_workers=parallel_config['skill_workers'],
+                    ) as executor:
+                stats_writer = csv.writer(
+                    stats_csv, lineterminator=os.linesep,
+                )
+                stats_writer.writerow([''] + list(stats_columns))
+                futures = [
+                    executor.submit(
+                        _compare_days,
+                        slice(i, min(i+days_per_block, len(time_all))),
                     )
-                    mod_extent_map_allsum[mod_extent_map_allsum > 0] = 1
-                    ice_2d_stats['mod_extent_map_allsum'] = np.array(
-                        mod_extent_map_allsum +
-                        (ice_2d_masks['noicemod_ext_mask']),
+                    for i in range(0, len(time_all), days_per_block)
+                ]
+                # Collect in day order so the daily maps are made in order
+                for future in futures:
+                    block = future.result()
+                    days = block['days']
+                    for key in ice_2d_masks:
+                        ice_2d_masks[key] |= block[key]
+                    for key in diff_sums:
+                        diff_sums[key] += block[key]
+                    for key in ice_days:
+                        ice_days[key] += block['ice_days'][key]
+                    for key in ice_1d_stats:
+                        ice_1d_stats[key][days] = block[key]
+                    stats_writer.writerows(
+                        _stats_row(i) for i in range(days.start, days.stop)
                     )
-
-                    # Do Critical Success Index mapping -->
-                    # First, map hits
-                    csi_norm = np.array(
-                        np.nansum(
-                            ice_2d_stats['total_extent'],
-                            axis=0,
-                        ),
-                    )
-                    csi_norm = csi_norm + ice_2d_masks['openwater_ext_mask']
-                    ice_2d_stats['hit_map_allsum'] = np.array(
-                        np.nansum(ice_2d_stats['overlap_map_all'], axis=0) /
-                        csi_norm,
-                    )*100 + ice_2d_masks['openwater_ext_mask']
-                    ice_2d_stats['miss_map_allsum'] = np.array(
-                        np.nansum(ice_2d_stats['miss_map_all'], axis=0) /
-                        csi_norm,
-                    )*100 + ice_2d_masks['openwater_ext_mask']
-                    ice_2d_stats['falarm_map_allsum'] = np.array(
-                        np.nansum(
-                            ice_2d_stats['falarm_map_all'], axis=0,
-                        )/csi_norm,
-                    )*100 +\
-                        ice_2d_masks['openwater_ext_mask']
-
-                # Find ice-on and ice-off dates, if doing a season-long run
-                if time_all_dt[0].month == 11 or time_all_dt[0].month == 12:
                     logger.info(
-                        'Starting ice onset/thaw date-finding routine...')
-                    obs_iceon, obs_iceoff = iceonoff(
-                        time_all_dt,
-                        ice_1d_stats[
-                            'obs_meanicecover'
-                        ],
-                        logger,
-                    )
-                    mod_iceon, mod_iceoff = iceonoff(
-                        time_all_dt,
-                        ice_1d_stats[
-                            'mod_meanicecover'
-                        ],
-                        logger,
-                    )
-                    clim_iceon, clim_iceoff = iceonoff(
-                        time_all_dt, icecover_hist,
-                        logger,
-                    )
-                    logger.info('Completed ice onset/thaw! Back in main.')
-                    if mod_iceon is not None and obs_iceon is not None:
-                        iceondiff = (mod_iceon-obs_iceon).days
-                    else:
-                        iceondiff = None
-                    if mod_iceoff is not None and obs_iceoff is not None:
-                        iceoffdiff = (mod_iceoff-obs_iceoff).days
-                    else:
-                        iceoffdiff = None
-                    logger.info('Calculated ice onset/thaw error!')
-                    # Combine ice on/off dates and diff to format for pandas
-                    # table
-                    logger.info('Writing ice onset/thaw table...')
-                    iceonoffall = [
-                        [' ', 'Ice onset', 'Ice thaw'],
-                        ['Observed', str(obs_iceon), str(obs_iceoff)],
-                        ['Modeled', str(mod_iceon), str(mod_iceoff)],
-                        ['Climatology', str(clim_iceon), str(clim_iceoff)],
-                        [
-                            'Model-obs difference (days)', str(iceondiff),
-                            str(iceoffdiff),
-                        ],
-                    ]
-
-                    # Write to csv
-                    title = r'' +\
-                        f'{prop.data_skill_stats_path}/' +\
-                        f'skill_{prop.ofs}_iceonoff_{prop.whichcast}.csv'
-                    with open(title, 'w', newline='') as csvfile:
-                        writer = csv.writer(csvfile)
-                        # Write the header row (column labels)
-                        writer.writerow(iceonoffall[0])
-                        # Write the data rows
-                        for row in iceonoffall[1:]:
-                            writer.writerow(row)
-                    logger.info('Ice on/off table saved!')
-
-                # Make 2D stats maps
-                if shouldimakemaps:
-                    logger.info('Starting all stats maps...')
-                    # Map conc: mean model, mean obs, and rmse
-                    mapdata = np.stack(
-                        (
-                            ice_2d_stats['obs_allmean'],
-                            ice_2d_stats['mod_allmean'],
-                            ice_2d_stats['rmse_2d'],
-                        ),
-                    )
-                    make_ice_map.make_ice_map(
-                        prop, lon_o, lat_o, xo, yo, mapdata,
-                        time_all[i], 'rmse means', logger,
-                    )
-                    # Map extent: total ice days model,
-                    # ice days obs, ice distance
-                    mapdata = np.stack(
-                        (
-                            ice_2d_stats['obs_icedays_all'],
-                            ice_2d_stats['mod_icedays_all'],
-                        ),
-                    )
-                    make_ice_map.make_ice_map(
-                        prop, lon_o, lat_o, xo, yo, mapdata, time_all[i],
-                        'extents', logger,
-                    )
-                    # Map diff conc: mean diff, max diff,
-                    # min diff
-                    mapdata = np.stack(
-                        (
-                            ice_2d_stats['obsmoddiff_allmean'],
-                            ice_2d_stats['obsmoddiff_allmax'],
-                            ice_2d_stats['obsmoddiff_allmin'],
-                        ),
-                    )
-                    make_ice_map.make_ice_map(
-                        prop, lon_o, lat_o, xo, yo, mapdata,
-                        time_all[i], 'diff', logger,
-                    )
-                    # Map CSI metrics
-                    mapdata = np.stack(
-                        (
-                            ice_2d_stats['hit_map_allsum'],
-                            ice_2d_stats['falarm_map_allsum'],
-                            ice_2d_stats['miss_map_allsum'],
-                        ),
-                    )
-                    make_ice_map.make_ice_map(
-                        prop, lon_o, lat_o, xo, yo, mapdata,
-                        time_all[i], 'csi', logger,
+                        '%s percent complete: %s',
+                        prop.whichcast,
+                        np.round((days.stop/dayrange)*100, decimals=0),
                     )
-                    logger.info('All stats maps complete!')
-                if shouldimakeplots:
-                    logger.info('Starting histograms...')
-                    # ---HISTOGRAMS/PDFs-----------------------------------
-                    # Make distributions of errors
-                    # Do all RMSEs
-                    make_ice_boxplots.make_ice_boxplots(
-                        obs_all, mod_all,
-                        time_all_dt, prop, logger,
-                    )
-                    plt.close('all')
-                    logger.info('Box plots complete!')
-            elif i == len(time_all)-1 and dayrange < 5:
-                logger.info(
-                    'Day range is < 5, so no maps or cumulative stats!')
-
-        # Before plotting, make pandas dataframe with stats time series
-        logger.info('Compiling time series stats for table output...')
-        pd.DataFrame(
-            {
-                'time_all_dt': time_all_dt,
-                'obs_meanicecover': ice_1d_stats['obs_meanicecover'],
-                'mod_meanicecover': ice_1d_stats['mod_meanicecover'],
-                'obs_stdmic': ice_1d_stats['obs_stdmic'],
-                'mod_stdmic': ice_1d_stats['mod_stdmic'],
-                'icecover_hist': icecover_hist,
-                'SS': ice_1d_stats['skill_score'],
-                'rmse_all': ice_1d_stats['rmse_all'],
-                'rmse_either': ice_1d_stats['rmse_either'],
-                'obs_extent': ice_1d_stats['obs_extent'],
-                'mod_extent': ice_1d_stats['mod_extent'],
-                'r_all': ice_1d_stats['r_all'],
-                'csi_all': ice_1d_stats['csi_all'],
-                'csi_falsealarms': ice_1d_stats['csi_falsealarms'],
-                'csi_misses': ice_1d_stats['csi_misses'],
-                'extent_error': ice_1d_stats['extent_error'],
-            },
-        ).to_csv(
-            r'' + f'{prop.data_skill_stats_path}/'
-                  f'skill_{prop.ofs}_'
-            f'icestatstseries_{prop.whichcast}.csv',
-        )
 
+                    # Make a map once each day, and save it
+                    for i, mapdata in block['mapdata'].items():
+                        make_ice_map.make_ice_map(
+                            prop, lon_o, lat_o, xo, yo, mapdata,
+                            time_all[i],
+                            'daily', logger,
+                        )
+        except BaseException:
+            if os.path.exists(stats_partial):
+                os.remove(stats_partial)
+            raise
+        os.replace(stats_partial, stats_path)
         logger.info(
             'Time series of OFS-wide skill stats is created successfully.',
         )
 
+        # Do 2D stats and maps and plots etc. over time period
+        if dayrange >= 5:
+            obsmoddiff_all = ice_2d_stats['obsmoddiff_all']
+            obs_all = ice_2d_stats['obs_all']
+            mod_all = ice_2d_stats['mod_all']
+
+            # Turn the "ever above threshold" masks into 0/NaN masks
+            # to mask out open water for obs and/or model averaged
+            # arrays.
+            for key in (
+                'noiceobs', 'noicemod', 'openwater',
+                'noiceobs_ext', 'noicemod_ext', 'openwater_ext',
+            ):
+                ice_2d_masks[f'{key}_mask'] = np.where(
+                    ice_2d_masks[f'{key}_all'], 0., np.nan,
+                )
+            # Reduce the stacked (time, lat, lon) fields over time with
+            # one dask.compute, so the time chunks of every field are
+            # reduced in parallel and combined as a tree
+            def _lazy(cube):
+                return da.from_array(
+                    cube, chunks=(days_per_block,) + cube.shape[1:],
+                )
+
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', category=RuntimeWarning)
+                (
+                    obsmoddiff_max, obsmoddiff_min, obs_mean, mod_mean,
+                ) = dask.compute(
+                    da.nanmax(_lazy(obsmoddiff_all), axis=0),
+                    da.nanmin(_lazy(obsmoddiff_all), axis=0),
+                    da.nanmean(_lazy(obs_all), axis=0, dtype=np.float64),
+                    da.nanmean(_lazy(mod_all), axis=0, dtype=np.float64),
+                    scheduler='threads',
+                    num_workers=parallel_config['skill_workers'],
+                )
+
+                # Now proceed and do mean, min, and max diffs & means for
+                # ice cover. The diff mean and RMSE come from the sums
+                # accumulated block by block.
+                ice_2d_stats['obsmoddiff_allmean'] = \
+                    diff_sums['diff_sum'] / diff_sums['diff_count']
+                ice_2d_stats['obsmoddiff_allmax'] = obsmoddiff_max
+                ice_2d_stats['obsmoddiff_allmin'] = obsmoddiff_min
+                ice_2d_stats['obs_allmean'] = obs_mean + \
+                    ice_2d_masks['noiceobs_mask']
+                ice_2d_stats['mod_allmean'] = mod_mean + \
+                    ice_2d_masks['noicemod_mask']
+                # Do RMSE
+                ice_2d_stats['rmse_2d'] = np.sqrt(
+                    diff_sums['diff_sumsq'] / diff_sums['diff_count'],
+                ) + ice_2d_masks['openwater_mask']
+
+                # Make ice extents & days of ice cover
+                # NOTE! Counting days gives zeros over land and open
+                # water alike, so we gotta re-apply masks.
+                # Do obs --
+                ice_2d_stats['obs_icedays_all'] = ice_days['obs'] + \
+                    ice_2d_masks['noiceobs_ext_mask']
+                # Cells with any ice days are exactly those that were ever
+                # above the extent threshold
+                ice_2d_stats['obs_extent_map_allsum'] = np.where(
+                    ice_2d_masks['noiceobs_ext_all'], 1., np.nan,
+                )
+                # Do model --
+                ice_2d_stats['mod_icedays_all'] = ice_days['mod'] + \
+                    ice_2d_masks['noicemod_ext_mask']
+                ice_2d_stats['mod_extent_map_allsum'] = np.where(
+                    ice_2d_masks['noicemod_ext_all'], 1., np.nan,
+                )
+
+                # Do Critical Success Index mapping -->
+                # Hit, false alarm and miss maps as percent of the days
+                # either has ice, normalized and masked in one expression
+                csi_norm = ice_days['total'] + \
+                    ice_2d_masks['openwater_ext_mask']
+                (
+                    ice_2d_stats['hit_map_allsum'],
+                    ice_2d_stats['falarm_map_allsum'],
+                    ice_2d_stats['miss_map_allsum'],
+                ) = np.stack((
+                    ice_days['hits'], ice_days['falarms'], ice_days['misses'],
+                ))/csi_norm*100 + ice_2d_masks['openwater_ext_mask']
+
+            # Find ice-on and ice-off dates, if doing a season-long run
+            if time_all_dt[0].month == 11 or time_all_dt[0].month == 12:
+                logger.info(
+                    'Starting ice onset/thaw date-finding routine...')
+                obs_iceon, obs_iceoff = iceonoff(
+                    time_all_dt,
+                    ice_1d_stats[
+                        'obs_meanicecover'
+                    ],
+                    logger,
+                )
+                mod_iceon, mod_iceoff = iceonoff(
+                    time_all_dt,
+                    ice_1d_stats[
+                        'mod_meanicecover'
+                    ],
+                    logger,
+                )
+                clim_iceon, clim_iceoff = iceonoff(
+                    time_all_dt, icecover_hist,
+                    logger,
+                )
+                logger.info('Completed ice onset/thaw! Back in main.')
+                if mod_iceon is not None and obs_iceon is not None:
+                    iceondiff = (mod_iceon-obs_iceon).days
+                else:
+                    iceondiff = None
+                if mod_iceoff is not None and obs_iceoff is not None:
+                    iceoffdiff = (mod_iceoff-obs_iceoff).days
+                else:
+                    iceoffdiff = None
+                logger.info('Calculated ice onset/thaw error!')
+                # Combine ice on/off dates and diff to format for pandas
+                # table
+                logger.info('Writing ice onset/thaw table...')
+                iceonoffall = [
+                    [' ', 'Ice onset', 'Ice thaw'],
+                    ['Observed', str(obs_iceon), str(obs_iceoff)],
+                    ['Modeled', str(mod_iceon), str(mod_iceoff)],
+                    ['Climatology', str(clim_iceon), str(clim_iceoff)],
+                    [
+                        'Model-obs difference (days)', str(iceondiff),
+                        str(iceoffdiff),
+                    ],
+                ]
+
+                # Write to csv
+                title = r'' +\
+                    f'{prop.data_skill_stats_path}/' +\
+                    f'skill_{prop.ofs}_iceonoff_{prop.whichcast}.csv'
+                with open(title, 'w', newline='') as csvfile:
+                    writer = csv.writer(csvfile)
+                    # Write the header row (column labels)
+                    writer.writerow(iceonoffall[0])
+                    # Write the data rows
+                    for row in iceonoffall[1:]:
+                        writer.writerow(row)
+                logger.info('Ice on/off table saved!')
+
+            # Make 2D stats maps
+            if shouldimakemaps:
+                logger.info('Starting all stats maps...')
+                # Map conc: mean model, mean obs, and rmse
+                mapdata = np.stack(
+                    (
+                        ice_2d_stats['obs_allmean'],
+                        ice_2d_stats['mod_allmean'],
+                        ice_2d_stats['rmse_2d'],
+                    ),
+                )
+                make_ice_map.make_ice_map(
+                    prop, lon_o, lat_o, xo, yo, mapdata,
+                    time_all[-1], 'rmse means', logger,
+                )
+                # Map extent: total ice days model,
+                # ice days obs, ice distance
+                mapdata = np.stack(
+                    (
+                        ice_2d_stats['obs_icedays_all'],
+                        ice_2d_stats['mod_icedays_all'],
+                    ),
+                )
+                make_ice_map.make_ice_map(
+                    prop, lon_o, lat_o, xo, yo, mapdata, time_all[-1],
+                    'extents', logger,
+                )
+                # Map diff conc: mean diff, max diff,
+                # min diff
+                mapdata = np.stack(
+                    (
+                        ice_2d_stats['obsmoddiff_allmean'],
+                        ice_2d_stats['obsmoddiff_allmax'],
+                        ice_2d_stats['obsmoddiff_allmin'],
+                    ),
+                )
+                make_ice_map.make_ice_map(
+                    prop, lon_o, lat_o, xo, yo, mapdata,
+                    time_all[-1], 'diff', logger,
+                )
+                # Map CSI metrics
+                mapdata = np.stack(
+                    (
+                        ice_2d_stats['hit_map_allsum'],
+                        ice_2d_stats['falarm_map_allsum'],
+                        ice_2d_stats['miss_map_allsum'],
+                    ),
+                )
+                make_ice_map.make_ice_map(
+                    prop, lon_o, lat_o, xo, yo, mapdata,
+                    time_all[-1], 'csi', logger,
+                )
+                logger.info('All stats maps complete!')
+            if shouldimakeplots:
+                logger.info('Starting histograms...')
+                # ---HISTOGRAMS/PDFs-----------------------------------
+                # Make distributions of errors
+                # Do all RMSEs
+                make_ice_boxplots.make_ice_boxplots(
+                    obs_all, mod_all,
+                    time_all_dt, prop, logger,
+                )
+                plt.close('all')
+                logger.info('Box plots complete!')
+        else:
+            logger.info(
+                'Day range is < 5, so no maps or cumulative stats!')
+
         # Switch date back to user-inputted start date if doing a season run
         if seasonrun == 'yes' and prop.whichcast == 'forecast_b':
             prop.start_date_full = prop.oldstartdate
@@ -0,0 +1,41 @@
+"""
+Argument parsing helpers shared by the station/model CLI entry points.
+
+Kept free of ``ofs_skill`` imports so that ``-h`` and argument errors in
+``get_node_cli.py`` and ``get_station_observations_cli.py`` return without
+loading the processing stack.
+"""
+import argparse
+
+# Values accepted by the station/model CLIs, checked at parse time.
+# Keep in sync with [datums] in ofs_dps.conf.
+DATUMS = ('MHW', 'MHHW', 'MLW', 'MLLW', 'NAVD88', 'XGEOID20B', 'IGLD85', 'LWD')
+VARS = frozenset({'water_level', 'water_temperature', 'salinity', 'currents'})
+
+
+def split_csv(value):
+    """Split a comma-separated argument into a lowercase tuple, tolerating
+    the bracket/space forms accepted by ``parse_arguments_to_list``."""
+    value = value.lower().replace('[', '').replace(']', '').replace(' ', '')
+    return tuple(value.split(','))
+
+
+class CsvAction(argparse.Action):
+    """Store a comma-separated option as a tuple, split once at parse time.
+
+    Pass ``allowed=<set>`` to reject unknown tokens as an argument error.
+    """
+
+    def __init__(self, option_strings, dest, allowed=None, **kwargs):
+        self.allowed = allowed
+        super().__init__(option_strings, dest, **kwargs)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        tokens = split_csv(values)
+        if self.allowed is not None:
+            unknown = [t for t in tokens if t not in self.allowed]
+            if unknown:
+                raise argparse.ArgumentError(
+                    self, f"invalid choice(s): {', '.join(unknown)} "
+                    f"(choose from {', '.join(sorted(self.allowed))})")
+        setattr(namespace, self.dest, tokens)
@@ -8,16 +8,15 @@ from __future__ import annotations
 import argparse
 import logging.config
 import os
+import re
 import socket
 import sys
 import time
-import urllib.request
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
-from urllib.error import HTTPError
 
-import numpy as np
+import requests
 
 from ofs_skill.model_processing import get_fcst_cycle, model_properties
 from ofs_skill.obs_retrieval import utils
@@ -26,6 +25,56 @@ from ofs_skill.obs_retrieval.utils import get_parallel_config
 TIMEOUT_SEC = 60  # default API timeout in seconds
 socket.setdefaulttimeout(TIMEOUT_SEC)
 
+# OFSs stored in per-day {ofs}.YYYYMMDD directories on the NODD, and the
+# STOFS-3D ones among them
+STOFS_3D_OFS = frozenset({'stofs_3d_atl', 'stofs_3d_pac'})
+STOFS_OFS = STOFS_3D_OFS | {'stofs_2d_glo'}
+
+# NODD file name templates, keyed on (file type, naming layout, whether the
+# date is before the 09/01/2024 name change). ``c`` is the first letter of
+# ``cast`` (forecast or nowcast); STOFS-2D-Global is only downloaded as the
+# combined water level ("cwl"), which is bias corrected for station files.
+# STOFS-3D field2d files are skipped.
+FILE_NAME_TEMPLATES = {
+    ('fields', 'nos', True): 'nos.{ofs}.fields.{c}{hour}.{date}.t{cycle}z.nc',
+    ('fields', 'nos', False): '{ofs}.t{cycle}z.{date}.fields.{c}{hour}.nc',
+    ('stations', 'nos', True): 'nos.{ofs}.stations.{cast}.{date}.t{cycle}z.nc',
+    ('stations', 'nos', False): '{ofs}.t{cycle}z.{date}.stations.{cast}.nc',
+    **dict.fromkeys(
+        (('fields', 'stofs_3d', True), ('fields', 'stofs_3d', False)),
+        '{ofs}.t{cycle}z.fields.{var}_{c}{hour0}_{hour}.nc',
+    ),
+    **dict.fromkeys(
+        (('fields', 'stofs_2d', True), ('fields', 'stofs_2d', False)),
+        '{ofs}.t{cycle}z.fields.cwl.nc',
+    ),
+    **dict.fromkeys(
+        (('stations', 'stofs_2d', True), ('stations', 'stofs_2d', False)),
+        '{ofs}.t{cycle}z.points.cwl.nc',
+    ),
+}
+STOFS_3D_FIELD_VARIABLES = (
+    'out2d', 'horizontalVelX', 'horizontalVelY',
+    'salinity', 'temperature', 'zCoordinates',
+)
+# End hours of the two 12-hour STOFS-3D nowcast files of each cycle
+STOFS_3D_NOWCAST_HOURS = ('12', '24')
+
+# Zero-padded '%m/%d/%y' dates, as written by dates_range
+_MDY_MATCH = re.compile(r'(\d{2})/(\d{2})/(\d{2})').fullmatch
+
+# Whichcasts this program can download files for
+VALID_WHICHCASTS = frozenset({'nowcast', 'forecast_a', 'forecast_b', 'all'})
+
+# Field file output time step (hours) of each OFS; others write every 3 hours
+FIELD_DT = {
+    **dict.fromkeys((
+        'cbofs', 'ciofs', 'creofs', 'dbofs', 'sfbofs', 'tbofs',
+        'leofs', 'lmhofs', 'loofs', 'loofs2', 'lsofs', 'sscofs', 'secofs',
+    ), 1),
+    **dict.fromkeys(('stofs_3d_atl', 'stofs_3d_pac'), 12),
+}
+
 
 def parameter_validation(argu_list, logger):
     """ Parameter validation """
@@ -81,19 +130,11 @@ def parameter_validation(argu_list, logger):
         logger.error(error_message)
         sys.exit(-1)
 
-    # whichcast validation
-    if (
-        'nowcast' not in whichcast and
-        'forecast_b' not in whichcast and
-        'forecast_a' not in whichcast and
-        'all' not in whichcast
-    ):
+    # whichcast validation: exactly one of the supported casts
+    if whichcast not in VALID_WHICHCASTS:
         error_message = f'Incorrect whichcast: {whichcast}! Exiting.'
         logger.error(error_message)
         sys.exit(-1)
-    if len([whichcast]) > 1:
-        logger.error('There is >1 whichcast! Program takes 1 whichcast only.')
-        sys.exit(-1)
 
 
 def get_ofs_cycle(prop, logger):
@@ -114,15 +155,7 @@ def get_ofs_cycle(prop, logger):
     fcstcycles = [f'{item:02}' for item in fcstcycles]
 
     # Get hour strings & field file time step (dt)
-    if prop.ofs in (
-        'cbofs', 'ciofs', 'creofs', 'dbofs', 'sfbofs', 'tbofs',
-        'leofs', 'lmhofs', 'loofs', 'loofs2', 'lsofs', 'sscofs', 'secofs'
-    ):
-        d_t = 1
-    elif prop.ofs in ('stofs_3d_atl', 'stofs_3d_pac'):
-        d_t = 12
-    else:
-        d_t = 3
+    d_t = FIELD_DT.get(prop.ofs, 3)
     if prop.whichcast == 'forecast_a':
         # Select one forecast cycle for forecast_a
         if prop.forecast_hr[:-1] in fcstcycles:
@@ -132,15 +165,29 @@ def get_ofs_cycle(prop, logger):
                 f'Model cycle incorrect for forecast_a and {prop.ofs}!',
             )
             sys.exit(-1)
-        hrstrings = np.linspace(d_t, fcstlength, int(fcstlength/d_t)).\
-            astype(int).astype(str)
+        hrstrings = [str(hour) for hour in range(d_t, fcstlength+1, d_t)]
     elif prop.whichcast in ['nowcast', 'forecast_b', 'hindcast']:
-        hrstrings = np.linspace(
-            d_t, int(24/len(fcstcycles)),
-            int(24/len(fcstcycles)/d_t),
-        ).astype(int).astype(str)
+        hrstrings = [
+            str(hour)
+            for hour in range(d_t, int(24/len(fcstcycles))+1, d_t)
+        ]
     return fcstcycles, hrstrings
 
+def _parse_mdy(datei):
+    """
+    Parse a '%m/%d/%y' date string from dates_range.
+
+    Same result as ``datetime.strptime(datei, '%m/%d/%y')``, including the
+    1969-2068 two-digit year window, without strptime's per-call format
+    handling. Strings not in that zero-padded form go through strptime.
+    """
+    match = _MDY_MATCH(datei)
+    if match is None:
+        return datetime.strptime(datei, '%m/%d/%y')
+    month, day, year = map(int, match.groups())
+    return datetime(year + (2000 if year < 69 else 1900), month, day)
+
+
 def dates_range(start_date, end_date, ofs, whichcast,logger):
     """
     This function uses the start and end date and returns
@@ -148,8 +195,6 @@ def dates_range(start_date, end_date, ofs, whichcast,logger):
     This is useful when we need to list all the folders (one per date)
     where the data to be contatenated is stored
     """
-    dates = []
-
     # For WCOFS nowcast, we need to look an extra day ahead
     if ofs == 'wcofs' and whichcast == 'nowcast':
         offset = 2
@@ -174,13 +219,10 @@ def dates_range(start_date, end_date, ofs, whichcast,logger):
             logger.error('Cannot convert %s to datetime object!',
                          start_date)
 
-    for i in range(
-        int((enddt - startdt).days) + offset,
-    ):
-        date = startdt + timedelta(days=i)
-        dates.append(date.strftime('%m/%d/%y'))
-
-    return dates
+    return [
+        (startdt + timedelta(days=i)).strftime('%m/%d/%y')
+        for i in range((enddt - startdt).days + offset)
+    ]
 
 
 def list_of_dir(prop, basepath, logger):
@@ -197,56 +239,63 @@ def list_of_dir(prop, basepath, logger):
     else:
         dates = dates_range(prop.start_date_full, prop.start_date_full,
                             prop.ofs, prop.whichcast, logger)
-    dates_len = len(dates)
     # After 12/31/24, directory structure changes! Now we need to sort
     # a dir list that might have two different formats.
     datethreshold = datetime.strptime('12/31/24', '%m/%d/%y')
     logger.info(f'Starting list of directories for {basepath}')
+    # Normalize the base path once; the date parts appended below are
+    # already clean POSIX path components
+    if prop.ofs in STOFS_OFS:
+        basepath = Path(f'{basepath}{prop.model_path}').as_posix()
+    else:
+        basepath = Path(basepath).as_posix()
     ####
-    for date_index in range(0, dates_len):
-        year = datetime.strptime(dates[date_index], '%m/%d/%y').year
-        month = datetime.strptime(dates[date_index], '%m/%d/%y').month
+    for datei in dates:
+        date = _parse_mdy(datei)
+        year, month, day = date.year, date.month, date.day
         # Add stofs directory structure
-        if prop.ofs in ['stofs_3d_atl', 'stofs_2d_glo', 'stofs_3d_pac']:
-            day = datetime.strptime(dates[date_index], '%m/%d/%y').day
-            model_dir = f'{basepath}{prop.model_path}/{prop.ofs}.{year}' +\
-                        f'{month:02}{day:02}'
+        if prop.ofs in STOFS_OFS:
+            model_dir = f'{basepath}/{prop.ofs}.{year}{month:02}{day:02}'
+        # Do old directory structure
+        elif date <= datethreshold:
+            model_dir = f'{basepath}/{year}{month:02}'
+        # Do new directory structure
         else:
-            # Do old directory structure
-            if (
-                datetime.strptime(dates[date_index], '%m/%d/%y') <=
-                datethreshold
-            ):
-                model_dir = f'{basepath}/{year}{month:02}'
-            # Do new directory structure
-            elif (
-                datetime.strptime(dates[date_index], '%m/%d/%y') >
-                datethreshold
-            ):
-                day = datetime.strptime(dates[date_index], '%m/%d/%y').day
-                model_dir = f'{basepath}/{year}/{month:02}/{day:02}'
-            # Whoops! I'm out
-            else:
-                logger.error("Check the date -- can't find model output dir!")
-                sys.exit(-1)
-        model_dir = Path(model_dir).as_posix()
+            model_dir = f'{basepath}/{year}/{month:02}/{day:02}'
         # if model_dir not in dir_list:
         dir_list.append(model_dir)
-        logger.info('Found model output dir: %s', model_dir)
+    logger.info('Found %d model output dirs, %s to %s', len(dir_list),
+                dir_list[0] if dir_list else None,
+                dir_list[-1] if dir_list else None)
     return dir_list, dates
 
 
 def create_directories(dir_list, logger):
-    """Creates directories from a list of directory names."""
-    for dir_name in dir_list:
+    """
+    Creates directories from a list of directory names. Each distinct
+    directory is made once, and the mkdir calls run in a few threads so
+    they overlap on network file systems.
+    """
+    dir_names = list(dict.fromkeys(dir_list))
+    if not dir_names:
+        return
+
+    def _make_dir(dir_name):
         try:
-            os.makedirs(dir_name)
-            logger.info(f"Directory '{dir_name}' created successfully.")
-        except FileExistsError:
-            logger.info(f"Directory '{dir_name}' already exists.")
+            os.makedirs(dir_name, exist_ok=True)
         except Exception as e_x:
             logger.error(f"Error creating directory '{dir_name}': {e_x}")
-            sys.exit(-1)
+            raise
+
+    try:
+        with ThreadPoolExecutor(
+            max_workers=min(len(dir_names), 8),
+        ) as executor:
+            list(executor.map(_make_dir, dir_names))
+    except Exception:
+        sys.exit(-1)
+    logger.info('Created or found %d model output directories.',
+                len(dir_names))
 
 
 def make_file_list(prop, dates, dir_list, logger):
@@ -255,195 +304,12 @@ def make_file_list(prop, dates, dir_list, logger):
     depending on file type (fields vs stations), OFS, and whichcast (nowcast,
     forecast_a, forecast_b)
     '''
-    # First get cycle & forecast horizon info for the OFS
-    fcstcycles, hrstrings = get_ofs_cycle(prop, logger)
-
-    # Date that file names change on the NODD
-    datechange = datetime.strptime('09/01/2024', '%m/%d/%Y')
-
-    # Set up empty variable to append to
-    file_list = []
-
-    # Logic order:
-    # forecast_a or forecast_b
-    #     fields
-    #         stofs_3d_atl or stofs_3d_pac
-    #         stof_2d_glo
-    #         other OFSs
-    #     stations
-    #         stofs_2d_glo
-    #         other OFSs
-    # nowcast
-    #     fields
-    #         stofs_3d_atl or stofs_3d_pac
-    #         stof_2d_glo
-    #         other OFSs
-    #     stations
-    #         stofs_2d_glo
-    #         other OFSs
-    # whichcast == all (not ready yet)
-    # Note no "hindcast" option.
-    # TODO: delete the above comment once merged. It's just here to note the change.
+    # Which kind of files, and how they are named on the NODD. Note no
+    # "hindcast" option.
     if prop.whichcast in ['forecast_b', 'forecast_a']:
-        if prop.ofsfiletype == 'fields':
-            if prop.ofs in ('stofs_3d_atl', 'stofs_3d_pac'):
-                for i, datei in enumerate(dates):
-                    datei = datetime.strptime(datei, '%m/%d/%y').strftime('%Y%m%d')
-                    for cycle in fcstcycles:
-                        for hrstring in hrstrings:
-                            hrstring = hrstring.zfill(3)
-                            hrstring0 = str(int(hrstring)-11).zfill(3)
-                            #skipping field2d files
-                            '''
-                            file_name = f'{prop.ofs}.t{cycle}z.field2d_' + \
-                                f'f{hrstring0}_{hrstring}.nc'
-                            file_name = os.path.join(dir_list[i], file_name). \
-                                replace('\\', '/')
-                            file_list.append(file_name)
-                            '''
-                            for var_name in {'out2d','horizontalVelX', 'horizontalVelY' ,
-                                            'salinity','temperature','zCoordinates'}:
-                                file_name = f'{prop.ofs}.t{cycle}z.fields.' + \
-                                    f'{var_name}_f{hrstring0}_{hrstring}.nc'
-                                file_name = os.path.join(dir_list[i], file_name). \
-                                    replace('\\', '/')
-                                file_list.append(file_name)
-            elif prop.ofs in ('stofs_2d_glo'):
-                for i, datei in enumerate(dates):
-                    for cycle in fcstcycles:
-                        # For now we're just doing the combined water level ("cwl").
-                        # Warnings and errors elsewhere should handle requests for
-                        # other variables.
-                        file_name = f'{prop.ofs}.t{cycle}z.fields.cwl.nc'
-                        file_list.append(
-                            os.path.join(dir_list[i], file_name).replace('\\', '/')
-                        )
-            else:
-                for i, datei in enumerate(dates):
-                    datei = datetime.strptime(datei, '%m/%d/%y').strftime('%Y%m%d')
-                    for cycle in fcstcycles:
-                        for hrstring in hrstrings:
-                            hrstring = hrstring.zfill(3)
-                            if datetime.strptime(datei, '%Y%m%d') < datechange:
-                                file_name = f'nos.{prop.ofs}.fields.f{hrstring}.' \
-                                    f'{datei}.t{cycle}z.nc'
-                                file_name = os.path.join(dir_list[i], file_name). \
-                                    replace('\\', '/')
-                                file_list.append(file_name)
-                            elif datetime.strptime(datei, '%Y%m%d') >= datechange:
-                                file_name = f'{prop.ofs}.t{cycle}z.{datei}.' +\
-                                    f'fields.f{hrstring}.nc'
-                                file_name = os.path.join(dir_list[i], file_name). \
-                                    replace('\\', '/')
-                                file_list.append(file_name)
-
-        elif prop.ofsfiletype == 'stations':
-            if prop.ofs in ('stofs_2d_glo'):
-                for i, datei in enumerate(dates):
-                    for cycle in fcstcycles:
-                        # For now we're just doing the combined water level ("cwl").
-                        # Note that this is bias corrected for station files.
-                        file_name = f'{prop.ofs}.t{cycle}z.points.cwl.nc'
-                        file_list.append(
-                            os.path.join(dir_list[i], file_name).replace('\\', '/')
-                        )
-            else:
-                for i, datei in enumerate(dates):
-                    datei = datetime.strptime(datei, '%m/%d/%y').strftime('%Y%m%d')
-                    for cycle in fcstcycles:
-                        if datetime.strptime(datei, '%Y%m%d') < datechange:
-                            file_name = f'nos.{prop.ofs}.stations.forecast.' \
-                                f'{datei}.t{cycle}z.nc'
-                            file_name = os.path.join(dir_list[i], file_name). \
-                                replace('\\', '/')
-                            file_list.append(file_name)
-                        elif datetime.strptime(datei, '%Y%m%d') >= datechange:
-                            file_name = f'{prop.ofs}.t{cycle}z.{datei}.stations.' \
-                                f'forecast.nc'
-                            file_name = os.path.join(dir_list[i], file_name). \
-                                replace('\\', '/')
-                            file_list.append(file_name)
-
+        cast = 'forecast'
     elif prop.whichcast == 'nowcast':
-        if prop.ofsfiletype == 'fields':
-            if prop.ofs in ('stofs_3d_atl', 'stofs_3d_pac'):
-                for i, datei in enumerate(dates):
-                    datei = datetime.strptime(datei, '%m/%d/%y').strftime('%Y%m%d')
-                    for cycle in fcstcycles:
-                        for hrstring in {'12', '24'}:
-                            hrstring = hrstring.zfill(3)
-                            hrstring0 = str(int(hrstring)-11).zfill(3)
-                            #skipping field2d files
-                            '''
-                            file_name = f'{prop.ofs}.t{cycle}z.field2d_n' + \
-                                f'{hrstring0}_{hrstring}.nc'
-                            file_name = os.path.join(dir_list[i], file_name). \
-                                replace('\\', '/')
-                            file_list.append(file_name)
-                            '''
-                            for var_name in {'out2d',
-                                'horizontalVelX', 'horizontalVelY',
-                                'salinity', 'temperature', 'zCoordinates',
-                            }:
-                                file_name = f'{prop.ofs}.t{cycle}z.fields.' + \
-                                    f'{var_name}_n{hrstring0}_{hrstring}.nc'
-                                file_name = os.path.join(dir_list[i], file_name). \
-                                    replace('\\', '/')
-                                file_list.append(file_name)
-            elif prop.ofs in ('stofs_2d_glo'):
-                for i, datei in enumerate(dates):
-                    for cycle in fcstcycles:
-                        # For now we're just doing the combined water level ("cwl").
-                        # Warnings and errors elsewhere should handle requests for
-                        # other variables.
-                        file_name = f'{prop.ofs}.t{cycle}z.fields.cwl.nc'
-                        file_list.append(
-                            os.path.join(dir_list[i], file_name).replace('\\', '/')
-                        )
-            else:
-                for i, datei in enumerate(dates):
-                    datei = datetime.strptime(datei, '%m/%d/%y').strftime('%Y%m%d')
-                    for cycle in fcstcycles:
-                        for hrstring in hrstrings:
-                            hrstring = hrstring.zfill(3)
-                            if datetime.strptime(datei, '%Y%m%d') < datechange:
-                                file_name = f'nos.{prop.ofs}.fields.n{hrstring}.' \
-                                    f'{datei}.t{cycle}z.nc'
-                                file_name = os.path.join(dir_list[i], file_name)
-                                file_list.append(file_name)
-                            elif datetime.strptime(datei, '%Y%m%d') >= datechange:
-                                file_name = f'{prop.ofs}.t{cycle}z.{datei}.' + \
-                                    f'fields.n{hrstring}.nc'
-                                file_name = os.path.join(dir_list[i], file_name). \
-                                    replace('\\', '/')
-                                file_list.append(file_name)
-
-        elif prop.ofsfiletype == 'stations':
-            if prop.ofs in ('stofs_2d_glo'):
-                for i, datei in enumerate(dates):
-                    for cycle in fcstcycles:
-                        # For now we're just doing the combined water level ("cwl").
-                        # Note that this is bias corrected for station files.
-                        file_name = f'{prop.ofs}.t{cycle}z.points.cwl.nc'
-                        file_list.append(
-                            os.path.join(dir_list[i], file_name).replace('\\', '/')
-                        )
-            else:
-                for i, datei in enumerate(dates):
-                    datei = datetime.strptime(datei, '%m/%d/%y').strftime('%Y%m%d')
-                    for cycle in fcstcycles:
-                        if datetime.strptime(datei, '%Y%m%d') < datechange:
-                            file_name = f'nos.{prop.ofs}.stations.nowcast.' \
-                                f'{datei}.t{cycle}z.nc'
-                            file_name = os.path.join(dir_list[i], file_name)
-                            file_list.append(file_name)
-                        elif datetime.strptime(datei, '%Y%m%d') >= datechange:
-                            file_name = f'{prop.ofs}.t{cycle}z.{datei}.stations.' \
-                                f'nowcast.nc'
-                            file_name = os.path.join(dir_list[i], file_name). \
-                                replace('\\', '/')
-                            file_list.append(file_name)
-
+        cast = 'nowcast'
     elif prop.whichcast == 'all':
         logger.error('This option is not ready yet!')
         sys.exit(-1)
@@ -451,10 +317,54 @@ def make_file_list(prop, dates, dir_list, logger):
         logger.error('Whichcast %s does not work in get_model_data!',
                      prop.whichcast)
         raise Exception
+    if prop.ofs == 'stofs_2d_glo':
+        layout = 'stofs_2d'
+    elif prop.ofs in STOFS_3D_OFS and prop.ofsfiletype == 'fields':
+        layout = 'stofs_3d'
+    else:
+        layout = 'nos'
 
-    logger.info('Created list of files for downloading. Here they are:')
-    for j in file_list:
-        logger.info(j)
+    # First get cycle & forecast horizon info for the OFS
+    fcstcycles, hrstrings = get_ofs_cycle(prop, logger)
+
+    # Date that file names change on the NODD
+    datechange = datetime.strptime('09/01/2024', '%m/%d/%Y')
+
+    # Forecast/nowcast hours (start, end) and variables in each file name
+    hours = [('', '')]
+    variables = ('',)
+    if prop.ofsfiletype == 'fields' and layout == 'nos':
+        hours = [('', hrstring.zfill(3)) for hrstring in hrstrings]
+    elif layout == 'stofs_3d':
+        # Each STOFS-3D file spans the 12 hours ending at its hour
+        if cast == 'nowcast':
+            hrstrings = STOFS_3D_NOWCAST_HOURS
+        hours = [
+            (str(int(hrstring)-11).zfill(3), hrstring.zfill(3))
+            for hrstring in hrstrings
+        ]
+        variables = STOFS_3D_FIELD_VARIABLES
+
+    # Set up empty variable to append to
+    file_list = []
+    for dir_name, datei in zip(dir_list, dates):
+        date = _parse_mdy(datei)
+        template = FILE_NAME_TEMPLATES[
+            (prop.ofsfiletype, layout, date < datechange)
+        ]
+        datei = date.strftime('%Y%m%d')
+        for cycle in fcstcycles:
+            for hour0, hour in hours:
+                for var_name in variables:
+                    file_name = template.format(
+                        ofs=prop.ofs, cycle=cycle, date=datei, cast=cast,
+                        c=cast[0], hour0=hour0, hour=hour, var=var_name,
+                    )
+                    file_list.append(f'{dir_name}/{file_name}')
+
+    logger.info('Created list of %d files for downloading.', len(file_list))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('Files to download:\n%s', '\n'.join(file_list))
 
     return file_list
 
@@ -467,7 +377,7 @@ def list_of_urls(file_list, prop, logger):
     # Retrieve urls from config file
     _conf = getattr(prop, 'config_file', None)
     url_params = utils.Utils(_conf).read_config_section('urls', logger)
-    if prop.ofs not in ('stofs_3d_atl', 'stofs_3d_pac', 'stofs_2d_glo'):
+    if prop.ofs not in STOFS_OFS:
         url_root = url_params['nodd_s3']
         url_list = []
         for file in file_list:
@@ -476,7 +386,7 @@ def list_of_urls(file_list, prop, logger):
                 f'{file}'
             )
             url_list.append(url)
-    elif prop.ofs in ('stofs_3d_atl', 'stofs_3d_pac'):
+    elif prop.ofs in STOFS_3D_OFS:
         url_root = url_params['nodd_s3_stofs3d']
         url_list = []
         for file in file_list:
@@ -500,22 +410,77 @@ def list_of_urls(file_list, prop, logger):
     return url_list
 
 
-def _download_single_file(mod_dat, savepath, ofs, logger):
+def _local_path(mod_dat, savepath, ofs):
+    """
+    Local save path of a NODD URL: the part after the bucket host, under
+    ``savepath``, with STOFS-3D bucket directories renamed to the OFS name.
+    """
+    local_path = (savepath + mod_dat.split('.com')[-1]).replace('//', '/')
+    if ofs in STOFS_3D_OFS:
+        local_path = local_path.replace('STOFS-3D-Atl/', 'stofs_3d_atl/')
+    return local_path
+
+
+def _fetch(url, local_path):
+    """
+    Stream one file from the NODD into ``local_path``.
+
+    Uses the shared pooled session, so repeated downloads from the same
+    bucket reuse one keep-alive connection per worker instead of opening a
+    new TCP/TLS connection for every file. The body is written to a
+    ``.part`` file that is renamed on success and removed on failure, so an
+    interrupted download is never mistaken for a complete file on the next
+    run.
+    """
+    partial_path = local_path + '.part'
+    try:
+        with utils.get_http_session().get(
+            url, stream=True, timeout=TIMEOUT_SEC,
+        ) as response:
+            response.raise_for_status()
+            with open(partial_path, 'wb') as file:
+                for chunk in response.iter_content(chunk_size=1 << 20):
+                    file.write(chunk)
+        os.replace(partial_path, local_path)
+    except BaseException:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+
+
+def _existing_files(paths):
+    """
+    Return the subset of ``paths`` that are already files on disk.
+
+    Lists each parent directory once with ``os.scandir`` instead of making
+    one ``stat`` call per path; missing directories hold no files.
+    """
+    existing = set()
+    for dir_name in {os.path.dirname(path) for path in paths}:
+        try:
+            with os.scandir(dir_name or '.') as entries:
+                existing.update(
+                    os.path.join(dir_name, entry.name)
+                    for entry in entries if entry.is_file()
+                )
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+    return existing.intersection(paths)
+
+
+def _download_single_file(mod_dat, local_path, logger):
     """
     Download a single model output file from the NODD.
 
-    Handles stofs vs non-stofs path construction, skips files that already
-    exist locally, and retries up to 3 times on HTTP 503 errors with
-    exponential backoff.
+    Retries up to 3 times on HTTP 503 errors with exponential backoff.
+    Files already on disk are filtered out beforehand by ``download_data``.
 
     Parameters
     ----------
     mod_dat : str
         Full URL of the file to download.
-    savepath : str
-        Local base path for saving downloaded files.
-    ofs : str
-        OFS name (e.g. 'cbofs', 'stofs_3d_atl').
+    local_path : str
+        Local file path to save the download to (see ``_local_path``).
     logger : logging.Logger
         Logger instance.
 
@@ -528,38 +493,19 @@ def _download_single_file(mod_dat, savepath, ofs, logger):
     backoff_seconds = 1
 
     try:
-        # Build the local file path based on OFS type
-        if ofs not in ('stofs_3d_atl', 'stofs_3d_pac', 'stofs_2d_global'):
-            local_path = (
-                savepath + mod_dat.split('.com')[-1]
-            ).replace('//', '/')
-        elif ofs in ('stofs_3d_atl', 'stofs_3d_pac'):
-            local_path = (
-                savepath + mod_dat.split('.com')[-1]
-            ).replace('//', '/').replace(
-                'STOFS-3D-Atl/', 'stofs_3d_atl/',
-            )
-        else:
-            # stofs_2d_global or other future stofs variants
-            local_path = (
-                savepath + mod_dat.split('.com')[-1]
-            ).replace('//', '/')
-
-        # Skip if file already exists
-        if os.path.isfile(local_path):
-            logger.info('File already exists, skipping: %s', local_path)
-            return local_path
-
         logger.info('Downloading model data: %s', mod_dat)
-        url = mod_dat.replace('\\', '/')
 
         # Retry loop for transient HTTP errors
         for attempt in range(max_retries):
             try:
-                urllib.request.urlretrieve(url, local_path)
+                _fetch(mod_dat, local_path)
                 return local_path
-            except HTTPError as e:
-                if e.code == 503 and attempt < max_retries - 1:
+            except requests.HTTPError as e:
+                if (
+                    e.response is not None
+                    and e.response.status_code == 503
+                    and attempt < max_retries - 1
+                ):
                     wait = backoff_seconds * (2 ** attempt)
                     logger.warning(
                         'HTTP 503 for %s, retrying in %ds (attempt %d/%d)',
@@ -585,35 +531,28 @@ def download_data(prop, list_of_urls1, dir_list, logger):
     # because the NODD S3 bucket doesn't contain it (unlike other models).
     if prop.ofs == 'stofs_2d_glo':
         savepath = savepath + 'stofs_2d_glo/'
+    # Work out every (URL, local path) pair once, up front. The URLs are
+    # built from POSIX directories and '/' joins, so need no slash fix-up.
+    jobs = [
+        (mod_dat, _local_path(mod_dat, savepath, prop.ofs))
+        for mod_dat in list_of_urls1
+    ]
     # First try the NODD and see if it's responding
     try:
         logger.info('Try NODD S3 download...')
-        if prop.ofs not in ('stofs_3d_atl', 'stofs_3d_pac', 'stofs_2d_glo'):
-            urllib.request.urlretrieve(
-                list_of_urls1[0].replace('\\', '/'), (
-                    savepath +
-                    list_of_urls1[0].split('.com')[-1]
-                ).replace('//', '/'),
-            )
-        elif prop.ofs in ('stofs_3d_atl', 'stofs_3d_pac'):
-            urllib.request.urlretrieve(
-                list_of_urls1[0].replace('\\', '/'), (
-                    savepath +
-                    list_of_urls1[0].split('.com')[-1]
-                ).replace('//', '/').replace('STOFS-3D-Atl/', 'stofs_3d_atl/'),
-            )
-        elif prop.ofs in ('stofs_2d_glo'):
-            urllib.request.urlretrieve(
-                list_of_urls1[0].replace('\\', '/'),
-                (savepath + list_of_urls1[0].split('.com')[-1]).replace('//', '/'),
-            )
+        _fetch(*jobs[0])
         logger.info('NODD is responding! Keep going -->')
-        list_of_urls_main = list_of_urls1
-    except (ValueError, HTTPError, Exception) as e_x:
+    except (ValueError, requests.RequestException, Exception) as e_x:
         logger.info("NODD S3 is not responding! I'm out.")
         logger.error(f'Exception: {e_x}')
         sys.exit(-1)
-        # list_of_urls = list_of_urls2
+
+    # Skip files that are already downloaded
+    existing = _existing_files([local_path for _, local_path in jobs])
+    if existing:
+        logger.info('%d of %d files already exist, skipping them.',
+                    len(existing), len(jobs))
+        jobs = [job for job in jobs if job[1] not in existing]
 
     # Download remaining files in parallel
     parallel_config = get_parallel_config(logger)
@@ -622,12 +561,19 @@ def download_data(prop, list_of_urls1, dir_list, logger):
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         futures = {
             executor.submit(
-                _download_single_file, mod_dat, savepath, prop.ofs, logger,
+                _download_single_file, mod_dat, local_path, logger,
             ): mod_dat
-            for mod_dat in list_of_urls_main
+            for mod_dat, local_path in jobs
         }
-        for future in as_completed(futures):
-            future.result()  # raise exceptions from worker if any
+        missing = [
+            futures[future] for future in as_completed(futures)
+            if future.result() is None  # raise exceptions from worker if any
+        ]
+    # Missing files (e.g. a STOFS variable not on the NODD) fail fast on
+    # their GET without retries; report them together
+    if missing:
+        logger.warning('%d of %d files could not be downloaded:\n%s',
+                       len(missing), len(jobs), '\n'.join(sorted(missing)))
 
 
 def get_model_data(prop, logger):
@@ -703,8 +649,12 @@ def get_model_data(prop, logger):
     # Directories, file lists, and URLs -- oh my
     # Get directory list for NODD
     dir_list_nodd, dates = list_of_dir(prop, prop.model_nodd_path, logger)
-    # Get directory list for saving
-    dir_list_save, dates = list_of_dir(prop, prop.model_save_path, logger)
+    # Get directory list for saving: the same dated directories under the
+    # local root (both roots are already POSIX-normalized above)
+    dir_list_save = [
+        prop.model_save_path + dir_name[len(prop.model_nodd_path):]
+        for dir_name in dir_list_nodd
+    ]
     # Set up directory tree locally
     create_directories(dir_list_save, logger)
     # Get list of files
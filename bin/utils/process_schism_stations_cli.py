@@ -9,23 +9,48 @@ Created on Fri Jan 23 15:01:50 2026
 """
 
 import argparse
+import io
+import itertools
 import logging
 import logging.config
 import os
 import shutil
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
-from netCDF4 import Dataset, date2num
+from netCDF4 import Dataset
 from pyproj import Transformer
 
 from ofs_skill.model_processing import model_properties
 from ofs_skill.model_processing.model_source import get_model_source
 from ofs_skill.obs_retrieval import utils
 
+# Station out file names to load
+STAOUT_NAMES = {'staout_1': 'wl', # elev/wl
+                'staout_3': 'u_wind', # wind u-vel
+                'staout_4': 'v_wind', # wind v-vel
+                'staout_5': 'temp', # temp
+                'staout_6': 'salt', # salt
+                'staout_7': 'u', # current u-vel
+                'staout_8': 'v', # current v-vel
+                }
+# Vars with 2D profiles (staout_5 and up), as well as surface values
+PROFILE_VARS = tuple(var for name, var in STAOUT_NAMES.items()
+                     if int(name[-1]) >= 5)
+# Field/out2d file names -- add more files here to complete fields
+# processing. Right now it is set up only for ice & water level
+FIELD_NAMES = ['out2d_1.nc',
+               'temperature_1.nc',
+               'zCoordinates_1.nc',
+               'horizontalVelX_1.nc',
+               'horizontalVelY_1.nc',
+               ]
+
 
 def parameter_validation(prop, dir_params, logger):
     """Parameter validation"""
@@ -73,31 +98,30 @@ def make_dir_list(prop, logger):
 
     loofshr = ['00', '06', '12', '18']
     # Check hours to make they correspond to output directories
-    if prop.start_date_full[-2:] not in loofshr:
-        prop.start_date_full = prop.start_date_full[:-2] + '00'
-    if prop.end_date_full[-2:] not in loofshr:
-        prop.end_date_full = prop.end_date_full[:-2] + '18'
+    if f'{prop.start_dt.hour:02}' not in loofshr:
+        prop.start_dt = prop.start_dt.replace(hour=0)
+    if f'{prop.end_dt.hour:02}' not in loofshr:
+        prop.end_dt = prop.end_dt.replace(hour=18)
     # First get list of dates at x-hourly interval
     hr_interval = 6
-    date_list = make_datetime_list(datetime.strptime(prop.start_date_full,
-                                                     '%Y%m%d-%H'),
-                                   datetime.strptime(prop.end_date_full,
-                                                     '%Y%m%d-%H'),
-                                   hr_interval)
-    # Now with date list, loop and make dir list
-    dir_list = []
+    date_list = make_datetime_list(prop.start_dt, prop.end_dt, hr_interval)
+    # Now with date list, loop and make dir list. Every date of a day maps to
+    # the same four dirs, so keep each dir once, in order (dict keys).
+    dir_list = {}
     for date in date_list:
         year = date.year
         month = date.month
         day = date.day
         # Do LOOFS2 hindcast directory structure
-        model_dir = [Path(f'{prop.filepath}/{year}/{month:02}{day:02}{hr}/outputs/').as_posix() \
-                     for hr in loofshr]
-        for mdir in model_dir:
-            if mdir not in dir_list:
-                dir_list.append(mdir)
-            if not os.path.exists(mdir):
-                logger.error('Did not find model output dir!')
+        for hr in loofshr:
+            dir_list[Path(f'{prop.filepath}/{year}/{month:02}{day:02}{hr}'
+                          '/outputs/').as_posix()] = None
+    dir_list = list(dir_list)
+    # Check each dir once, and report the missing ones together
+    missing = [mdir for mdir in dir_list if not os.path.exists(mdir)]
+    if missing:
+        logger.error('Did not find %d of %d model output dirs: %s',
+                     len(missing), len(dir_list), ', '.join(missing))
 
     return dir_list
 
@@ -121,14 +145,9 @@ def make_datetime_list(start_date, end_date, interval_hours):
 
     '''
 
-    date_list = []
-    delta = timedelta(hours=interval_hours)
-
-    while start_date <= end_date:
-        date_list.append(start_date)
-        start_date += delta
-
-    return date_list
+    return pd.date_range(start_date, end_date,
+                         freq=pd.Timedelta(hours=interval_hours)
+                         ).to_pydatetime().tolist()
 
 
 def copy_field_files(prop, filepath, destination, logger):
@@ -156,6 +175,49 @@ def copy_field_files(prop, filepath, destination, logger):
     shutil.copyfile(filepath,destination_path)
 
 
+def read_staout(source):
+    '''
+    Reads whitespace-delimited SCHISM station output (one row per time step,
+    time in the first column) with pandas' C parser, which is several times
+    faster than np.loadtxt. Values are float32, the precision they are saved
+    to NetCDF with. Files given by path are memory-mapped, so the parser
+    reads straight from the page cache instead of through Python file I/O.
+
+    Parameters
+    ----------
+    source : path or text buffer of staout rows
+
+    Returns
+    -------
+    2D float32 numpy array, time steps x columns
+    '''
+    return pd.read_csv(source, sep=r'\s+', header=None,
+                       dtype=np.float32, engine='c',
+                       memory_map=isinstance(source, (str, os.PathLike))
+                       ).to_numpy()
+
+
+def mask_no_data(data):
+    '''
+    Returns a C-contiguous float32 copy of staout values with no data values
+    (below -100000) replaced by nans. pandas hands back column-major arrays,
+    so the values are gathered once into a row-major buffer and then masked
+    in place there.
+
+    Parameters
+    ----------
+    data : float32 numpy array, may be a strided view
+
+    Returns
+    -------
+    C-contiguous float32 numpy array, same shape as data
+    '''
+    out = np.empty(data.shape, dtype=np.float32)
+    np.copyto(out, data)
+    np.putmask(out, out < -100000, np.nan)
+    return out
+
+
 def load_2d_station_files(filepath, filename, logger):
     '''
     Loading function for 2D SCHISM output variables, including temp, salt, and
@@ -175,36 +237,19 @@ def load_2d_station_files(filepath, filename, logger):
         surf_data: surface values
     '''
 
-    def generate_specific_rows(file_path, row_indices=[]):
-        '''
-        A helper that yields text file lines at specified indices.
-        '''
-        with open(file_path) as f:
-            for i, line in enumerate(f):
-                if i in row_indices:
-                    yield line
-
     # Number of rows (times)
     dt_folder = 6*60 #minutes
     dt_data = 6 #minutes
-    nrows = (dt_folder/dt_data)*2 #*2 because there are two rows for each time step
-    surf_rows = [int(num) for num in np.linspace(
-        0,nrows-2,int(nrows/2))] #rows to extract for surface
-    prof_rows = [int(num) for num in np.linspace(
-        1,nrows-1,int(nrows/2))] #rows to extract for profiles
-    # Extract prof and surf rows from staout file
-    gen = generate_specific_rows(filepath+'/'+filename,
-                                 surf_rows)
-    surf_data = np.loadtxt(gen)
-    gen = generate_specific_rows(filepath+'/'+filename,
-                                 prof_rows)
-    prof_data = np.loadtxt(gen)
-    # Slice off time
-    surf_data = np.delete(surf_data, 0, axis=1)
-    prof_data = np.delete(prof_data, 0, axis=1)
-    # Replace no data values with nans
-    surf_data[surf_data < -100000] = np.nan
-    prof_data[prof_data < -100000] = np.nan
+    nrows = int(dt_folder/dt_data)*2 #*2 because there are two rows for each time step
+    # Read the staout file once; surface and profile rows alternate and have
+    # different widths, so parse the even and odd rows separately
+    with open(filepath+'/'+filename) as f:
+        lines = list(itertools.islice(f, nrows))
+    surf_data = read_staout(io.StringIO(''.join(lines[0::2])))
+    prof_data = read_staout(io.StringIO(''.join(lines[1::2])))
+    # Slice off time (views, no copy)
+    surf_data = surf_data[:, 1:]
+    prof_data = prof_data[:, 1:]
     # Now parse prof_data rows to get var values and z values
     nsta = int(surf_data.shape[1]) # number of stations
     nvrt = int(prof_data.shape[1]/2/nsta) # number of depth vertices
@@ -216,43 +261,90 @@ def load_2d_station_files(filepath, filename, logger):
 
     # OK GOOD! Now we need to reshape these to be OFS-compatible:
         # time x nsta x nvrt (60 x 14 x 32)
-    prof_var_data = prof_var_data.reshape(nt, nsta, nvrt)
-    prof_z_data = prof_z_data.reshape(nt, nsta, nvrt)
+    # The reshapes are views; mask_no_data then copies each one into a
+    # C-contiguous float32 buffer in the (time, station, siglay) order the
+    # NetCDF variables are written in, and replaces no data values with nans
+    prof_var_data = mask_no_data(prof_var_data.reshape(nt, nsta, nvrt))
+    prof_z_data = mask_no_data(prof_z_data.reshape(nt, nsta, nvrt))
+    surf_data = mask_no_data(surf_data)
 
     # HOORAY, that was difficult <party popper>
     # What to return? Options: prof_var_data, surf_data, prof_z_data
     return prof_var_data, prof_z_data, surf_data
 
-def load_1d_station_files(filepath, filename, logger):
+def get_basedate(filepath):
+    '''
+    Returns the time that staout time steps in an output dir count from.
+    Basedate is 6 hours before the directory date.
+
+    Parameters
+    ----------
+    filepath : path to SCHISM output dir, .../YYYY/MMDDHH/outputs
+
+    Returns
+    -------
+    basedate : datetime object
+    '''
+    dt_folder = 6 # This is important! Time difference between successive output dirs -- consider moving to somewhere more visible
+    year, cycle = filepath.split('/')[-3:-1]
+    return datetime.strptime(year + cycle, '%Y%m%d%H') - \
+        timedelta(hours=dt_folder)
+
+def load_1d_station_files(filepath, filename, logger, basedate=None):
     '''
     Parameters
     ----------
     filepath : path to SCHISM output file
     filename : SCHISM output filename
     logger : logger!
+    basedate : start time of the output dir from get_basedate. Parsed from
+        filepath if not given.
 
     Returns:
     ------
     np_arr: water level data values
     t: time array
+    t_seconds: int64 array of seconds since basedate
 
     '''
 
-    # First get basedate then add time steps on top of that. Basedate is 6 hours
-    # before the directory date
-    dt_folder = 6 # This is important! Time difference between successive output dirs -- consider moving to somewhere more visible
-    dirdate_str = filepath.split('/')[-3] + filepath.split('/')[-2]
-    basedate = datetime.strptime(dirdate_str, '%Y%m%d%H') - \
-        timedelta(hours=dt_folder)
+    # First get basedate then add time steps on top of that
+    if basedate is None:
+        basedate = get_basedate(filepath)
     # Retrieve `filename` from the `filepath`, heigh-ho heigh-ho
     # Load as numpy array
-    np_arr = np.loadtxt(filepath+'/'+filename)
-    # Make time array using dt + basedate
-    t = [basedate+timedelta(seconds=int(dt)) for dt in np_arr[:,0]]
-    # Cut dt from numpy array, no longer needed
-    np_arr = np.delete(np_arr, 0, axis=1)
+    np_arr = read_staout(filepath+'/'+filename)
+    # Make time array using dt + basedate, in one datetime64 sum. Callers use
+    # datetime methods (hour, strftime), so return datetimes, and keep the
+    # raw dt seconds for the NetCDF time variable.
+    t_seconds = np_arr[:, 0].astype(np.int64)
+    t = (np.datetime64(basedate, 's') +
+         t_seconds.astype('timedelta64[s]')).tolist()
+    # Cut dt from numpy array, no longer needed (a view, no copy)
+    np_arr = np_arr[:, 1:]
+
+    return np_arr, t, t_seconds
+
+def load_station_file(filepath, filename, logger, basedate=None):
+    '''
+    Loads one staout file with the 1D or 2D loader, depending on the file
+    number. Errors are logged and None is returned, so one bad file does not
+    stop the other files in the directory from loading.
 
-    return np_arr, t
+    Returns
+    -------
+    load_1d_station_files or load_2d_station_files output, or None.
+    '''
+    try:
+        if int(filename[-1]) < 5: # do surface water level, no z-coords
+            return load_1d_station_files(filepath, filename, logger,
+                                         basedate)
+        # do 2D profiles (temp, salt, u, and v)
+        return load_2d_station_files(filepath, filename, logger)
+    except Exception as ex:
+        logger.error('Error caught loading station files!'
+                     'Error: %s', ex)
+        return None
 
 def get_station_info(prop, dir_list, logger):
     '''
@@ -268,29 +360,53 @@ def get_station_info(prop, dir_list, logger):
     '''
 
     file_path = Path(os.path.join(dir_list,'station.in')).as_posix()
-    # Define the list of column names
-    column_names = ['ID_num', 'X', 'Y', 'WHAT IS THIS']
-    # Read the file and skip the first 2 rows
-    df = pd.read_csv(file_path,
-                     delimiter=' ',
-                     skiprows=2,
-                     header=None,
-                     names=column_names
-                     )
+    # Read the station table after the 2 header rows. Columns may be split by
+    # any run of whitespace, and SCHISM allows `!` comments after a station.
+    data = np.loadtxt(file_path, skiprows=2, usecols=(0, 1, 2, 3),
+                      comments='!', ndmin=2)
     # Define the transformation from EPSG:3174 (Great Lakes Albers)
     # to EPSG:4326 (WGS84 Lat/Lon)!
     transformer = Transformer.from_crs('EPSG:3174', 'EPSG:4326',
                                        always_xy=True)
-    # Apply transformation across rows
-    df['lon'], df['lat'] = zip(*df.apply(
-        lambda row: transformer.transform(row['X'], row['Y']), axis=1
-        ))
-    # Remove Albers coords!
-    df = df.drop(['X', 'Y'], axis=1)
+    # Transform all stations in one call
+    lon, lat = transformer.transform(data[:, 1], data[:, 2])
+    df = pd.DataFrame({'ID_num': data[:, 0].astype(int),
+                       'WHAT IS THIS': data[:, 3],
+                       'lon': lon,
+                       'lat': lat})
 
     # All set!
     return df
 
+def find_station_info(prop, dir_list, logger):
+    '''
+    Loads station info from the first `station.in` file found next to the
+    SCHISM output dirs. Only one needs to be read.
+
+    Parameters
+    ----------
+    prop : holds all CLI input paramaters
+    dir_list : SCHISM output dirs, in date order
+    logger : logger!
+
+    Returns
+    -------
+    station info dataframe from get_station_info, or None if not found.
+    '''
+    for dir_path in dir_list:
+        if os.path.isfile(os.path.dirname(dir_path) + '/station.in'):
+            # Found station info. Load it one time!
+            try:
+                station_df = get_station_info(prop,
+                                              os.path.dirname(dir_path),
+                                              logger)
+                logger.info('Eureka! We found the station.in file!')
+                return station_df
+            except Exception as ex:
+                logger.error('Exception caught while getting station '
+                             'info from station.in! Error: %s', ex)
+    return None
+
 def make_ofs_dir_list(prop, basepath, logger):
     """
     This function creates a list of directories where model output is
@@ -300,15 +416,11 @@ def make_ofs_dir_list(prop, basepath, logger):
 
     dir_list_ofs = []
     hr_interval = 24
-    date_list = make_datetime_list(datetime.strptime(prop.start_date_full,
-                                                     '%Y%m%d-%H'),
-                                   datetime.strptime(prop.end_date_full,
-                                                     '%Y%m%d-%H'),
-                                   hr_interval)
+    date_list = make_datetime_list(prop.start_dt, prop.end_dt, hr_interval)
 
     # After 12/31/24, directory structure changes! Now we need to sort
     # a dir list that might have two different formats.
-    datethreshold = datetime.strptime('12/31/24', '%m/%d/%y')
+    datethreshold = datetime(2024, 12, 31)
     logger.info(f'Starting list of directories for {basepath}')
     ####
     for date in date_list:
@@ -345,13 +457,211 @@ def create_directories(dir_list, logger):
     """Creates directory tree from a list of directory names."""
     for dir_name in dir_list:
         try:
-            os.makedirs(dir_name)
-            logger.info(f"Directory '{dir_name}' created successfully.")
-        except FileExistsError:
-            logger.info(f"Directory '{dir_name}' already exists.")
+            os.makedirs(dir_name, exist_ok=True)
         except Exception as e_x:
             logger.error(f"Error creating directory '{dir_name}': {e_x}")
             sys.exit(-1)
+    logger.info('Created or found %d OFS output directories.',
+                len(dir_list))
+
+def process_day(date, dir_list_filt, dir_ofs, station_df, prop, logger):
+    '''
+    Loads the station output of one day's SCHISM output dirs, copies their
+    field files, and writes a station NetCDF for each dir. Days do not share
+    any state, so process_schism_stations runs them in parallel processes.
+
+    Parameters
+    ----------
+    date : the day, datetime object
+    dir_list_filt : SCHISM output dirs for that day
+    dir_ofs : OFS-standard dir to save the day's files to
+    station_df : station info from `station.in`, or None if not found
+    prop : all command line inputs are stored here.
+    logger : logger!
+
+    Returns
+    -------
+    None.
+    '''
+    datestr = f'{date.month:02}{date.day:02}'
+    t = None
+    # Loop through directories
+    for dir_path in dir_list_filt:
+        # One array slot per var, filled by the loads below. A file that
+        # fails to load leaves its slot None, and that dir's NetCDF is
+        # skipped with an error rather than written with missing data.
+        twod_vars = dict.fromkeys(PROFILE_VARS) # 2D vars
+        twod_z = dict.fromkeys(PROFILE_VARS) # 2D z-coords
+        surf_vars = dict.fromkeys(STAOUT_NAMES.values()) # Surface vars
+        # Load staout/station files concurrently; the C parser
+        # releases the GIL, so reads and parses overlap. The dir's basedate
+        # is parsed once for all of its 1D files.
+        basedate = get_basedate(dir_path)
+        with ThreadPoolExecutor(
+                max_workers=len(STAOUT_NAMES)) as executor:
+            loaded = list(executor.map(
+                load_station_file, itertools.repeat(dir_path),
+                STAOUT_NAMES, itertools.repeat(logger),
+                itertools.repeat(basedate)))
+        for name, result in zip(STAOUT_NAMES, loaded):
+            if result is None:
+                continue
+            if int(name[-1]) < 5: # surface water level, no z-coords
+                surf_vars[STAOUT_NAMES[name]], t, t_seconds = result
+            else: # 2D profiles (temp, salt, u, and v)
+                (twod_vars[STAOUT_NAMES[name]],
+                 twod_z[STAOUT_NAMES[name]],
+                 surf_vars[STAOUT_NAMES[name]]) = result
+        # Now loop through field 2D/3D output and copy it
+        for name in FIELD_NAMES:
+            filepath = Path(os.path.join(dir_path, name)).as_posix()
+            try:
+                logger.info('Copying field files for %s and %s-%s...',
+                            name, datestr,filepath.split('/')[-3][-2:])
+                copy_field_files(prop, filepath, dir_ofs, logger)
+            except Exception as ex:
+                logger.error('Error when copying SCHISM field files! '
+                             'Error: %s', ex)
+        # Now save stations to 6-hourly netcdfs
+        missing = [var for var, data in surf_vars.items() if data is None]
+        if missing:
+            logger.error('Missing station output (%s) in %s! Cannot '
+                         'process staout files to netcdf!',
+                         ', '.join(missing), dir_path)
+            continue
+        logger.info('Saving all station files for %s...', datestr)
+
+        '''
+        Contents of station netcdf:
+            1) all vars, [time x stations x z-coords]
+            2) lat coords [stations]
+            3) lon coords [stations]
+            4) time [time]
+            5) water depth [stations]
+            6) all surf vars
+            7) all var z-coords
+        '''
+        if prop.whichcast == 'hindcast':
+            cyc = t[-1].hour
+            date = datetime.strftime(t[-1],'%Y%m%d')
+        else:
+            cyc = t[0].hour
+            date = datetime.strftime(t[0], '%Y%m%d')
+        ### Filename & filepath
+        filename=f'{prop.ofs}.t{cyc:02}z.{date}.stations.{prop.whichcast}.nc'
+        filepath = Path(os.path.join(dir_ofs,filename)).as_posix()
+        ### Set up station netcdf
+        if not os.path.isfile(filepath):
+            ncfile = Dataset(filepath, mode='w', format='NETCDF4')
+            name_length = 20
+            ### Set up dimensions
+            try:
+                ncfile.createDimension('station', int(station_df['ID_num'].max()))
+                ncfile.createDimension('clen', name_length)
+                ncfile.createDimension('time', len(t))
+                ncfile.createDimension('siglay', twod_vars['temp'].shape[2])
+                num_strings_dim_name = 'num_entries'
+                num_entries = twod_vars['temp'].shape[2]
+                ncfile.createDimension(num_strings_dim_name, num_entries)
+                ### Create variables
+                # Deal with time
+                time = ncfile.createVariable('time', np.int64, ('time'))
+                time.units = (f'seconds since '
+                              f'{prop.start_dt:%Y-%m-%d %H}:00:00')
+                # Do rest of vars
+                lon = ncfile.createVariable('lon', np.float32, ('station'))
+                lat = ncfile.createVariable('lat', np.float32, ('station'))
+                name_station_var = ncfile.createVariable('name_station', 'S1', ('station'))
+                zeta = ncfile.createVariable('zeta', np.float32, ('time','station'))
+                uwind = ncfile.createVariable('uwind_speed', np.float32, ('time','station'))
+                vwind = ncfile.createVariable('vwind_speed', np.float32, ('time','station'))
+                # Profile vars are most of the file: store each one as a
+                # single shuffled, lightly compressed chunk
+                profile_opts = {'zlib': True, 'complevel': 1, 'shuffle': True,
+                                'chunksizes': twod_vars['temp'].shape}
+                temp = ncfile.createVariable('temp', np.float32, ('time','station','siglay',), **profile_opts)
+                salinity = ncfile.createVariable('salinity', np.float32, ('time','station','siglay'), **profile_opts)
+                u = ncfile.createVariable('u', np.float32, ('time','station','siglay'), **profile_opts)
+                v = ncfile.createVariable('v', np.float32, ('time','station','siglay'), **profile_opts)
+                zcoord = ncfile.createVariable('zcoords', np.float32, ('station','siglay'))
+                # Assign vars to netcdf
+                station_names = [f'station_{prop.ofs}_{i+1:02d}' \
+                                 for i in range(int(station_df['ID_num'].max()))]
+                # names_char_array = nc.stringtochar(np.array(station_names,
+                #                                             dtype=f'S{name_length}'))
+                name_station_var[:] = np.array(station_names,
+                                               dtype=f'S{name_length}')
+                # Staout times count from the dir's basedate; shift them to
+                # the run start in the units, no per-step date conversion
+                time[:] = t_seconds + int(
+                    (basedate - prop.start_dt).total_seconds())
+                lon[:] = station_df['lon']
+                lat[:] = station_df['lat']
+                zeta[:,:] = surf_vars['wl']
+                uwind[:,:] = surf_vars['u_wind']
+                vwind[:,:] = surf_vars['v_wind']
+                temp[:,:,:] = twod_vars['temp']
+                salinity[:,:,:] = twod_vars['salt']
+                u[:,:,:] = twod_vars['u']
+                v[:,:,:] = twod_vars['v']
+                zcoord[:,:] = twod_z['u'][0,:,:]
+                ncfile.close()
+            except TypeError as te:
+                logger.error('Station info was not found in SCHISM '
+                             'output! Cannot process staout files '
+                             'to netcdf! Error: %s', te)
+            except Exception as ex:
+                logger.error('Cannot process staout files '
+                             'to netcdf! Error: %s', ex)
+
+def process_days(date_list, day_dirs, dir_list_ofs, station_df, prop,
+                 logger):
+    '''
+    Runs process_day for every day in date_list. Days are independent (own
+    dirs in, own files out), so they run in parallel processes, sized by
+    `schism_station_workers` in the [parallelization] config section. With
+    parallel_enabled=False the days run one after another in this process.
+
+    Parameters
+    ----------
+    date_list : days to process, datetime objects
+    day_dirs : SCHISM output dirs keyed by YYYYMMDD
+    dir_list_ofs : OFS-standard dirs to save to, one per day in date_list
+    station_df : station info from `station.in`, or None if not found
+    prop : all command line inputs are stored here.
+    logger : logger!
+
+    Returns
+    -------
+    None.
+    '''
+    parallel_config = utils.get_parallel_config(
+        logger, getattr(prop, 'config_file', None))
+    max_workers = min(len(date_list),
+                      parallel_config['schism_station_workers'])
+    logger.info('Processing %d days of SCHISM output with %d workers',
+                len(date_list), max_workers)
+    jobs = {date: (date, day_dirs.get(f'{date:%Y%m%d}', []),
+                   dir_list_ofs[i], station_df, prop, logger)
+            for i, date in enumerate(date_list)}
+    if max_workers <= 1:
+        for date, args in jobs.items():
+            try:
+                process_day(*args)
+            except Exception as ex:
+                logger.error('Error processing SCHISM output for %s! '
+                             'Error: %s', date.strftime('%Y%m%d'), ex)
+        return
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(process_day, *args): date
+                   for date, args in jobs.items()}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as ex:
+                logger.error('Error processing SCHISM output for %s! '
+                             'Error: %s', futures[future].strftime('%Y%m%d'),
+                             ex)
 
 def process_schism_stations(prop, logger):
     '''
@@ -388,6 +698,9 @@ def process_schism_stations(prop, logger):
     dir_params = utils.Utils(_conf).read_config_section('directories', logger)
     # Parameter validation
     parameter_validation(prop, dir_params, logger)
+    # Parse the start and end dates once; everything below uses these
+    prop.start_dt = datetime.strptime(prop.start_date_full, '%Y%m%d-%H')
+    prop.end_dt = datetime.strptime(prop.end_date_full, '%Y%m%d-%H')
 
     # Path for saving netcdfs
     prop.model_path = os.path.join(
@@ -404,184 +717,22 @@ def process_schism_stations(prop, logger):
     dir_list_ofs = make_ofs_dir_list(prop, prop.model_path, logger)
     create_directories(dir_list_ofs, logger)
 
-    # Station out file names to load
-    staout_names = {'staout_1': 'wl', # elev/wl
-                    'staout_3': 'u_wind', # wind u-vel
-                    'staout_4': 'v_wind', # wind v-vel
-                    'staout_5': 'temp', # temp
-                    'staout_6': 'salt', # salt
-                    'staout_7': 'u', # current u-vel
-                    'staout_8': 'v', # current v-vel
-                    }
-    # placeholder for station ID list
-    station_df = None
-    # Field/out2d file names -- add more files here to complete fields
-    # processing. Right now it is set up only for ice & water level
-    field_names = ['out2d_1.nc',
-                   'temperature_1.nc',
-                   'zCoordinates_1.nc',
-                   'horizontalVelX_1.nc',
-                   'horizontalVelY_1.nc',
-                   ]
-
     # Loop through dir list and retrieve station output files, and
     # station info from the `station.in` file (only need to read one)
     if len(dir_list) > 0:
-        #load_schism_stations(prop, [dir_list,dir_list_ofs], logger)
-        # Loop through dir_list, collect station output files, and save them
-        # in the OFS dir tree
-        station_info_flag = None # Raise flag after finding a `station.in` file
+        station_df = find_station_info(prop, dir_list, logger)
         # First get list of days
         hr_interval = 24
-        date_list = make_datetime_list(datetime.strptime(prop.start_date_full,
-                                                    '%Y%m%d-%H'),
-                                  datetime.strptime(prop.end_date_full,
-                                                    '%Y%m%d-%H'),
-                                  hr_interval
-                                  )
-        # Loop through days
-        for i,date in enumerate(date_list):
-            datestr = f'{date.month:02}{date.day:02}'
-            # Now find dirs that correpsond to that datestr
-            dir_list_filt = [entry for entry in dir_list if datestr in \
-                             entry.split('/')[-2][0:4]]
-            # Loop through directories
-            for dir_path in dir_list_filt:
-                #
-                # First check for station.in file, and raise flag when found
-                if (os.path.isfile(os.path.dirname(dir_path) + '/station.in') and
-                    station_info_flag is None):
-                    # Found station info. Load it one time!
-                    try:
-                        station_df = get_station_info(prop,
-                                                      os.path.dirname(dir_path),
-                                                      logger)
-                        station_info_flag = 'Eureka!'
-                        logger.info('Eureka! We found the station.in file!')
-                    except Exception as ex:
-                        logger.error('Exception caught while getting station '
-                                     'info from station.in! Error: %s', ex)
-                # Set up dictionaries & empties for all vars
-                # 2D vars
-                twod_vars = {}
-                for key in ['temp','salt','u','v']:
-                    twod_vars[key] = []
-                # 2D z-coords
-                twod_z = {}
-                for key in ['temp','salt','u','v']:
-                    twod_z[key] = []
-                # Surface vars
-                surf_vars = {}
-                for key in ['wl','u_wind','v_wind','temp','salt','u','v']:
-                    surf_vars[key] = []
-                # Loop through staout/station files
-                for name in staout_names:
-                    # Load each dir's station out files
-                    try:
-                        if int(name[-1]) < 5: # do surface water level, no z-coords
-                            np_staout, t = load_1d_station_files(dir_path,
-                                           name, logger)
-                            surf_vars[staout_names[name]] = np_staout
-                        else: # do 2D profiles (temp, salt, u, and v)
-                            np_staout, np_staout_z, np_staout_surf = \
-                                load_2d_station_files(dir_path, name, logger)
-                            surf_vars[staout_names[name]] = np_staout_surf
-                            twod_vars[staout_names[name]] = np_staout
-                            twod_z[staout_names[name]] = np_staout_z
-                    except Exception as ex:
-                        logger.error('Error caught loading station files!'
-                                     'Error: %s', ex)
-                # Now loop through field 2D/3D output and copy it
-                for name in field_names:
-                    filepath = Path(os.path.join(dir_path, name)).as_posix()
-                    try:
-                        logger.info('Copying field files for %s and %s-%s...',
-                                    name, datestr,filepath.split('/')[-3][-2:])
-                        copy_field_files(prop, filepath, dir_list_ofs[i], logger)
-                    except Exception as ex:
-                        logger.error('Error when copying SCHISM field files! '
-                                     'Error: %s', ex)
-                # Now save stations to 6-hourly netcdfs
-                logger.info('Saving all station files for %s...', datestr)
-
-                '''
-                Contents of station netcdf:
-                    1) all vars, [time x stations x z-coords]
-                    2) lat coords [stations]
-                    3) lon coords [stations]
-                    4) time [time]
-                    5) water depth [stations]
-                    6) all surf vars
-                    7) all var z-coords
-                '''
-                if prop.whichcast == 'hindcast':
-                    cyc = t[-1].hour
-                    date = datetime.strftime(t[-1],'%Y%m%d')
-                else:
-                    cyc = t[0].hour
-                    date = datetime.strftime(t[0], '%Y%m%d')
-                ### Filename & filepath
-                filename=f'{prop.ofs}.t{cyc:02}z.{date}.stations.{prop.whichcast}.nc'
-                filepath = Path(os.path.join(dir_list_ofs[i],filename)).as_posix()
-                ### Set up station netcdf
-                if not os.path.isfile(filepath):
-                    ncfile = Dataset(filepath, mode='w', format='NETCDF4')
-                    name_length = 20
-                    ### Set up dimensions
-                    try:
-                        ncfile.createDimension('station', int(station_df['ID_num'].max()))
-                        ncfile.createDimension('clen', name_length)
-                        ncfile.createDimension('time', len(t))
-                        ncfile.createDimension('siglay', twod_vars['temp'].shape[2])
-                        num_strings_dim_name = 'num_entries'
-                        num_entries = twod_vars['temp'].shape[2]
-                        ncfile.createDimension(num_strings_dim_name, num_entries)
-                        ### Create variables
-                        # Deal with time
-                        time = ncfile.createVariable('time', np.float32, ('time'))
-                        time.units = (f'seconds since {prop.start_date_full[0:4]}-'
-                                      f'{prop.start_date_full[4:6]}-'
-                                      f'{prop.start_date_full[6:8]} '
-                                      f'{prop.start_date_full[-2:]}:00:00')
-                        # Do rest of vars
-                        lon = ncfile.createVariable('lon', np.float32, ('station'))
-                        lat = ncfile.createVariable('lat', np.float32, ('station'))
-                        name_station_var = ncfile.createVariable('name_station', 'S1', ('station'))
-                        zeta = ncfile.createVariable('zeta', np.float32, ('time','station'))
-                        uwind = ncfile.createVariable('uwind_speed', np.float32, ('time','station'))
-                        vwind = ncfile.createVariable('vwind_speed', np.float32, ('time','station'))
-                        temp = ncfile.createVariable('temp', np.float32, ('time','station','siglay',))
-                        salinity = ncfile.createVariable('salinity', np.float32, ('time','station','siglay'))
-                        u = ncfile.createVariable('u', np.float32, ('time','station','siglay'))
-                        v = ncfile.createVariable('v', np.float32, ('time','station','siglay'))
-                        zcoord = ncfile.createVariable('zcoords', np.float32, ('station','siglay'))
-                        # Assign vars to netcdf
-                        numeric_time = date2num(t, time.units)
-                        station_names = [f'station_{prop.ofs}_{i+1:02d}' \
-                                         for i in range(int(station_df['ID_num'].max()))]
-                        # names_char_array = nc.stringtochar(np.array(station_names,
-                        #                                             dtype=f'S{name_length}'))
-                        name_station_var[:] = np.array(station_names,
-                                                       dtype=f'S{name_length}')
-                        time[:] = numeric_time[:]
-                        lon[:] = station_df['lon']
-                        lat[:] = station_df['lat']
-                        zeta[:,:] = surf_vars['wl']
-                        uwind[:,:] = surf_vars['u_wind']
-                        vwind[:,:] = surf_vars['v_wind']
-                        temp[:,:,:] = twod_vars['temp']
-                        salinity[:,:,:] = twod_vars['salt']
-                        u[:,:,:] = twod_vars['u']
-                        v[:,:,:] = twod_vars['v']
-                        zcoord[:,:] = twod_z['u'][0,:,:]
-                        ncfile.close()
-                    except TypeError as te:
-                        logger.error('Station info was not found in SCHISM '
-                                     'output! Cannot process staout files '
-                                     'to netcdf! Error: %s', te)
-                    except Exception as ex:
-                        logger.error('Cannot process staout files '
-                                     'to netcdf! Error: %s', ex)
+        date_list = make_datetime_list(prop.start_dt, prop.end_dt,
+                                       hr_interval)
+        # Bucket output dirs by day once. Key on the full YYYYMMDD date
+        # (year dir + MMDD), so the same MMDD in another year does not match.
+        day_dirs = defaultdict(list)
+        for entry in dir_list:
+            day_dirs[entry.split('/')[-3] + entry.split('/')[-2][0:4]].append(
+                entry)
+        process_days(date_list, day_dirs, dir_list_ofs, station_df, prop,
+                     logger)
     else:
         logger.error('No output directories found. Please check the file '
                       'path: %s', prop.filepath)
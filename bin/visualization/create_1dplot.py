@@ -77,6 +77,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from ofs_skill.model_processing import (
@@ -118,6 +119,12 @@ _CAST_KEYWORDS = (
     ('hindcast', 'Hindcast'),
 )
 
+# Known dtypes of the paired (.int) file time columns, so the parser does
+# not have to infer them. Values stay float64, the precision they are
+# written with.
+_PAIR_DTYPES = {'Julian': 'float64', 'year': 'int16', 'month': 'int8',
+                'day': 'int8', 'hour': 'int8', 'minute': 'int8'}
+
 
 def get_variable_from_filename(filename):
     """Determine the variable type based on keywords in the filename."""
@@ -269,28 +276,86 @@ def ofs_ctlfile_read(prop, name_var, logger):
     {name_var} from {prop.control_files_path}')
     return None
 
+def _pair_datetimes(paired_data):
+    """
+    Build the DateTime column of a paired series from its year, month, day,
+    hour and minute columns with datetime64 arithmetic, rather than
+    pd.to_datetime's row-by-row assembly of a multi-column frame.
+    """
+    year, month, day, hour, minute = (
+        paired_data[col].to_numpy(dtype=np.int64)
+        for col in ('year', 'month', 'day', 'hour', 'minute'))
+    months = ((year - 1970).astype('datetime64[Y]')
+              + (month - 1).astype('timedelta64[M]'))
+    times = (months.astype('datetime64[m]')
+             + (day - 1).astype('timedelta64[D]')
+             + hour.astype('timedelta64[h]')
+             + minute.astype('timedelta64[m]'))
+    return pd.Series(times.astype('datetime64[ns]'), index=paired_data.index)
+
+
+def _hourly_subsample(paired_data):
+    """
+    Keep the earliest-minute row of each hour of a paired series, in time
+    order. One stable lexsort over the time columns replaces a groupby +
+    idxmin; ties keep the first row, as idxmin does.
+    """
+    cols = [paired_data[col].to_numpy()
+            for col in ('minute', 'hour', 'day', 'month', 'year')]
+    order = np.lexsort(cols)
+    keys = np.stack([col[order] for col in cols[1:]])
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = (keys[:, 1:] != keys[:, :-1]).any(axis=0)
+    return paired_data.iloc[order[first]]
+
+
+def _station_row_index(read_station_ctl_file):
+    """
+    Map each station ID in an obs station ctl file to its row, so stations
+    are matched with a dict lookup instead of a list scan per station. The
+    first row wins for a repeated ID, as with ``list.index``.
+    """
+    station_rows = {}
+    for row_idx, row in enumerate(read_station_ctl_file[0]):
+        if row:
+            station_rows.setdefault(row[0], row_idx)
+    return station_rows
+
+
 def _process_station_plot(
-        i, read_ofs_ctl_file, read_station_ctl_file, prop, var_info, logger):
+        i, read_ofs_ctl_file, read_station_ctl_file, prop, var_info, logger,
+        station_rows=None):
     """
     Process a single station's plots. Designed to run inside a
     ThreadPoolExecutor.  Returns the station ID on success, None on failure.
 
     A shallow copy of ``prop`` is used so that ``prop.whichcast`` can be
     set per-cast without racing against other threads.
+
+    ``station_rows`` is the ``_station_row_index`` of the station ctl file;
+    it is built here if not passed in.
     """
     station_prop = copy.deepcopy(prop)
     station_id_val = read_ofs_ctl_file[-1][i]
 
-    try:
-        obs_row = [y[0] for y in read_station_ctl_file[0]].index(
-            station_id_val)
-        if read_station_ctl_file[0][obs_row][0] != station_id_val:
-            raise ValueError('Station ID mismatch')
-    except (ValueError, IndexError):
+    if station_rows is None:
+        station_rows = _station_row_index(read_station_ctl_file)
+    obs_row = station_rows.get(station_id_val)
+    if obs_row is None:
         logger.error('Could not match station ID %s between control '
                      'file in get_node_ofs!', station_id_val)
         return None
 
+    # Station values and the pair file name prefix are the same for every
+    # cast and plot below: build them once
+    node_val = read_ofs_ctl_file[1][i]
+    station_info = [station_id_val,
+                    read_station_ctl_file[0][obs_row][2],
+                    read_station_ctl_file[0][obs_row][1].split('_')[-1],
+                    read_station_ctl_file[1][obs_row][2]]
+    pair_prefix = (f'{station_prop.ofs}_{var_info[1]}_{station_id_val}_'
+                   f'{node_val}_')
+
     now_fores_paired = []
     deltat = 0
     for cast in station_prop.whichcasts:
@@ -298,29 +363,21 @@ def _process_station_plot(
         current_cast = cast.lower()
         station_prop.whichcast = current_cast
 
-        pair_file = (
-            f'{station_prop.data_skill_1d_pair_path}/'
-            f'{station_prop.ofs}_{var_info[1]}_{station_id_val}_'
-            f'{read_ofs_ctl_file[1][i]}_{current_cast}_'
-            f'{station_prop.ofsfiletype}_pair.int'
-        )
+        pair_name = (f'{pair_prefix}{current_cast}_'
+                     f'{station_prop.ofsfiletype}_pair.int')
+        pair_file = f'{station_prop.data_skill_1d_pair_path}/{pair_name}'
 
         if not os.path.isfile(pair_file):
             logger.error(
-                'Paired dataset (%s_%s_%s_%s_%s_%s_pair.int) not found '
-                'in %s. ',
-                station_prop.ofs, var_info[1], station_id_val,
-                read_ofs_ctl_file[1][i], current_cast,
-                station_prop.ofsfiletype,
-                station_prop.visuals_1d_station_path)
+                'Paired dataset (%s) not found in %s. ',
+                pair_name, station_prop.visuals_1d_station_path)
         else:
             paired_data = pd.read_csv(
                 pair_file,
                 sep=r'\s+', names=var_info[2],
-                header=0)
+                header=0, dtype=_PAIR_DTYPES, engine='c')
             # Format paired data dates
-            paired_data['DateTime'] = pd.to_datetime(
-                paired_data[['year', 'month', 'day', 'hour', 'minute']])
+            paired_data['DateTime'] = _pair_datetimes(paired_data)
             # Read time series key
             filename = (
                 f'{station_prop.ofs}_{current_cast}_filename_key.csv')
@@ -344,22 +401,15 @@ def _process_station_plot(
                     'Exception caught when loading and merging '
                     'model filename key! Error: %s', ex)
             logger.info(
-                'Paired dataset (%s_%s_%s_%s_%s_%s_pair.int) found '
-                'in %s',
-                station_prop.ofs, var_info[1], station_id_val,
-                read_ofs_ctl_file[1][i], current_cast,
-                station_prop.ofsfiletype,
-                station_prop.visuals_1d_station_path)
+                'Paired dataset (%s) found in %s',
+                pair_name, station_prop.visuals_1d_station_path)
         if paired_data is not None:
             # Subsample time series if using 6-minute resolution
             deltat = (paired_data['DateTime'].iloc[-1]
                       - paired_data['DateTime'].iloc[0]).days
             if (station_prop.ofsfiletype == 'stations'
                     and deltat > 185):
-                paired_data = paired_data.loc[
-                    paired_data.groupby(
-                        ['year', 'month', 'day', 'hour'],
-                        observed=True)['minute'].idxmin()]
+                paired_data = _hourly_subsample(paired_data)
             now_fores_paired.append(paired_data)
 
     if len(now_fores_paired) > 0:
@@ -369,79 +419,57 @@ def _process_station_plot(
                     'Trying to build timeseries %s plot for paired '
                     'dataset: %s_%s_%s_%s_%s_%s_pair.int',
                     var_info[0], station_prop.ofs, var_info[1],
-                    station_id_val, read_ofs_ctl_file[1][i],
+                    station_id_val, node_val,
                     station_prop.whichcast, station_prop.ofsfiletype)
                 plotting_scalar.oned_scalar_plot(
                     now_fores_paired, var_info[1],
-                    [station_id_val,
-                     read_station_ctl_file[0][obs_row][2],
-                     read_station_ctl_file[0][obs_row][1].split('_')[-1],
-                     read_station_ctl_file[1][obs_row][2]],
-                    read_ofs_ctl_file[1][i],
+                    station_info, node_val,
                     station_prop, logger)
             elif var_info[1] == 'cu':
                 logger.info(
                     'Trying to build timeseries %s plot for paired '
                     'dataset: %s_%s_%s_%s_%s_%s_pair.int',
                     var_info[0], station_prop.ofs, var_info[1],
-                    station_id_val, read_ofs_ctl_file[1][i],
+                    station_id_val, node_val,
                     station_prop.whichcast, station_prop.ofsfiletype)
                 plotting_vector.oned_vector_plot1(
                     now_fores_paired, var_info[1],
-                    [station_id_val,
-                     read_station_ctl_file[0][obs_row][2],
-                     read_station_ctl_file[0][obs_row][1].split('_')[-1],
-                     read_station_ctl_file[1][obs_row][2]],
-                    read_ofs_ctl_file[1][i],
+                    station_info, node_val,
                     station_prop, logger)
 
                 logger.info(
                     'Trying to build wind rose %s plot for paired '
                     'dataset: %s_%s_%s_%s_%s_%s_pair.int',
                     var_info[0], station_prop.ofs, var_info[1],
-                    station_id_val, read_ofs_ctl_file[1][i],
+                    station_id_val, node_val,
                     station_prop.whichcast, station_prop.ofsfiletype)
                 plotting_vector.oned_vector_plot2b(
                     plotting_vector.oned_vector_plot2a(
                         now_fores_paired, logger),
                     var_info[1],
-                    [station_id_val,
-                     read_station_ctl_file[0][obs_row][2],
-                     read_station_ctl_file[0][obs_row][1].split('_')[-1],
-                     read_station_ctl_file[1][obs_row][2]],
-                    read_ofs_ctl_file[1][i],
+                    station_info, node_val,
                     station_prop, logger)
                 if deltat <= -1:
                     logger.info(
                         'Trying to build stick %s plot for paired '
                         'dataset: %s_%s_%s_%s_%s_pair.int',
                         var_info[0], station_prop.ofs, var_info[1],
-                        station_id_val, read_ofs_ctl_file[1][i],
+                        station_id_val, node_val,
                         station_prop.whichcast)
                     plotting_vector.oned_vector_plot3(
                         now_fores_paired, var_info[1],
-                        [station_id_val,
-                         read_station_ctl_file[0][obs_row][2],
-                         read_station_ctl_file[0][obs_row][1].split(
-                             '_')[-1],
-                         read_station_ctl_file[1][obs_row][2]],
-                        read_ofs_ctl_file[1][i],
+                        station_info, node_val,
                         station_prop, logger)
                     logger.info(
                         'Trying to build stick %s plot for vector '
                         'difference: %s_%s_%s_%s_%s_%s_pair.int',
                         var_info[0], station_prop.ofs, var_info[1],
-                        station_id_val, read_ofs_ctl_file[1][i],
+                        station_id_val, node_val,
                         station_prop.whichcast,
                         station_prop.ofsfiletype)
                     plotting_vector.oned_vector_diff_plot3(
                         now_fores_paired, var_info[1],
-                        [station_id_val,
-                         read_station_ctl_file[0][obs_row][2],
-                         read_station_ctl_file[0][obs_row][1].split(
-                             '_')[-1],
-                         read_station_ctl_file[1][obs_row][2]],
-                        read_ofs_ctl_file[1][i],
+                        station_info, node_val,
                         station_prop, logger)
         except Exception as ex:
             logger.info(
@@ -482,17 +510,23 @@ def _ensure_paired_data_exists(read_ofs_ctl_file, prop, var_info, logger):
     parallel dispatch because get_skill() mutates shared state
     (prop.whichcast) and creates control files.
     """
+    # List the pair dir once instead of stat-ing every station x cast file
+    try:
+        with os.scandir(prop.data_skill_1d_pair_path) as entries:
+            existing = {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        existing = set()
+
     casts_needing_skill = set()
     for i in range(len(read_ofs_ctl_file[1])):
         for cast in prop.whichcasts:
             current_cast = cast.lower()
-            pair_file = (
-                f'{prop.data_skill_1d_pair_path}/'
+            pair_name = (
                 f'{prop.ofs}_{var_info[1]}_{read_ofs_ctl_file[-1][i]}_'
                 f'{read_ofs_ctl_file[1][i]}_{current_cast}_'
                 f'{prop.ofsfiletype}_pair.int'
             )
-            if not os.path.isfile(pair_file):
+            if pair_name not in existing:
                 if (prop.ofsfiletype == 'fields'
                         or read_ofs_ctl_file[1][i] >= 0):
                     casts_needing_skill.add(current_cast)
@@ -521,8 +555,7 @@ def create_1dplot_2nd_part(
     # Read obs station ctl files
     try:
         read_station_ctl_file = station_ctl_file_extract(
-            r'' + prop.control_files_path + '/' + prop.ofs + '_'
-            + var_info[1] + '_station.ctl'
+            f'{prop.control_files_path}/{prop.ofs}_{var_info[1]}_station.ctl'
         )
         logger.info(
             'Station ctl file (%s_%s_station.ctl) found in get_title. ',
@@ -533,6 +566,9 @@ def create_1dplot_2nd_part(
         logger.error('Station ctl file not found.')
         sys.exit(-1)
 
+    # Index obs stations by ID once for all station plots
+    station_rows = _station_row_index(read_station_ctl_file)
+
     # Ensure all paired data files exist before parallel dispatch.
     # get_skill() mutates prop and creates shared control files, so it
     # must run sequentially.
@@ -560,7 +596,8 @@ def create_1dplot_2nd_part(
                 prop_copy = copy.deepcopy(prop)
                 futures[executor.submit(
                     _process_station_plot, i, read_ofs_ctl_file,
-                    read_station_ctl_file, prop_copy, var_info, logger
+                    read_station_ctl_file, prop_copy, var_info, logger,
+                    station_rows
                 )] = i
             for future in as_completed(futures):
                 idx = futures[future]
@@ -579,7 +616,7 @@ def create_1dplot_2nd_part(
             try:
                 result = _process_station_plot(
                     i, read_ofs_ctl_file, read_station_ctl_file,
-                    prop, var_info, logger)
+                    prop, var_info, logger, station_rows)
                 if result is not None:
                     logger.info('Completed plot for station %s', result)
             except Exception as ex:
@@ -682,8 +719,9 @@ def create_1dplot(prop, logger):
     Specify defaults (can be overridden with command line options)
     '''
     _conf = getattr(prop, 'config_file', None)
+    conf_utils = utils.Utils(_conf)
     if logger is None:
-        config_file = utils.Utils(_conf).get_config_file()
+        config_file = conf_utils.get_config_file()
         log_config_file = 'conf/logging.conf'
         log_config_file = os.path.join(Path(prop.path), log_config_file)
 
@@ -702,11 +740,11 @@ def create_1dplot(prop, logger):
 
     logger.info('--- Starting Visualization Process ---')
 
-    dir_params = utils.Utils(_conf).read_config_section('directories', logger)
+    dir_params = conf_utils.read_config_section('directories', logger)
     # Retrieve datum list from config file
-    prop.datum_list = (utils.Utils(_conf).read_config_section('datums', logger)\
+    prop.datum_list = (conf_utils.read_config_section('datums', logger)\
                        ['datum_list']).split(' ')
-    conf_settings = utils.Utils(_conf).read_config_section('settings', logger)
+    conf_settings = conf_utils.read_config_section('settings', logger)
     prop.static_plots = conf_settings['static_plots']
     use_custom_files = conf_settings.get('use_custom_filenames', 'False').lower() in ('true', '1', 'yes')
     if use_custom_files:
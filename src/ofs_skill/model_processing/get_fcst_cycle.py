@@ -15,6 +15,28 @@ from botocore.exceptions import ClientError
 
 from ofs_skill.obs_retrieval import utils
 
+# Forecast cycle hours (UTC) of each OFS; others have a single 03Z cycle
+FCST_CYCLES = {
+    **dict.fromkeys((
+        'cbofs', 'dbofs', 'gomofs', 'ciofs', 'leofs',
+        'lmhofs', 'loofs', 'loofs2', 'lsofs', 'tbofs',
+        'necofs', 'secofs', 'stofs_2d_glo',
+    ), (0, 6, 12, 18)),
+    **dict.fromkeys(('creofs', 'ngofs2', 'sfbofs', 'sscofs'), (3, 9, 15, 21)),
+    **dict.fromkeys(('stofs_3d_atl', 'stofs_3d_pac'), (12,)),
+}
+
+# Forecast length (hours) of each OFS; others run out to 120 hours
+FCST_LENGTHS = {
+    **dict.fromkeys((
+        'cbofs', 'ciofs', 'creofs', 'dbofs', 'ngofs2', 'sfbofs',
+        'tbofs', 'stofs_3d_pac', 'secofs',
+    ), 48),
+    **dict.fromkeys(('gomofs', 'wcofs', 'sscofs', 'necofs'), 72),
+    'stofs_3d_atl': 96,
+    'stofs_2d_glo': 180,
+}
+
 
 def get_s3_bucket(ofs):
     """Select appropriate S3 bucket config name from OFS.
@@ -194,32 +216,8 @@ def get_fcst_hours(ofs):
     '''
 
     # Need to know forecast cycle hours (e.g. 00Z) and forecast length (hours)
-    if ofs in (
-        'cbofs', 'dbofs', 'gomofs', 'ciofs', 'leofs',
-        'lmhofs', 'loofs', 'loofs2', 'lsofs', 'tbofs',
-        'necofs', 'secofs', 'stofs_2d_glo'
-    ):
-        fcstcycles = np.array([0, 6, 12, 18])
-    elif ofs in ('creofs', 'ngofs2', 'sfbofs', 'sscofs'):
-        fcstcycles = np.array([3, 9, 15, 21])
-    elif ofs in ('stofs_3d_atl', 'stofs_3d_pac'):
-        fcstcycles = np.array([12])
-    else:
-        fcstcycles = np.array([3])
-    # Now need to know forecast length in hours
-    if ofs in (
-        'cbofs', 'ciofs', 'creofs', 'dbofs', 'ngofs2', 'sfbofs',
-        'tbofs', 'stofs_3d_pac', 'secofs'
-    ):
-        fcstlength = 48
-    elif ofs in ('gomofs', 'wcofs', 'sscofs', 'necofs'):
-        fcstlength = 72
-    elif ofs in ('stofs_3d_atl'):
-        fcstlength = 96
-    elif ofs in ('stofs_2d_glo'):
-        fcstlength = 180
-    else:  # Default / catch-all
-        fcstlength = 120
+    fcstcycles = np.array(FCST_CYCLES.get(ofs, (3,)))
+    fcstlength = FCST_LENGTHS.get(ofs, 120)  # Default / catch-all
 
     return fcstlength, fcstcycles
 
@@ -83,6 +83,12 @@ class ModelProperties:
         Path for model ice data
     model_source : str
         Model source type (e.g., 'fvcom', 'roms', 'schism')
+    jobs : int or None
+        Per-source station download concurrency; None uses the
+        [parallelization] config worker counts
+    use_cache : bool
+        Reuse on-disk caches of derived inputs (e.g. parsed OFS extent
+        geometry); False forces them to be regenerated
 
     Examples
     --------
@@ -90,8 +96,31 @@ class ModelProperties:
     >>> prop.ofs = "cbofs"
     >>> prop.datum = "MLLW"
     >>> prop.path = Path("./")
+
+    From parsed CLI arguments:
+
+    >>> prop = ModelProperties.from_namespace(parser.parse_args())
     """
 
+    # argparse dest -> attribute, for the option names shared by the CLIs
+    _ARG_MAP = {
+        'OFS': 'ofs',
+        'Path': 'path',
+        'config': 'config_file',
+        'StartDate_full': 'start_date_full',
+        'EndDate_full': 'end_date_full',
+        'Whichcast': 'whichcast',
+        'Datum': 'datum',
+        'FileType': 'ofsfiletype',
+        'Forecast_Hr': 'forecast_hr',
+        'Horizon_Skill': 'horizonskill',
+        'Var_Selection': 'var_list',
+        'Station_Owner': 'stationowner',
+        'User_Input': 'user_input_location',
+        'Currents_Bins_Csv': 'currents_bins_csv',
+        'Jobs': 'jobs',
+    }
+
     def __init__(self):
         """Initialize ModelProperties with default values."""
         # Many of these attributes are reassigned downstream to bool/None
@@ -117,6 +146,8 @@ class ModelProperties:
         self.filecheck: Any = ''
         # Extension attrs set dynamically by various CLI entrypoints.
         self.currents_bins_csv: Any = None
+        self.jobs: Any = None
+        self.use_cache: Any = True
         self.filepath: Any = ''
 
         # Path attributes
@@ -148,6 +179,41 @@ class ModelProperties:
         self.model_source: str = ''
         self.config_file = None
 
+    @classmethod
+    def from_namespace(cls, namespace) -> 'ModelProperties':
+        """
+        Build a ModelProperties from an ``argparse.Namespace``.
+
+        Copies every option listed in ``_ARG_MAP`` that the namespace
+        defines and is not None, so unset optional flags keep the class
+        defaults. The OFS name is lower-cased and the datum upper-cased,
+        and the GLOFS datum default is applied (see
+        :meth:`apply_glofs_datum_default`).
+
+        Parameters
+        ----------
+        namespace : argparse.Namespace
+            Parsed command line arguments.
+
+        Returns
+        -------
+        ModelProperties
+        """
+        prop = cls()
+        args = vars(namespace)
+        for dest, attr in cls._ARG_MAP.items():
+            if args.get(dest) is not None:
+                setattr(prop, attr, args[dest])
+        prop.ofs = prop.ofs.lower()
+        prop.datum = prop.datum.upper()
+        prop.apply_glofs_datum_default()
+        return prop
+
+    def apply_glofs_datum_default(self) -> None:
+        """Switch the MLLW default to IGLD85 for Great Lakes OFS (l*ofs)."""
+        if self.ofs.startswith('l') and self.datum == 'MLLW':
+            self.datum = 'IGLD85'
+
     def __repr__(self) -> str:
         """String representation of ModelProperties."""
         return f"ModelProperties(ofs='{self.ofs}', datum='{self.datum}')"
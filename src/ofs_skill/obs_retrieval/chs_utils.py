@@ -13,6 +13,8 @@ from typing import Any
 
 import requests
 
+from ofs_skill.obs_retrieval.utils import get_http_session
+
 # Authoritative CHS API Base URLs
 CHS_IWLS_BASE_URL = 'https://api-iwls.dfo-mpo.gc.ca/api/v1'
 CHS_SINE_BASE_URL = 'https://api-sine.dfo-mpo.gc.ca/api/v1'
@@ -65,4 +67,4 @@ chs_rate_limiter = RateLimiter()
 def chs_get(url: str, **kwargs: Any) -> requests.Response:
     """Issue a strictly rate-limited GET request to the CHS API."""
     chs_rate_limiter.wait()
-    return requests.get(url, **kwargs)
+    return get_http_session().get(url, **kwargs)
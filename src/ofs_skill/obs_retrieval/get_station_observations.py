@@ -95,9 +95,9 @@ import copy
 import logging
 import logging.config
 import os
-import socket
 import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
@@ -125,8 +125,6 @@ from ofs_skill.obs_retrieval.write_obs_ctlfile import write_obs_ctlfile
 
 # parse_arguments_to_list is now in utils module
 
-TIMEOUT_SEC = 120 # default API timeout in seconds
-socket.setdefaulttimeout(TIMEOUT_SEC)
 
 def parameter_validation(argu_list, datum_list, logger):
     """ Parameter validation """
@@ -709,6 +707,7 @@ def _process_variable_obs(
                 currents_bins_csv=getattr(
                     prop, 'currents_bins_csv', None),
                 config_file=config_file,
+                use_cache=getattr(prop, 'use_cache', True),
             )
             read_station_ctl_file = (
                 station_ctl_file_extract(
@@ -747,18 +746,18 @@ def _process_variable_obs(
                  read_station_ctl_file[1][i])
             )
 
-        # Read parallel config for worker counts
+        # Read parallel config for worker counts. A per-run ``prop.jobs``
+        # (CLI ``-j``) overrides the configured per-source counts.
         parallel_cfg = get_parallel_config(logger, config_file=config_file)
+        jobs = getattr(prop, 'jobs', None)
 
         # Currents retrieval now issues one HTTP call per ADCP bin per
         # station, so it is orders of magnitude more request-dense than
         # scalar variables. Cap CO-OPS currents concurrency hard to stay
         # under the per-IP rate limit.
-        coops_workers = (
-            min(parallel_cfg['obs_coops_workers'], 2)
-            if variable == 'currents'
-            else parallel_cfg['obs_coops_workers']
-        )
+        coops_workers = jobs or parallel_cfg['obs_coops_workers']
+        if variable == 'currents':
+            coops_workers = min(coops_workers, 2)
 
         # Map source names to worker counts
         source_worker_map = {
@@ -766,18 +765,13 @@ def _process_variable_obs(
             'TAC': coops_workers,
             'COOPS': coops_workers,
             'CO-OPS': coops_workers,
-            'USGS': parallel_cfg['obs_usgs_workers'],
-            'NDBC': parallel_cfg['obs_ndbc_workers'],
-            'CHS': parallel_cfg['obs_chs_workers'],
+            'USGS': jobs or parallel_cfg['obs_usgs_workers'],
+            'NDBC': jobs or parallel_cfg['obs_ndbc_workers'],
+            'CHS': jobs or parallel_cfg['obs_chs_workers'],
         }
 
-        succeeded = []
-        failed = []
-
-        for source, station_pairs in source_groups.items():
-            max_workers = source_worker_map.get(source, 1)
-
-            # Check for unsupported source
+        # Check for unsupported sources before dispatching anything
+        for source in source_groups:
             if source not in source_worker_map:
                 logger.error(
                     'The second item on the first line of '
@@ -798,15 +792,21 @@ def _process_variable_obs(
                 )
                 return False
 
-            logger.info(
-                'Processing %d %s stations with %d workers',
-                len(station_pairs), source, max_workers
-            )
+        succeeded = []
+        failed = []
 
-            with ThreadPoolExecutor(
-                max_workers=max_workers
-            ) as executor:
-                futures = {}
+        # Each data source gets its own pool sized to that provider's rate
+        # limits; the pools run side by side since they hit different hosts.
+        with ExitStack() as stack:
+            futures = {}
+            for source, station_pairs in source_groups.items():
+                max_workers = source_worker_map[source]
+                logger.info(
+                    'Processing %d %s stations with %d workers',
+                    len(station_pairs), source, max_workers
+                )
+                executor = stack.enter_context(
+                    ThreadPoolExecutor(max_workers=max_workers))
                 for station_info, station_metadata in station_pairs:
                     obs_path = os.path.join(
                         data_observations_1d_station_path,
@@ -835,13 +835,13 @@ def _process_variable_obs(
                     else:
                         logger.info('Reusing existing %s', obs_path)
 
-                for future in as_completed(futures):
-                    sid = futures[future]
-                    result = future.result()
-                    if result is not None:
-                        succeeded.append(result)
-                    else:
-                        failed.append(sid)
+            for future in as_completed(futures):
+                sid = futures[future]
+                result = future.result()
+                if result is not None:
+                    succeeded.append(result)
+                else:
+                    failed.append(sid)
 
         logger.info(
             'Station retrieval complete for %s: '
@@ -8,13 +8,12 @@ Uses activestations.xml which includes data availability flags (met,
 currents, waterquality) to set accurate has_* variable flags.
 """
 
-import urllib.error
-import urllib.request
 import xml.etree.ElementTree as ET
 from logging import Logger
 from typing import Optional
 
 import pandas as pd
+import requests
 
 from ofs_skill.obs_retrieval import utils
 
@@ -69,9 +68,11 @@ def inventory_ndbc_station(
 
     try:
         logger.info('Calling NDBC service for inventory...')
-        with urllib.request.urlopen(url) as response:
-            data = response.read()
-    except (urllib.error.HTTPError, urllib.error.URLError) as ex:
+        response = utils.get_http_session().get(
+            url, timeout=utils.TIMEOUT_SEC)
+        response.raise_for_status()
+        data = response.content
+    except requests.exceptions.RequestException as ex:
         logger.error('NDBC data download failed at %s -- %s', url, str(ex))
         return None
 
@@ -7,13 +7,11 @@ types (water level, temperature, currents, salinity) and consolidates
 the results into a single inventory DataFrame.
 """
 
-import json
-import urllib.error
-import urllib.request
 from logging import Logger
 from typing import Optional
 
 import pandas as pd
+import requests
 
 from ofs_skill.obs_retrieval import utils
 
@@ -46,9 +44,11 @@ def get_inventory(
 
     logger.info('Calling CO-OPS MDAPI for inventory: %s', station_type)
     try:
-        with urllib.request.urlopen(station_url) as url:
-            inventory = json.load(url)
-    except (urllib.error.URLError, urllib.error.HTTPError) as ex:
+        response = utils.get_http_session().get(
+            station_url, timeout=utils.TIMEOUT_SEC)
+        response.raise_for_status()
+        inventory = response.json()
+    except requests.exceptions.RequestException as ex:
         logger.error(
             'CO-OPS station %s data download failed at %s -- %s.',
             variable,
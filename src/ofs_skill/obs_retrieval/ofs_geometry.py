@@ -4,16 +4,69 @@ Extract geometric extent from OFS shapefile.
 This module reads a shapefile of the OFS extent and extracts the polygon
 boundaries and min/max lat/lon coordinates. Used to filter station inventory
 to within the OFS domain.
+
+Parsed geometries are cached in-process and on disk next to the shapefile
+(``{ofs}_geometry.pkl``). Cache entries are keyed on the shapefile's size
+and modification time, so editing or replacing the shapefile invalidates
+them automatically.
 """
 
+import hashlib
 import os
+import pickle
 from logging import Logger
-from typing import Optional
+from typing import Any, Optional
 
 import shapefile
 
 from ofs_skill.obs_retrieval import utils
 
+# Bump when the cached tuple layout changes so stale pickles are ignored.
+_GEOMETRY_CACHE_VERSION = 1
+
+# (shapefile path, cache key) -> ofs_geometry() result
+_geometry_cache: dict[tuple[str, str], Any] = {}
+
+
+def _geometry_cache_key(ofs: str, shp_path: str) -> str:
+    """Return a digest of the shapefile identity used to validate caches."""
+    stat = os.stat(shp_path)
+    ident = (f'{ofs}:{stat.st_mtime_ns}:{stat.st_size}:'
+             f'{_GEOMETRY_CACHE_VERSION}')
+    return hashlib.blake2b(ident.encode(), digest_size=16).hexdigest()
+
+
+def _load_cached_geometry(cache_file: str, key: str, logger: Logger):
+    """Return the pickled geometry in ``cache_file`` if its key matches."""
+    try:
+        with open(cache_file, 'rb') as f:
+            cached = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as ex:  # pylint: disable=broad-except
+        logger.warning('Ignoring unreadable geometry cache %s -- %s',
+                       cache_file, ex)
+        return None
+    if not isinstance(cached, dict) or cached.get('key') != key:
+        return None
+    return cached['geometry']
+
+
+def _save_cached_geometry(cache_file: str, key: str, geometry,
+                          logger: Logger) -> None:
+    """Write ``geometry`` to ``cache_file``; failures only cost a re-read."""
+    tmp_file = f'{cache_file}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_file, 'wb') as f:
+            pickle.dump({'key': key, 'geometry': geometry}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError as ex:
+        logger.warning('Could not write geometry cache %s -- %s',
+                       cache_file, ex)
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+
 
 def get_response_1(
     first: dict
@@ -103,6 +156,7 @@ def ofs_geometry(
     path: str,
     logger: Logger,
     config_file=None,
+    use_cache: bool = True,
 ) -> tuple[list[tuple[float, float]], float, float, float, float]:
     """
     Read OFS shapefile and extract geometric extent.
@@ -115,6 +169,10 @@ def ofs_geometry(
         ofs: OFS name (must match .shp filename in ofs_extents folder)
         path: Base path containing ofs_extents directory
         logger: Logger instance
+        config_file: Optional path to an ofs_dps.conf-style file
+        use_cache: Reuse a cached geometry for an unchanged shapefile.
+            When False the shapefile is always re-read and the cache is
+            refreshed.
 
     Returns:
         Tuple of (ofs_mask, lat_1, lat_2, lon_1, lon_2) where:
@@ -140,7 +198,19 @@ def ofs_geometry(
             dir_params['ofs_extents_dir'],
         )
 
-        shape = shapefile.Reader(r'' + ofs_extents_path + '/' + ofs + '.shp')
+        shp_path = ofs_extents_path + '/' + ofs + '.shp'
+        key = _geometry_cache_key(ofs, shp_path)
+        cache_file = os.path.join(ofs_extents_path, f'{ofs}_geometry.pkl')
+        if use_cache:
+            geometry = _geometry_cache.get((shp_path, key))
+            if geometry is None:
+                geometry = _load_cached_geometry(cache_file, key, logger)
+            if geometry is not None:
+                _geometry_cache[(shp_path, key)] = geometry
+                logger.info('Using cached geometry for %s', shp_path)
+                return geometry
+
+        shape = shapefile.Reader(shp_path)
         first = shape.shapeRecords()[0].shape.__geo_interface__
 
         # This little loop here is just to make sure we grab the largest polygon
@@ -189,6 +259,10 @@ def ofs_geometry(
             + str(ex)
         ) from ex
 
+    geometry = (ofs_mask, lat_1, lat_2, lon_1, lon_2)
+    _geometry_cache[(shp_path, key)] = geometry
+    _save_cached_geometry(cache_file, key, geometry, logger)
+
     logger.info('ofs_geometry.py ran sucessfully')
 
-    return ofs_mask, lat_1, lat_2, lon_1, lon_2
+    return geometry
@@ -314,7 +314,7 @@ def get_inventory_datasets(geo, t_c, usgs, ndbc, chs, logger):
 
 
 def ofs_inventory_stations(ofs, start_date, end_date, path, stationowner,
-                           logger, config_file=None):
+                           logger, config_file=None, use_cache=True):
     """ Specify defaults (can be overridden with command line options) """
 
     if logger is None:
@@ -352,7 +352,8 @@ def ofs_inventory_stations(ofs, start_date, end_date, path, stationowner,
     os.makedirs(control_files_path,exist_ok = True)
 
     try:
-        geo = ofs_geometry(ofs, path, logger, config_file=config_file)
+        geo = ofs_geometry(ofs, path, logger, config_file=config_file,
+                           use_cache=use_cache)
 
         dataset_final = retrieving_inventories(
             geo, start_date, end_date, ofs, stationowner, logger,
@@ -18,6 +18,8 @@ import numpy as np
 import pandas as pd
 from searvey._ndbc_api import fetch_ndbc_station
 
+from ofs_skill.obs_retrieval import utils
+
 
 def retrieve_ndbc_station(
     start_date: str,
@@ -71,7 +73,9 @@ def retrieve_ndbc_station(
 
     # Fetch the data
     for datamode in datamodes:
-        data_station = fetch_ndbc_station(
+        data_station = utils.call_with_timeout(
+            fetch_ndbc_station,
+            timeout=utils.SEARVEY_TIMEOUT_SEC,
             station_id=str(id_number),
             mode=datamode,
             start_date=start_date,
@@ -32,25 +32,13 @@ from urllib.error import HTTPError
 
 import pandas as pd
 import requests
-from requests.adapters import HTTPAdapter
 
 from ofs_skill.obs_retrieval import t_and_c_properties, utils
 
-# ---------------------------------------------------------------------------
-# Module-level HTTP session with connection pooling (Task 2)
-# ---------------------------------------------------------------------------
-_session = None  # pylint: disable=invalid-name
-
 
 def _get_session():
-    """Lazily create and return a shared requests.Session with connection pooling."""
-    global _session  # pylint: disable=invalid-name,global-statement
-    if _session is None:
-        _session = requests.Session()
-        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
-        _session.mount('https://', adapter)
-        _session.mount('http://', adapter)
-    return _session
+    """Return the shared pooled session (see ``utils.get_http_session``)."""
+    return utils.get_http_session()
 
 
 # ---------------------------------------------------------------------------
@@ -29,6 +29,8 @@ from searvey.usgs import (
     get_usgs_station_data,
 )
 
+from ofs_skill.obs_retrieval import utils
+
 # Track whether we've already warned about rate limiting this session
 _warned_rate_limit = False
 
@@ -114,7 +116,9 @@ def retrieve_usgs_station(
     # Fetch data for the station
     logger.info('Calling USGS API via searvey for %s...', variable)
     try:
-        data = get_usgs_station_data(
+        data = utils.call_with_timeout(
+            get_usgs_station_data,
+            timeout=utils.SEARVEY_TIMEOUT_SEC,
             usgs_code=station,
             endtime=end,
             period=period,
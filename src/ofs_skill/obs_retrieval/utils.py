@@ -5,12 +5,49 @@ Utility class for configuration management and helper functions.
 """
 
 import configparser
+import functools
 import logging
 import os
 import sys
+import threading
 from pathlib import Path
 from typing import Union
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+TIMEOUT_SEC = 120  # default API timeout in seconds
+# searvey sets no HTTP timeout of its own, so each NDBC/USGS fetch is given
+# a wall-clock limit instead
+SEARVEY_TIMEOUT_SEC = 600
+
+
+@functools.lru_cache(maxsize=32)
+def _read_config_cached(config_path, mtime_ns):
+    """
+    Parse a configuration file once per path and modification time.
+
+    ``mtime_ns`` is only part of the cache key: an edited file gets a new
+    key and is parsed again. Callers must treat the parser as read-only.
+    """
+    config = configparser.ConfigParser()
+    config.read(config_path)
+    return config
+
+
+def _load_config(config_file):
+    """
+    Return the parsed configuration file, reusing an earlier parse while
+    the file is unchanged. A missing file gives an empty parser, as
+    ``ConfigParser.read`` does.
+    """
+    try:
+        mtime_ns = os.stat(config_file).st_mtime_ns
+    except OSError:
+        return configparser.ConfigParser()
+    return _read_config_cached(str(config_file), mtime_ns)
+
 
 class Utils:
     """
@@ -155,10 +192,9 @@ class Utils:
         an error is logged and an empty dictionary is returned.
         """
         params = {}
-        config = configparser.ConfigParser()
 
         try:
-            config.read(self.config_file)
+            config = _load_config(self.config_file)
             options = config.options(section)
 
             for option in options:
@@ -218,6 +254,78 @@ class Utils:
             return False
 
 
+# ---------------------------------------------------------------------------
+# Process-wide HTTP session shared by the observation retrievers
+# ---------------------------------------------------------------------------
+_HTTP_POOL_SIZE = 32
+_http_session = None  # pylint: disable=invalid-name
+_http_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """
+    Return the process-wide pooled ``requests.Session``.
+
+    Created lazily on first use and shared by every retriever so TCP/TLS
+    connections to CO-OPS, CHS, and NDBC are reused across stations and
+    threads. Failed connection attempts are retried with backoff; read
+    errors are not, so callers' own retry loops keep control of slow
+    responses. The session has no default timeout -- always pass
+    ``timeout=`` (e.g. ``TIMEOUT_SEC``) on each request.
+
+    Returns
+    -------
+    requests.Session
+        Shared session with pooled adapters mounted for http and https.
+    """
+    global _http_session  # pylint: disable=invalid-name,global-statement
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=_HTTP_POOL_SIZE,
+                pool_maxsize=_HTTP_POOL_SIZE,
+                max_retries=Retry(total=3, read=False, backoff_factor=0.5),
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _http_session = session
+    return _http_session
+
+
+def call_with_timeout(func, *args, timeout=TIMEOUT_SEC, **kwargs):
+    """
+    Call ``func(*args, **kwargs)`` and stop waiting after ``timeout`` seconds.
+
+    Used for third-party clients (searvey) that open their own connections
+    without a timeout. The call runs on a daemon thread, so a stalled
+    server can neither block the caller nor keep the process alive at exit.
+
+    Raises
+    ------
+    TimeoutError
+        If ``func`` has not returned within ``timeout`` seconds.
+    """
+    outcome = {}
+
+    def _target():
+        try:
+            outcome['result'] = func(*args, **kwargs)
+        except BaseException as ex:  # pylint: disable=broad-exception-caught
+            outcome['error'] = ex
+
+    worker = threading.Thread(target=_target, daemon=True)
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        raise TimeoutError(
+            f'{getattr(func, "__name__", func)} did not finish within '
+            f'{timeout} s')
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['result']
+
+
 def load_api_keys(config_filename='conf/api_keys.conf'):
     """
     Load API keys from a config file into environment variables.
@@ -282,6 +390,8 @@ def _auto_workers(key):
     exceed the CPU count because threads spend most of their time waiting
     on network or disk.  CPU-bound pools (harmonic analysis) are capped
     at ``cpu_count - 1`` (max 8) to leave headroom for the main process.
+    SCHISM station processing parses text and writes NetCDF in separate
+    processes, so it is capped the same way.
 
     Parameters
     ----------
@@ -296,7 +406,7 @@ def _auto_workers(key):
     cpus = os.cpu_count() or 2
 
     # CPU-bound: leave one core free, cap at 8
-    if key == 'ha_workers':
+    if key in ('ha_workers', 'schism_station_workers'):
         return max(1, min(cpus - 1, 8))
 
     # I/O-bound defaults scale with CPU count
@@ -340,6 +450,7 @@ def get_parallel_config(logger=None, config_file=None):
         'skill_workers': 4,
         'ha_workers': _auto_workers('ha_workers'),
         'plot_workers': 4,
+        'schism_station_workers': _auto_workers('schism_station_workers'),
         'parallel_variables': False,
         'parallel_workflow': False,
         'parallel_stations': False,
@@ -395,7 +506,7 @@ def get_parallel_config(logger=None, config_file=None):
     int_keys = [
         'obs_coops_workers', 'obs_usgs_workers', 'obs_ndbc_workers',
         'obs_chs_workers', 'model_download_workers', 'skill_workers',
-        'ha_workers', 'plot_workers',
+        'ha_workers', 'plot_workers', 'schism_station_workers',
     ]
     for key in int_keys:
         val = raw.get(key, '').strip().lower()
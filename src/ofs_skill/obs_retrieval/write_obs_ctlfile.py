@@ -989,6 +989,7 @@ def write_obs_ctlfile(
     logger,
     currents_bins_csv=None,
     config_file=None,
+    use_cache=True,
 ):
     """Main entry point to loop over inventories and write observation CTL files."""
     dir_params = utils.Utils(config_file).read_config_section('directories', logger)
@@ -1045,6 +1046,7 @@ def write_obs_ctlfile(
                 stationowner,
                 logger,
                 config_file=config_file,
+                use_cache=use_cache,
             )
             dtypes = {
                 'ID': 'object',
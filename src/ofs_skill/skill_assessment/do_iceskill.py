@@ -38,6 +38,8 @@ from datetime import date
 from logging import Logger
 
 import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
 
 # NOTE: The functions below have been preserved from the original file with
 # minimal changes. They require comprehensive docstrings and type hints.
@@ -72,6 +74,242 @@ def make_2d_mask(
     return array_to_mask
 
 
+def nearest_index_map(
+    xm: np.ndarray,
+    ym: np.ndarray,
+    xo: np.ndarray,
+    yo: np.ndarray,
+) -> np.ndarray:
+    """
+    Map each observation grid cell to its nearest model node.
+
+    Equivalent to ``scipy.interpolate.griddata(..., method='nearest')``, but
+    the search is done once so the daily regridding is a plain gather:
+    ``values.ravel()[idx].reshape(xo.shape)``.
+
+    Parameters
+    ----------
+    xm, ym : np.ndarray
+        Projected model node coordinates
+    xo, yo : np.ndarray
+        Projected observation grid coordinates
+
+    Returns
+    -------
+    np.ndarray
+        Flat indices into the raveled model array, one per grid cell
+    """
+    tree = cKDTree(np.column_stack([np.ravel(xm), np.ravel(ym)]))
+    _, idx = tree.query(np.column_stack([np.ravel(xo), np.ravel(yo)]), k=1)
+    return idx
+
+
+def pair_days_index(
+    time_o: np.ndarray,
+    time_m: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pair every model time step with the observation from the same day.
+
+    Parameters
+    ----------
+    time_o : np.ndarray
+        Observation (daily GLSEA) times
+    time_m : np.ndarray
+        Model (hourly) times
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Observation and model indices of each pair, ordered by observation
+        and then by model time step, as the original nested loop did
+    """
+    obs_days = pd.to_datetime(np.asarray(time_o)).values.astype('datetime64[D]')
+    mod_days = pd.to_datetime(np.asarray(time_m)).values.astype('datetime64[D]')
+    # Stable sort keeps the model time steps of a day in their input order
+    order = np.argsort(mod_days, kind='stable')
+    sorted_days = mod_days[order]
+    lo = np.searchsorted(sorted_days, obs_days, side='left')
+    counts = np.searchsorted(sorted_days, obs_days, side='right') - lo
+    o_idx = np.repeat(np.arange(len(obs_days)), counts)
+    # Offset of each pair within its day's run of model time steps
+    within = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts,
+                                                 counts)
+    m_idx = order[np.repeat(lo, counts) + within]
+    return o_idx, m_idx
+
+
+def ice_cover_stats(
+    cover: np.ndarray,
+    threshold: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Basin-wide mean, standard deviation and extent of ice cover per day.
+
+    Parameters
+    ----------
+    cover : np.ndarray
+        Ice concentration (%) with shape (time, lat, lon), NaN over land
+        and non-negative elsewhere
+    threshold : float
+        Concentration (%) at or above which a cell counts toward extent
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        Mean and standard deviation of ice concentration, and percent of
+        valid cells at or above ``threshold`` (0 for days with no valid
+        cells), one value per time step
+    """
+    axes = (1, 2)
+    # Ice concentration is never negative, so the valid (>= 0) cells that
+    # form the extent denominator are exactly the non-NaN cells that
+    # nanmean/nanstd would count: find them once and share the count.
+    valid = cover >= 0
+    count = np.count_nonzero(valid, axis=axes)
+    filled = np.where(valid, cover, 0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = filled.sum(axis=axes, dtype=np.float64) / count
+        dev = np.where(valid, filled - mean[:, None, None], 0)
+        std = np.sqrt(
+            np.einsum('ijk,ijk->i', dev, dev, dtype=np.float64) / count)
+    covered = np.count_nonzero(cover >= threshold, axis=axes)
+    extent = np.zeros(len(cover))
+    np.divide(covered*100, count, out=extent, where=count > 0)
+    return mean, std, extent
+
+
+def nan_time_sums(
+    cube: np.ndarray,
+    squares: bool = True,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+    """
+    NaN-skipping count, sum and sum of squares of a field over time.
+
+    The sums of consecutive blocks of days add up to those of the whole
+    period, so they can be accumulated as the days are processed.
+
+    Parameters
+    ----------
+    cube : np.ndarray
+        Field with time as the first axis
+    squares : bool, optional
+        Whether to also sum the squares
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray | None]
+        Number of non-NaN values, and their sum and sum of squares
+        (float64, None unless ``squares``), for each cell
+    """
+    valid = ~np.isnan(cube)
+    filled = np.where(valid, cube, 0)
+    total_sq = None
+    if squares:
+        total_sq = np.einsum(
+            'i...,i...->...', filled, filled, dtype=np.float64)
+    return (
+        np.count_nonzero(valid, axis=0),
+        filled.sum(axis=0, dtype=np.float64),
+        total_sq,
+    )
+
+
+def extent_contingency(
+    obs: np.ndarray,
+    mod: np.ndarray,
+    threshold: float,
+    obs_valid: np.ndarray | None = None,
+    mod_valid: np.ndarray | None = None,
+) -> dict[str, np.ndarray]:
+    """
+    Compare observed and modeled ice extent cell by cell.
+
+    A cell counts as ice when its concentration is at or above
+    ``threshold``. Each comparison is made once as a boolean mask, so the
+    extent maps and the contingency counts come from the same masks.
+
+    Parameters
+    ----------
+    obs : np.ndarray
+        Observed ice concentration (%), NaN over land
+    mod : np.ndarray
+        Modeled ice concentration (%) on the same grid, NaN wherever
+        ``obs`` is NaN (and possibly elsewhere)
+    threshold : float
+        Concentration (%) at or above which a cell counts as ice
+    obs_valid, mod_valid : np.ndarray, optional
+        Non-NaN masks of ``obs`` and ``mod``, if the caller already has
+        them; found here otherwise
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        Boolean masks: ``obs_valid`` and ``mod_valid`` (non-NaN cells),
+        ``obs_ice`` and ``mod_ice`` (ice cells), ``hits`` (ice in both),
+        ``falarms`` (ice in model only) and ``misses`` (ice in observations
+        only, where the model is valid)
+    """
+    if obs_valid is None:
+        obs_valid = ~np.isnan(obs)
+    if mod_valid is None:
+        mod_valid = ~np.isnan(mod)
+    # NaN compares False, so land never counts as ice
+    obs_ice = obs >= threshold
+    mod_ice = mod >= threshold
+    # On booleans a > b is a & ~b in one pass, with no inverted copy
+    misses = np.greater(obs_ice, mod_ice)
+    misses &= mod_valid
+    return {
+        'obs_valid': obs_valid,
+        'mod_valid': mod_valid,
+        'obs_ice': obs_ice,
+        'mod_ice': mod_ice,
+        'hits': obs_ice & mod_ice,
+        'falarms': np.greater(mod_ice, obs_ice),
+        'misses': misses,
+    }
+
+
+def critical_success_index(
+    contingency: dict[str, np.ndarray],
+    axis: int | tuple[int, ...] | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Critical success index of ice extent from :func:`extent_contingency`.
+
+    Parameters
+    ----------
+    contingency : dict[str, np.ndarray]
+        Masks returned by :func:`extent_contingency`
+    axis : int or tuple of int, optional
+        Axes to count over, e.g. ``(1, 2)`` for one index per day of a
+        (time, lat, lon) field. By default all cells are counted.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        CSI, false alarm ratio and miss ratio, each relative to hits +
+        false alarms + misses (all 0 when there is no ice anywhere). All
+        NaN when the observed and modeled valid cells differ or there are
+        none, as the confusion matrix of the flattened valid cells could
+        not be formed.
+    """
+    n_obs = np.count_nonzero(contingency['obs_valid'], axis=axis)
+    n_mod = np.count_nonzero(contingency['mod_valid'], axis=axis)
+    hits = np.count_nonzero(contingency['hits'], axis=axis)
+    falarms = np.count_nonzero(contingency['falarms'], axis=axis)
+    misses = np.count_nonzero(contingency['misses'], axis=axis)
+    total = hits + falarms + misses
+    ratios = []
+    for count in (hits, falarms, misses):
+        ratio = np.zeros(np.shape(total))
+        np.divide(count, total, out=ratio, where=total > 0)
+        ratio[(n_obs == 0) | (n_obs != n_mod)] = np.nan
+        ratios.append(ratio[()])
+    return tuple(ratios)
+
+
 def iceonoff(
     time_all_dt: list,
     meanicecover: list,
@@ -94,41 +332,34 @@ def iceonoff(
     Tuple[Optional[date], Optional[date]]
         Ice onset and thaw dates, or None if not found
     """
-    counter = 0
     iceon = None
     iceoff = None
-    # Find ice onset date
-    for i in range(len(time_all_dt)):
-        if meanicecover[i] >= 10:
-            counter = counter + 1
-        else:
-            counter = 0
-        if counter == 5:
-            iceon = time_all_dt[i]
-            logger.info('Ice onset date found!')
-            break
-    if iceon is None:
+    meanicecover = np.asarray(meanicecover, dtype=float)
+    icy = meanicecover >= 10
+    # Find ice onset date: last day of the first run of 5 icy days
+    runs = np.convolve(
+        icy[:len(time_all_dt)].astype(np.int8), np.ones(5, np.int8), 'valid',
+    )
+    onset = np.flatnonzero(runs == 5)
+    if onset.size:
+        iceon = time_all_dt[onset[0]+4]
+        logger.info('Ice onset date found!')
+    else:
         logger.info('Ice onset date not found!')
-    # Find ice thaw date
-    try:
-        logger.info('Trying ice thaw enumerate...')
-        idx = len(meanicecover) - next(
-            i for i, val in
-            enumerate(reversed(meanicecover), 1)
-            if val >= 10
-        )
-        logger.info('Completed ice thaw enumerate!')
+    # Find ice thaw date: 5 days after the last icy day
+    last_icy = np.flatnonzero(icy)
+    if last_icy.size:
+        idx = last_icy[-1]
         if (
-            len([idx]) > 0
-            and (len(meanicecover)-1)-idx >= 5
-            and sum(np.isnan(meanicecover[idx:])) <= 2
+            (len(meanicecover)-1)-idx >= 5
+            and np.isnan(meanicecover[idx:]).sum() <= 2
         ):
             iceoff = time_all_dt[idx+5]
             logger.info('Ice thaw date found!')
         else:
             logger.info('Ice thaw date not found!')
-    except StopIteration:
-        logger.error('StopIteration exception: ice thaw date not found!')
+    else:
+        logger.error('Ice thaw date not found: no day reaches 10% cover!')
     logger.info('Completed ice onset/thaw date-finding, return to main...')
     return iceon, iceoff
 
@@ -41,6 +41,18 @@ def make_ice_boxplots(ice_o, ice_m, time_all_dt, prop, logger):
         ' RMSE box/violin plots, ' +
         datestrbegin[0] + ' - ' + datestrend[0]
     )
+    # RMSE over all ice concentrations, and the cells it is defined for,
+    # are the same for every threshold range: find them once
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        data_all = np.sqrt(
+            np.nanmean(
+                ((ice_m_copy2-ice_o_copy2)**2), axis=0,
+            ),
+        )
+    # Put all data into a loooooooong 1D array
+    valid = ~isnan(data_all).ravel()
+    y_all = data_all.ravel()[valid]
     counter = -1
     for i in range(0, int(len(thresholds))):
         for k in range(0, int(len(thresholds))):
@@ -48,7 +60,6 @@ def make_ice_boxplots(ice_o, ice_m, time_all_dt, prop, logger):
             ice_o_thresh = []
             ice_m_thresh = []
             data = []
-            data_all = []
             for j in range(0, len(time_all_dt)):
                 o_temp = np.array(ice_o[j, :, :])
                 m_temp = np.array(ice_m[j, :, :])
@@ -66,13 +77,6 @@ def make_ice_boxplots(ice_o, ice_m, time_all_dt, prop, logger):
             # Stack data
             with warnings.catch_warnings():
                 warnings.simplefilter('ignore', category=RuntimeWarning)
-                data_all = np.array(
-                    np.sqrt(
-                        np.nanmean(
-                            ((ice_m_copy2-ice_o_copy2)**2), axis=0,
-                        ),
-                    ),
-                )
                 ice_o_thresh = np.stack(ice_o_thresh)
                 ice_m_thresh = np.stack(ice_m_thresh)
                 data = np.array(
@@ -81,13 +85,7 @@ def make_ice_boxplots(ice_o, ice_m, time_all_dt, prop, logger):
                     ),
                 )
                 data = np.sqrt(data)
-                # Put all data into a loooooooong 1D array
-                y = data.reshape(1, -1)
-                y_all = data_all.reshape(1, -1)
-                badnans = ~isnan(y)
-                badnans = ~isnan(y_all)
-                y = y[badnans]
-                y_all = y_all[badnans]
+                y = data.ravel()[valid]
                 temp_thresh = thresholds + (
                     thresholds[1][1] -
                     thresholds[1][0]
@@ -0,0 +1,168 @@
+"""
+Tests for argument parsing in the station/model CLI entry points.
+
+Covers ``bin/model_processing/get_node_cli.py`` and
+``bin/obs_retrieval/get_station_observations_cli.py``: comma-separated
+options (``-vs``, ``-so``) are split once at parse time into tuples,
+datum/whichcast/variable/owner values are validated at parse time, and the
+parser object is built once per module.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+NODE_CLI_PATH = REPO_ROOT / 'bin' / 'model_processing' / 'get_node_cli.py'
+OBS_CLI_PATH = (REPO_ROOT / 'bin' / 'obs_retrieval'
+                / 'get_station_observations_cli.py')
+
+NODE_REQUIRED = ['-o', 'cbofs', '-p', './', '-s', '2024-01-01T00:00:00Z',
+                 '-e', '2024-01-02T00:00:00Z']
+OBS_REQUIRED = NODE_REQUIRED + ['-d', 'MLLW']
+
+
+def _load_module(path, name):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope='module')
+def node_cli():
+    return _load_module(NODE_CLI_PATH, 'get_node_cli_under_test')
+
+
+@pytest.fixture(scope='module')
+def obs_cli():
+    return _load_module(OBS_CLI_PATH, 'get_station_observations_cli_under_test')
+
+
+def test_node_var_selection_default_is_tuple(node_cli):
+    args = node_cli.build_parser().parse_args(NODE_REQUIRED)
+    assert args.Var_Selection == (
+        'water_level', 'water_temperature', 'salinity', 'currents')
+
+
+@pytest.mark.parametrize('raw', [
+    'Water_Level,Salinity',
+    '[water_level, salinity]',
+])
+def test_node_var_selection_split_once(node_cli, raw):
+    args = node_cli.build_parser().parse_args(NODE_REQUIRED + ['-vs', raw])
+    assert args.Var_Selection == ('water_level', 'salinity')
+
+
+def test_obs_station_owner_and_vars_split(obs_cli):
+    args = obs_cli.build_parser().parse_args(
+        OBS_REQUIRED + ['-so', 'NDBC,CO-OPS', '-vs', 'currents'])
+    assert args.Station_Owner == ('ndbc', 'co-ops')
+    assert args.Var_Selection == ('currents',)
+
+
+def test_large_csv_list_is_parsed(obs_cli):
+    owners = ','.join(['ndbc', 'usgs'] * 2500)
+    args = obs_cli.build_parser().parse_args(OBS_REQUIRED + ['-so', owners])
+    assert len(args.Station_Owner) == 5000
+
+
+def test_parser_is_cached(node_cli, obs_cli):
+    assert node_cli.build_parser() is node_cli.build_parser()
+    assert obs_cli.build_parser() is obs_cli.build_parser()
+
+
+def test_obs_jobs_flag(obs_cli):
+    args = obs_cli.build_parser().parse_args(OBS_REQUIRED + ['-j', '16'])
+    assert args.Jobs == 16
+    assert obs_cli.build_parser().parse_args(OBS_REQUIRED).Jobs is None
+
+
+@pytest.mark.parametrize('bad', ['0', '-2', 'many'])
+def test_obs_jobs_flag_rejects_non_positive(obs_cli, bad):
+    with pytest.raises(SystemExit):
+        obs_cli.build_parser().parse_args(OBS_REQUIRED + ['-j', bad])
+
+
+@pytest.mark.parametrize('flag, value', [
+    ('-d', 'MSL'),
+    ('-ws', 'forecast_c'),
+    ('-vs', 'water_level,wind'),
+])
+def test_node_rejects_unknown_values(node_cli, flag, value, capsys):
+    with pytest.raises(SystemExit) as exc:
+        node_cli.build_parser().parse_args(NODE_REQUIRED + [flag, value])
+    assert exc.value.code == 2
+    assert 'invalid choice' in capsys.readouterr().err
+
+
+@pytest.mark.parametrize('flag, value', [
+    ('-so', 'NDBC,NOS'),
+    ('-vs', 'salt'),
+])
+def test_obs_rejects_unknown_values(obs_cli, flag, value, capsys):
+    with pytest.raises(SystemExit) as exc:
+        obs_cli.build_parser().parse_args(OBS_REQUIRED + [flag, value])
+    assert exc.value.code == 2
+    assert 'invalid choice' in capsys.readouterr().err
+
+
+def test_datum_and_whichcast_are_case_insensitive(node_cli, obs_cli):
+    args = node_cli.build_parser().parse_args(
+        NODE_REQUIRED + ['-d', 'navd88', '-ws', 'Forecast_B'])
+    assert (args.Datum, args.Whichcast) == ('NAVD88', 'forecast_b')
+    args = obs_cli.build_parser().parse_args(
+        NODE_REQUIRED + ['-d', 'xgeoid20b'])
+    assert args.Datum == 'XGEOID20B'
+
+
+def _run_obs_main(obs_cli, argv):
+    from ofs_skill.model_processing import model_properties
+    fake = MagicMock()
+    with patch.object(obs_cli, '_load',
+                      return_value=(model_properties, fake)):
+        obs_cli.main(argv)
+    return fake.call_args.args[0]
+
+
+def test_obs_main_passes_station_owner(obs_cli):
+    prop = _run_obs_main(obs_cli, OBS_REQUIRED + ['-so', 'NDBC'])
+    assert prop.stationowner == ('ndbc',)
+    assert prop.var_list == 'water_level,water_temperature,salinity,currents'
+
+
+def test_obs_main_defaults_station_owner(obs_cli):
+    prop = _run_obs_main(obs_cli, OBS_REQUIRED + ['-vs', 'salinity'])
+    assert prop.stationowner == 'co-ops,ndbc,usgs,chs'
+    assert prop.var_list == ('salinity',)
+
+
+def test_from_namespace_maps_cli_args(node_cli):
+    from ofs_skill.model_processing.model_properties import ModelProperties
+    args = node_cli.build_parser().parse_args(
+        ['-o', 'CBOFS', '-p', './', '-s', '2024-01-01T00:00:00Z',
+         '-e', '2024-01-02T00:00:00Z', '-d', 'navd88', '-ws', 'forecast_b'])
+    prop = ModelProperties.from_namespace(args)
+    assert (prop.ofs, prop.path, prop.datum, prop.whichcast) == (
+        'cbofs', './', 'NAVD88', 'forecast_b')
+    assert prop.start_date_full == '2024-01-01T00:00:00Z'
+    assert prop.var_list == args.Var_Selection
+    assert prop.currents_bins_csv is None
+
+
+@pytest.mark.parametrize('ofs, datum, expected', [
+    ('leofs', 'MLLW', 'IGLD85'),
+    ('lmhofs', 'LWD', 'LWD'),
+    ('cbofs', 'MLLW', 'MLLW'),
+])
+def test_from_namespace_glofs_datum_default(ofs, datum, expected):
+    import argparse
+
+    from ofs_skill.model_processing.model_properties import ModelProperties
+    prop = ModelProperties.from_namespace(
+        argparse.Namespace(OFS=ofs, Datum=datum))
+    assert prop.datum == expected
@@ -0,0 +1,74 @@
+"""
+Tests for the deferred imports in the station/model CLI entry points.
+
+``bin/model_processing/get_node_cli.py`` and
+``bin/obs_retrieval/get_station_observations_cli.py`` only import the
+``ofs_skill`` processing stack after ``parse_args`` succeeds, so ``-h`` and
+argument errors must exit without touching ``ofs_skill`` (or pandas) at all.
+Each case runs in a fresh interpreter so modules cached by other tests don't
+mask a regression.
+"""
+
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from bin.utils import cli_args
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+CLI_PATHS = [
+    REPO_ROOT / 'bin' / 'model_processing' / 'get_node_cli.py',
+    REPO_ROOT / 'bin' / 'obs_retrieval' / 'get_station_observations_cli.py',
+]
+
+_PROBE = '''
+import importlib.util, sys
+spec = importlib.util.spec_from_file_location('cli_under_test', {path!r})
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+try:
+    module.main({argv!r})
+except SystemExit as exc:
+    code = exc.code
+loaded = sorted(m for m in sys.modules
+                if m.split('.')[0] in ('ofs_skill', 'pandas'))
+print(code, loaded)
+'''
+
+
+def _run(path, argv):
+    proc = subprocess.run(
+        [sys.executable, '-c', _PROBE.format(path=str(path), argv=argv)],
+        capture_output=True, text=True, cwd=REPO_ROOT, check=True,
+    )
+    return proc.stdout.strip().splitlines()[-1]
+
+
+@pytest.mark.parametrize('path', CLI_PATHS, ids=lambda p: p.name)
+def test_help_does_not_import_ofs_skill(path):
+    assert _run(path, ['-h']) == '0 []'
+
+
+@pytest.mark.parametrize('path', CLI_PATHS, ids=lambda p: p.name)
+def test_missing_required_args_do_not_import_ofs_skill(path):
+    assert _run(path, []) == '2 []'
+
+
+@pytest.mark.parametrize('path', CLI_PATHS, ids=lambda p: p.name)
+def test_bad_argument_does_not_import_ofs_skill(path):
+    argv = ['-o', 'cbofs', '-p', '.', '-s', 'a', '-e', 'b', '-d', 'bogus']
+    assert _run(path, argv) == '2 []'
+
+
+@pytest.mark.parametrize('path', CLI_PATHS, ids=lambda p: p.name)
+def test_cli_uses_shared_parser_helpers(path):
+    spec = importlib.util.spec_from_file_location('cli_under_test', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert module.CsvAction is cli_args.CsvAction
+    assert module.DATUMS is cli_args.DATUMS
+    assert module.VARS is cli_args.VARS
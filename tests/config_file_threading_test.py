@@ -17,11 +17,13 @@ tests build a tiny custom conf and verify both code paths pick it up.
 """
 
 import logging
+import os
 from types import SimpleNamespace
 
 import pytest
 
 from ofs_skill.model_processing.get_datum_offset import read_vdatum_from_bucket
+from ofs_skill.obs_retrieval import utils
 from ofs_skill.obs_retrieval.utils import get_parallel_config
 
 
@@ -101,3 +103,32 @@ def test_read_vdatum_without_config_file_attr_still_warns():
     # Either S3 succeeds (returns Dataset) or it fails and we end up at
     # -9990 — but no AttributeError on the missing prop.config_file.
     assert result == -9990 or hasattr(result, 'data_vars')
+
+
+def test_read_config_section_reuses_parse_until_file_changes(tmp_path):
+    """Sections of one conf are parsed once, and an edited conf is
+    re-read."""
+    conf = tmp_path / 'ofs_dps.cached.conf'
+    conf.write_text('[directories]\nhome = /a\n\n[settings]\nx = 1\n')
+    logger = logging.getLogger(__name__)
+    conf_utils = utils.Utils(str(conf))
+
+    utils._read_config_cached.cache_clear()
+    assert conf_utils.read_config_section('directories', logger) == {
+        'home': '/a'}
+    assert conf_utils.read_config_section('settings', logger) == {'x': '1'}
+    assert utils._read_config_cached.cache_info().misses == 1
+
+    conf.write_text('[directories]\nhome = /b\n')
+    stat = conf.stat()
+    os.utime(conf, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert conf_utils.read_config_section('directories', logger) == {
+        'home': '/b'}
+    assert conf_utils.read_config_section('settings', logger) == {}
+
+
+def test_read_config_section_missing_file(tmp_path):
+    conf_utils = utils.Utils()
+    conf_utils.config_file = tmp_path / 'missing.conf'
+    assert conf_utils.read_config_section(
+        'directories', logging.getLogger(__name__)) == {}
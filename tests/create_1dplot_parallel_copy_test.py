@@ -15,6 +15,7 @@ import sys
 from pathlib import Path
 from unittest.mock import patch
 
+import pandas as pd
 import pytest
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
@@ -82,7 +83,8 @@ def test_parallel_dispatch_gives_each_worker_a_deepcopy(create_1dplot_mod):
     captured = []
 
     def fake_process_station_plot(
-            i, ctl_file, station_ctl, received_prop, _var_info, _logger):
+            i, ctl_file, station_ctl, received_prop, _var_info, _logger,
+            _station_rows=None):
         captured.append(received_prop)
         return f'sta{i}'
 
@@ -124,3 +126,89 @@ def test_parallel_dispatch_gives_each_worker_a_deepcopy(create_1dplot_mod):
         assert other.start_date_full == prop.start_date_full
     assert 'forecast_a' not in prop.whichcasts
     assert prop.start_date_full == '2026-02-16T00:00:00Z'
+
+
+def test_ensure_paired_data_lists_pair_dir_once(create_1dplot_mod, tmp_path):
+    """Only casts with a missing pair file (for a station with a model node)
+    are regenerated, and the pair dir is listed rather than stat-ed."""
+
+    prop = _StubProp()
+    prop.data_skill_1d_pair_path = tmp_path.as_posix()
+    var_info = ('Water Level', 'wl', [])
+    read_ofs_ctl_file = [[None] * 2, [5, -1], [None] * 2, ['sta0', 'sta1']]
+    (tmp_path / 'necofs_wl_sta0_5_nowcast_stations_pair.int').touch()
+
+    with patch.object(create_1dplot_mod, 'get_skill') as get_skill, \
+         patch.object(create_1dplot_mod.os.path, 'isfile') as isfile:
+        create_1dplot_mod._ensure_paired_data_exists(
+            read_ofs_ctl_file, prop, var_info, _MockLogger())
+
+    isfile.assert_not_called()
+    get_skill.assert_called_once()
+    assert prop.whichcast == 'forecast_b'
+
+
+def test_station_row_index_keeps_first_row(create_1dplot_mod):
+    station_ctl = [[['a', 'x'], ['b', 'y'], ['a', 'z'], []], []]
+    rows = create_1dplot_mod._station_row_index(station_ctl)
+    assert rows == {'a': 0, 'b': 1}
+
+
+def test_station_plot_reads_pair_file(create_1dplot_mod, tmp_path):
+    """The paired .int file is parsed with its known column dtypes and a
+    DateTime column before it is handed to the plotting code."""
+
+    prop = _StubProp()
+    prop.whichcasts = ['nowcast']
+    prop.data_skill_1d_pair_path = tmp_path.as_posix()
+    prop.data_model_1d_node_path = tmp_path.as_posix()
+    names = ['Julian', 'year', 'month', 'day', 'hour', 'minute',
+             'OBS', 'OFS', 'BIAS']
+    var_info = ('Water Level', 'wl', names)
+    (tmp_path / 'necofs_wl_sta0_5_nowcast_stations_pair.int').write_text(
+        'DNUM_JAN1 YEAR MONTH DAY HOUR MINUTE VAL_OB VAL_MODEL BIAS \n'
+        '364.9958 2025 12 31 23 54 1.25 1.5 0.25\n'
+        '365.0 2026 1 1 0 0 nan 1.75 nan\n')
+    read_ofs_ctl_file = [[None], [5], [None], ['sta0']]
+    station_ctl = [[['sta0', 'Zero_NOS', 'Station Zero']], [[0, 0, 1.5]]]
+
+    with patch.object(create_1dplot_mod.plotting_scalar,
+                      'oned_scalar_plot') as plot:
+        result = create_1dplot_mod._process_station_plot(
+            0, read_ofs_ctl_file, station_ctl, prop, var_info, _MockLogger())
+
+    assert result == 'sta0'
+    paired = plot.call_args.args[0][0]
+    assert plot.call_args.args[2] == ['sta0', 'Station Zero', 'NOS', 1.5]
+    assert list(paired['DateTime']) == [
+        pd.Timestamp('2025-12-31 23:54'), pd.Timestamp('2026-01-01')]
+    assert paired['Julian'].iloc[0] == pytest.approx(364.9958)
+    assert paired['OBS'].dtype == 'float64'
+
+
+def test_hourly_subsample_matches_groupby_idxmin(create_1dplot_mod):
+    times = pd.date_range('2025-12-31 22:00', periods=40, freq='6min')
+    paired = pd.DataFrame({
+        'year': times.year, 'month': times.month, 'day': times.day,
+        'hour': times.hour, 'minute': times.minute,
+        'OBS': range(len(times))})
+    # Shuffle, and repeat some rows so hours have tied minima
+    paired = pd.concat([paired, paired.iloc[::7]]).reset_index(drop=True)
+    paired = paired.sample(frac=1, random_state=0)
+    expected = paired.loc[paired.groupby(
+        ['year', 'month', 'day', 'hour'], observed=True)['minute'].idxmin()]
+    result = create_1dplot_mod._hourly_subsample(paired)
+    pd.testing.assert_frame_equal(result, expected)
+    assert list(result['minute']) == [0, 0, 0, 0]
+
+
+def test_pair_datetimes_match_to_datetime(create_1dplot_mod):
+    times = pd.DatetimeIndex(['1999-12-31 23:54', '2024-02-29 12:06',
+                              '2025-03-01 00:00', '2025-12-31 23:59'])
+    paired = pd.DataFrame({
+        'year': times.year.astype('int16'), 'month': times.month.astype('int8'),
+        'day': times.day.astype('int8'), 'hour': times.hour.astype('int8'),
+        'minute': times.minute.astype('int8')}, index=[3, 2, 1, 0])
+    result = create_1dplot_mod._pair_datetimes(paired)
+    assert list(result.index) == [3, 2, 1, 0]
+    assert list(result) == list(times)
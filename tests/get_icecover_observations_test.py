@@ -0,0 +1,57 @@
+"""
+Tests for the GLSEA downloader in
+``bin/obs_retrieval/get_icecover_observations.py``.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+GET_ICECOVER_PATH = (
+    REPO_ROOT / 'bin' / 'obs_retrieval' / 'get_icecover_observations.py')
+
+
+@pytest.fixture(scope='module')
+def gio():
+    spec = importlib.util.spec_from_file_location(
+        'get_icecover_observations_under_test', GET_ICECOVER_PATH)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules['get_icecover_observations_under_test'] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def test_download_file_copies_body(gio, tmp_path):
+    src = tmp_path / 'src.nc'
+    src.write_bytes(b'x' * (3 << 20))
+    dest = tmp_path / 'dest.nc'
+    gio._download_file(src.as_uri(), str(dest))
+    assert dest.read_bytes() == src.read_bytes()
+    assert not (tmp_path / 'dest.nc.part').exists()
+
+
+def test_failed_download_leaves_no_file(gio, tmp_path):
+    dest = tmp_path / 'dest.nc'
+    with pytest.raises(OSError):
+        gio._download_file((tmp_path / 'missing.nc').as_uri(), str(dest))
+    assert not dest.exists()
+
+
+def test_interrupted_download_removes_partial_file(gio, tmp_path):
+    src = tmp_path / 'src.nc'
+    src.write_bytes(b'x' * 10)
+    dest = tmp_path / 'dest.nc'
+
+    def stall(response, out, length):
+        out.write(response.read(4))
+        raise TimeoutError('timed out')
+
+    with patch.object(gio.shutil, 'copyfileobj', side_effect=stall), \
+            pytest.raises(TimeoutError):
+        gio._download_file(src.as_uri(), str(dest))
+    assert not dest.exists()
+    assert not (tmp_path / 'dest.nc.part').exists()
@@ -0,0 +1,187 @@
+"""
+Tests for the NODD model-output downloader in ``bin/utils/get_model_data.py``.
+"""
+
+import importlib.util
+import sys
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from ofs_skill.model_processing.get_fcst_cycle import get_fcst_hours
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+GET_MODEL_DATA_PATH = REPO_ROOT / 'bin' / 'utils' / 'get_model_data.py'
+
+
+@pytest.fixture(scope='module')
+def gmd():
+    spec = importlib.util.spec_from_file_location(
+        'get_model_data_under_test', GET_MODEL_DATA_PATH)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules['get_model_data_under_test'] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _fake_session(chunks=(b'abc', b'def'), status=200):
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.iter_content.return_value = list(chunks)
+    if status != 200:
+        error = requests.HTTPError(response=MagicMock(status_code=status))
+        response.raise_for_status.side_effect = error
+    session = MagicMock()
+    session.get.return_value = response
+    return session
+
+
+def test_local_path(gmd):
+    url = 'https://noaa-nos-ofs-pds.s3.amazonaws.com/cbofs/netcdf/x.nc'
+    assert gmd._local_path(url, '/data/', 'cbofs') == '/data/cbofs/netcdf/x.nc'
+    url = 'https://noaa-nos-stofs3d-pds.s3.amazonaws.com/STOFS-3D-Atl/x.nc'
+    assert (gmd._local_path(url, '/data/', 'stofs_3d_atl')
+            == '/data/stofs_3d_atl/x.nc')
+
+
+def test_fetch_streams_through_shared_session(gmd, tmp_path):
+    session = _fake_session()
+    dest = tmp_path / 'x.nc'
+    with patch.object(gmd.utils, 'get_http_session', return_value=session):
+        gmd._fetch('https://host/x.nc', str(dest))
+    assert dest.read_bytes() == b'abcdef'
+    assert not (tmp_path / 'x.nc.part').exists()
+    kwargs = session.get.call_args.kwargs
+    assert kwargs['stream'] is True
+    assert kwargs['timeout'] == gmd.TIMEOUT_SEC
+
+
+def test_interrupted_fetch_removes_partial_file(gmd, tmp_path):
+    def chunks():
+        yield b'abc'
+        raise requests.ConnectionError('read timed out')
+
+    session = _fake_session()
+    session.get.return_value.iter_content.return_value = chunks()
+    dest = tmp_path / 'x.nc'
+    with patch.object(gmd.utils, 'get_http_session', return_value=session), \
+            pytest.raises(requests.ConnectionError):
+        gmd._fetch('https://host/x.nc', str(dest))
+    assert not dest.exists()
+    assert not (tmp_path / 'x.nc.part').exists()
+
+
+def test_existing_files(gmd, tmp_path):
+    (tmp_path / 'a.nc').write_bytes(b'old')
+    (tmp_path / 'sub').mkdir()
+    paths = [str(tmp_path / 'a.nc'), str(tmp_path / 'b.nc'),
+             str(tmp_path / 'sub'), str(tmp_path / 'missing' / 'c.nc')]
+    assert gmd._existing_files(paths) == {str(tmp_path / 'a.nc')}
+
+
+def test_download_failure_leaves_no_file(gmd, tmp_path):
+    dest = tmp_path / 'x.nc'
+    session = _fake_session(status=404)
+    with patch.object(gmd.utils, 'get_http_session', return_value=session):
+        assert gmd._download_single_file(
+            'https://host/x.nc', str(dest), MagicMock()) is None
+    assert not dest.exists()
+
+
+def test_file_list_spans_name_change(gmd):
+    prop = SimpleNamespace(ofs='cbofs', whichcast='nowcast',
+                           ofsfiletype='fields')
+    files = gmd.make_file_list(
+        prop, ['08/31/24', '09/01/24'], ['d0', 'd1'], MagicMock())
+    # 4 cycles x 6 nowcast hours per day
+    assert len(files) == 48
+    assert files[0] == 'd0/nos.cbofs.fields.n001.20240831.t00z.nc'
+    assert files[24] == 'd1/cbofs.t00z.20240901.fields.n001.nc'
+    assert files[-1] == 'd1/cbofs.t18z.20240901.fields.n006.nc'
+
+
+def test_stofs_3d_nowcast_file_hours(gmd):
+    prop = SimpleNamespace(ofs='stofs_3d_atl', whichcast='nowcast',
+                           ofsfiletype='fields')
+    files = gmd.make_file_list(prop, ['09/01/24'], ['d0'], MagicMock())
+    assert len(files) == 12
+    assert 'd0/stofs_3d_atl.t12z.fields.out2d_n001_012.nc' in files
+    assert 'd0/stofs_3d_atl.t12z.fields.salinity_n013_024.nc' in files
+
+
+def test_ofs_cycle_lookup(gmd):
+    prop = SimpleNamespace(ofs='stofs_3d_pac', whichcast='forecast_b')
+    fcstcycles, hrstrings = gmd.get_ofs_cycle(prop, MagicMock())
+    assert fcstcycles == ['12']
+    assert hrstrings == ['12', '24']
+    # Names are matched exactly, not as substrings of a known OFS
+    assert get_fcst_hours('stofs_3d_atl')[0] == 96
+    assert get_fcst_hours('atl')[0] == 120
+    assert list(get_fcst_hours('atl')[1]) == [3]
+
+
+@pytest.mark.parametrize('whichcast, valid', [
+    ('nowcast', True),
+    ('forecast_b', True),
+    ('forecast_banana', False),
+    ('nowcast,forecast_b', False),
+])
+def test_whichcast_validation(gmd, tmp_path, whichcast, valid):
+    (tmp_path / 'cbofs.shp').touch()
+    argu_list = ('2025-01-01T00:00:00Z', '2025-01-02T00:00:00Z', '.',
+                 'cbofs', whichcast, 'fields', str(tmp_path))
+    if valid:
+        gmd.parameter_validation(argu_list, MagicMock())
+    else:
+        with pytest.raises(SystemExit):
+            gmd.parameter_validation(argu_list, MagicMock())
+
+
+def test_create_directories(gmd, tmp_path):
+    (tmp_path / 'a').mkdir()
+    dirs = [str(tmp_path / 'a'), str(tmp_path / 'b' / 'c'),
+            str(tmp_path / 'b' / 'c')]
+    gmd.create_directories(dirs, MagicMock())
+    assert (tmp_path / 'b' / 'c').is_dir()
+    (tmp_path / 'f').touch()
+    with pytest.raises(SystemExit):
+        gmd.create_directories([str(tmp_path / 'f' / 'g')], MagicMock())
+
+
+@pytest.mark.parametrize('datei', [
+    '01/01/00', '12/31/24', '02/29/24', '09/01/68', '09/01/69', '3/4/25',
+])
+def test_parse_mdy_matches_strptime(gmd, datei):
+    assert gmd._parse_mdy(datei) == datetime.strptime(datei, '%m/%d/%y')
+
+
+def test_parse_mdy_rejects_bad_dates(gmd):
+    with pytest.raises(ValueError):
+        gmd._parse_mdy('02/30/24')
+
+
+def test_download_data_reports_missing_files(gmd, tmp_path):
+    prop = SimpleNamespace(ofs='cbofs')
+    urls = [f'https://host.com/cbofs/netcdf/{name}.nc'
+            for name in ('a', 'b', 'c')]
+    logger = MagicMock()
+
+    def fetch(url, local_path):
+        if url.endswith('b.nc'):
+            raise requests.HTTPError(response=MagicMock(status_code=404))
+        Path(local_path).write_bytes(b'ok')
+
+    (tmp_path / 'cbofs' / 'netcdf').mkdir(parents=True)
+    with patch.object(gmd, '_fetch', side_effect=fetch), \
+            patch.object(gmd, 'get_parallel_config',
+                         return_value={'model_download_workers': 2}):
+        gmd.download_data(prop, urls, [f'{tmp_path}/cbofs/netcdf/202501'],
+                          logger)
+    assert (tmp_path / 'cbofs' / 'netcdf' / 'c.nc').exists()
+    args = logger.warning.call_args.args
+    assert args[1:3] == (1, 2)
+    assert args[3] == urls[1]
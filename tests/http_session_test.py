@@ -0,0 +1,100 @@
+"""
+Tests for the process-wide pooled HTTP session in
+``ofs_skill.obs_retrieval.utils``.
+
+The station-observation retrievers share one ``requests.Session`` instead of
+relying on ``socket.setdefaulttimeout``; every call site passes an explicit
+``timeout=``.
+"""
+
+import importlib
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ofs_skill.obs_retrieval import chs_utils, utils
+
+# The package __init__ re-exports functions under the same names as their
+# modules, so resolve the modules explicitly.
+rtc = importlib.import_module(
+    'ofs_skill.obs_retrieval.retrieve_t_and_c_station')
+inventory_t_c_station = importlib.import_module(
+    'ofs_skill.obs_retrieval.inventory_t_c_station')
+ndbc = importlib.import_module('ofs_skill.obs_retrieval.retrieve_ndbc_station')
+usgs = importlib.import_module('ofs_skill.obs_retrieval.retrieve_usgs_station')
+
+
+@pytest.fixture
+def fresh_session(monkeypatch):
+    monkeypatch.setattr(utils, '_http_session', None)
+
+
+def test_session_is_shared(fresh_session):
+    session = utils.get_http_session()
+    assert utils.get_http_session() is session
+    assert rtc._get_session() is session
+
+
+def test_session_adapters_are_pooled(fresh_session):
+    adapter = utils.get_http_session().get_adapter('https://example.com')
+    assert adapter._pool_maxsize == utils._HTTP_POOL_SIZE
+    assert adapter.max_retries.total == 3
+    assert adapter.max_retries.read is False
+
+
+def test_chs_get_uses_shared_session():
+    fake = MagicMock()
+    with patch.object(chs_utils, 'get_http_session', return_value=fake), \
+            patch.object(chs_utils.chs_rate_limiter, 'wait'):
+        chs_utils.chs_get('https://chs.example/api', timeout=10)
+    fake.get.assert_called_once_with('https://chs.example/api', timeout=10)
+
+
+def test_tc_inventory_passes_explicit_timeout():
+    fake = MagicMock()
+    fake.get.return_value.json.return_value = {'stations': []}
+    with patch.object(utils, 'get_http_session', return_value=fake):
+        result = inventory_t_c_station.get_inventory(
+            'waterlevels', {'co_ops_mdapi_base_url': 'https://mdapi'},
+            'water_level', MagicMock())
+    assert result == {'stations': []}
+    assert fake.get.call_args.kwargs['timeout'] == utils.TIMEOUT_SEC
+
+
+@pytest.fixture
+def stalled_fetch(monkeypatch):
+    """A searvey fetch that hangs until the test ends."""
+    release = threading.Event()
+    monkeypatch.setattr(utils, 'SEARVEY_TIMEOUT_SEC', 0.2)
+    yield lambda **kwargs: release.wait()
+    release.set()
+
+
+def test_call_with_timeout():
+    assert utils.call_with_timeout(divmod, 7, 2, timeout=1) == (3, 1)
+    with pytest.raises(ZeroDivisionError):
+        utils.call_with_timeout(divmod, 1, 0, timeout=1)
+    with pytest.raises(TimeoutError):
+        utils.call_with_timeout(time.sleep, 5, timeout=0.1)
+
+
+def test_ndbc_fetch_cannot_block_forever(stalled_fetch):
+    start = time.monotonic()
+    with patch.object(ndbc, 'fetch_ndbc_station', stalled_fetch), \
+            pytest.raises(TimeoutError):
+        ndbc.retrieve_ndbc_station(
+            '20250101', '20250102', '44013', 'water_level', MagicMock())
+    assert time.monotonic() - start < 5
+
+
+def test_usgs_fetch_cannot_block_forever(stalled_fetch):
+    retrieve_input = MagicMock(station='01646500', start_date='20250101',
+                               end_date='20250102', variable='water_level')
+    logger = MagicMock()
+    start = time.monotonic()
+    with patch.object(usgs, 'get_usgs_station_data', stalled_fetch):
+        assert usgs.retrieve_usgs_station(retrieve_input, logger) is None
+    assert time.monotonic() - start < 5
+    logger.error.assert_called_once()
@@ -0,0 +1,258 @@
+"""
+Tests for the vectorized helpers used by the ice skill assessment in
+``bin/skill_assessment/do_iceskill.py``. Each replaces a per-day Python
+loop and must reproduce its results:
+
+- ``nearest_index_map``: ``scipy.interpolate.griddata(method='nearest')``
+- ``pair_days_index``: the hourly obs/model pairing loop
+- ``iceonoff``: the onset/thaw date scan
+- ``ice_cover_stats``: the daily basin-wide mean, std and extent
+- ``nan_time_sums``: ``np.nanmean`` over time of a field and its square
+- ``extent_contingency``/``critical_success_index``: the daily extent maps
+  and the confusion-matrix CSI
+"""
+
+import warnings
+from datetime import date, timedelta
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+import scipy.interpolate as interp
+from sklearn.metrics import confusion_matrix
+
+from ofs_skill.skill_assessment.do_iceskill import (
+    critical_success_index,
+    extent_contingency,
+    ice_cover_stats,
+    iceonoff,
+    nan_time_sums,
+    nearest_index_map,
+    pair_days_index,
+)
+
+
+def test_matches_griddata_nearest():
+    rng = np.random.default_rng(0)
+    xm, ym = rng.uniform(0, 100, 500), rng.uniform(0, 50, 500)
+    xo, yo = np.meshgrid(np.linspace(1, 99, 40), np.linspace(1, 49, 20))
+    idx = nearest_index_map(xm, ym, xo, yo)
+    for _ in range(3):
+        values = rng.uniform(0, 1, 500)
+        expected = interp.griddata(
+            (xm, ym), values*100, (xo, yo), method='nearest')
+        got = (values*100)[idx].reshape(xo.shape)
+        np.testing.assert_array_equal(got, expected)
+
+
+def test_nan_values_are_gathered():
+    xm, ym = np.array([0., 10.]), np.array([0., 0.])
+    xo, yo = np.array([[1., 9.]]), np.array([[0., 0.]])
+    idx = nearest_index_map(xm, ym, xo, yo)
+    values = np.array([np.nan, 0.5])
+    got = values[idx].reshape(xo.shape)
+    assert np.isnan(got[0, 0]) and got[0, 1] == 0.5
+
+
+def _nested_loop_pairs(time_o, time_m):
+    import pandas as pd
+    pairs = []
+    for j, t_o in enumerate(time_o):
+        d_o = pd.to_datetime(t_o)
+        for i, t_m in enumerate(time_m):
+            d_m = pd.to_datetime(t_m)
+            if (d_m.year, d_m.month, d_m.day) == (d_o.year, d_o.month,
+                                                  d_o.day):
+                pairs.append((j, i))
+    return pairs
+
+
+def test_pair_days_index_matches_nested_loop():
+    time_o = np.array(['2024-01-03', '2024-01-01', '2024-01-02',
+                       '2024-01-09'], dtype='datetime64[ns]')
+    hours = np.arange('2024-01-01T00', '2024-01-04T00',
+                      np.timedelta64(6, 'h'), dtype='datetime64[ns]')
+    time_m = np.concatenate([hours[6:], hours[:6]])
+    o_idx, m_idx = pair_days_index(time_o, time_m)
+    assert list(zip(o_idx, m_idx)) == _nested_loop_pairs(time_o, time_m)
+
+
+def _iceonoff_loop(time_all_dt, meanicecover):
+    iceon = iceoff = None
+    counter = 0
+    for i in range(len(time_all_dt)):
+        counter = counter + 1 if meanicecover[i] >= 10 else 0
+        if counter == 5:
+            iceon = time_all_dt[i]
+            break
+    icy = [i for i, val in enumerate(meanicecover) if val >= 10]
+    if icy:
+        idx = icy[-1]
+        if ((len(meanicecover)-1)-idx >= 5
+                and sum(np.isnan(meanicecover[idx:])) <= 2):
+            iceoff = time_all_dt[idx+5]
+    return iceon, iceoff
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_iceonoff_matches_loop(seed):
+    rng = np.random.default_rng(seed)
+    n = 60
+    days = [date(2025, 1, 1) + timedelta(days=d) for d in range(n)]
+    cover = rng.choice([0., 5., 12., 40., np.nan], size=n,
+                       p=[.2, .2, .25, .3, .05])
+    cover[rng.integers(0, n):] = 0
+    assert iceonoff(days, list(cover), MagicMock()) == \
+        _iceonoff_loop(days, list(cover))
+
+
+def test_iceonoff_no_ice():
+    days = [date(2025, 1, 1) + timedelta(days=d) for d in range(10)]
+    assert iceonoff(days, [0.]*10, MagicMock()) == (None, None)
+
+
+def test_ice_cover_stats_matches_per_day():
+    rng = np.random.default_rng(3)
+    cover = rng.uniform(0, 100, (6, 15, 20)).astype(np.float32)
+    cover[:, :3, :] = np.nan
+    cover[4] = np.nan
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        mean, std, extent = ice_cover_stats(cover, 10)
+    for day, grid in enumerate(cover):
+        if day == 4:
+            assert np.isnan(mean[day]) and extent[day] == 0
+            continue
+        np.testing.assert_allclose(mean[day], np.nanmean(grid), rtol=1e-6)
+        np.testing.assert_allclose(std[day], np.nanstd(grid), rtol=1e-5)
+        assert extent[day] == ((grid >= 10).sum()/(grid >= 0).sum())*100
+
+
+@pytest.mark.parametrize('tail, expected_offset', [
+    ([0.]*6, 5),                   # thaw 5 days after the last icy day
+    ([0.]*4, None),                # fewer than 5 days left after it
+    ([np.nan]*3 + [0.]*3, None),   # more than 2 NaN days after it
+    ([np.nan]*2 + [0.]*4, 5),
+])
+def test_iceonoff_thaw_rules(tail, expected_offset):
+    cover = [20.]*6 + tail
+    days = [date(2025, 1, 1) + timedelta(days=d) for d in range(len(cover))]
+    _, iceoff = iceonoff(days, cover, MagicMock())
+    expected = None if expected_offset is None else days[5+expected_offset]
+    assert iceoff == expected
+
+
+def _extent_loop(obs, mod, threshold):
+    """Extent maps and CSI as the daily loop built them."""
+    obs_map = np.array(obs)
+    obs_map[obs_map < threshold] = 0
+    obs_map[obs_map >= threshold] = 1
+    mod_map = np.array(mod)
+    mod_map[mod_map < threshold] = 0
+    mod_map[mod_map >= threshold] = 1
+    total = np.array(mod_map + obs_map)
+    total[total > 1] = 1
+    overlap = np.array(mod_map + obs_map)
+    overlap[overlap <= 1] = 0
+    overlap[overlap == 2] = 1
+    csi_map = np.array(mod_map - obs_map)
+    falarm = np.array(csi_map)
+    falarm[falarm != 1] = 0
+    miss = np.array(csi_map)
+    miss[miss != -1] = 0
+    miss = miss * -1
+    try:
+        cm = confusion_matrix(
+            obs_map[~np.isnan(obs_map)].flatten(),
+            mod_map[~np.isnan(mod_map)].flatten(),
+            labels=[0, 1],
+        )
+        total_cm = cm[1][1] + cm[0][1] + cm[1][0]
+        if total_cm > 0:
+            csi = (cm[1][1]/total_cm, cm[0][1]/total_cm, cm[1][0]/total_cm)
+        else:
+            csi = (0, 0, 0)
+    except ValueError:
+        csi = (np.nan, np.nan, np.nan)
+    return obs_map, mod_map, total, overlap, falarm, miss, csi
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_extent_contingency_matches_loop(seed):
+    rng = np.random.default_rng(seed)
+    obs = rng.uniform(0, 100, (15, 20))
+    obs[rng.uniform(size=obs.shape) < 0.2] = np.nan
+    mod = np.where(np.isnan(obs), np.nan, rng.uniform(0, 100, obs.shape))
+    if seed % 2:
+        # Model NaN over some water cells as well
+        mod[rng.uniform(size=obs.shape) < 0.05] = np.nan
+    obs_map, mod_map, total, overlap, falarm, miss, csi = \
+        _extent_loop(obs, mod, 15)
+
+    ext = extent_contingency(obs, mod, 15)
+    # Passing the caller's NaN masks gives the same result
+    given = extent_contingency(
+        obs, mod, 15, obs_valid=~np.isnan(obs), mod_valid=~np.isnan(mod))
+    for key in ext:
+        np.testing.assert_array_equal(given[key], ext[key])
+    np.testing.assert_array_equal(
+        np.where(ext['obs_valid'], ext['obs_ice'], np.nan), obs_map)
+    np.testing.assert_array_equal(
+        np.where(ext['mod_valid'], ext['mod_ice'], np.nan), mod_map)
+    np.testing.assert_array_equal(
+        np.where(ext['mod_valid'], ext['obs_ice'] | ext['mod_ice'], np.nan),
+        total)
+    np.testing.assert_array_equal(
+        np.where(ext['mod_valid'], ext['hits'], np.nan), overlap)
+    np.testing.assert_array_equal(ext['falarms'], falarm)
+    np.testing.assert_array_equal(ext['misses'], miss)
+    # The loop's cm[0][1] counts false alarms and cm[1][0] misses
+    np.testing.assert_allclose(
+        critical_success_index(ext), (csi[0], csi[1], csi[2]))
+
+
+@pytest.mark.parametrize('obs, mod, expected', [
+    (np.full((2, 2), 5.), np.full((2, 2), 5.), (0, 0, 0)),
+    (np.full((2, 2), np.nan), np.full((2, 2), np.nan),
+     (np.nan, np.nan, np.nan)),
+    (np.array([[50., 50.]]), np.array([[50., 5.]]), (0.5, 0, 0.5)),
+])
+def test_critical_success_index_edge_cases(obs, mod, expected):
+    got = critical_success_index(extent_contingency(obs, mod, 15))
+    np.testing.assert_allclose(got, expected)
+
+
+def test_critical_success_index_per_day():
+    rng = np.random.default_rng(3)
+    obs = rng.uniform(0, 100, (6, 8, 9))
+    obs[:, :2, :2] = np.nan
+    mod = np.where(np.isnan(obs), np.nan, rng.uniform(0, 100, obs.shape))
+    mod[2, 5, 5] = np.nan
+    obs[4] = 0
+    mod[4] = 0
+    per_day = critical_success_index(
+        extent_contingency(obs, mod, 15), axis=(1, 2))
+    for i in range(len(obs)):
+        expected = critical_success_index(
+            extent_contingency(obs[i], mod[i], 15))
+        np.testing.assert_allclose(
+            [ratio[i] for ratio in per_day], expected)
+
+
+def test_nan_time_sums_match_nanmean():
+    rng = np.random.default_rng(4)
+    cube = rng.normal(0, 30, (12, 7, 9)).astype(np.float32)
+    cube[rng.uniform(size=cube.shape) < 0.3] = np.nan
+    cube[:, 0, 0] = np.nan
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        expected_mean = np.nanmean(cube, axis=0)
+        expected_sq = np.nanmean(cube**2, axis=0)
+    # Sums of blocks of days add up to the sums of the whole period
+    sums = [nan_time_sums(cube[i:i+5]) for i in range(0, len(cube), 5)]
+    count, total, total_sq = (sum(parts) for parts in zip(*sums))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        np.testing.assert_allclose(
+            total / count, expected_mean, rtol=1e-5, atol=1e-5)
+        np.testing.assert_allclose(total_sq / count, expected_sq, rtol=1e-5)
+    assert count[0, 0] == 0
@@ -0,0 +1,76 @@
+"""
+Tests for the parsed-geometry cache in
+``ofs_skill.obs_retrieval.ofs_geometry``.
+
+The parsed extent is cached in-process and pickled next to the shapefile,
+keyed on the shapefile's size and mtime, so an unchanged shapefile is read
+once and an edited one is picked up automatically.
+"""
+
+import importlib
+import logging
+import os
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+geom = importlib.import_module('ofs_skill.obs_retrieval.ofs_geometry')
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def extents(tmp_path, monkeypatch):
+    ext_dir = tmp_path / 'ofs_extents'
+    ext_dir.mkdir()
+    for src in (REPO_ROOT / 'ofs_extents').glob('cbofs.*'):
+        shutil.copy(src, ext_dir / src.name)
+    monkeypatch.setattr(geom, '_geometry_cache', {})
+    return tmp_path
+
+
+@pytest.fixture
+def logger():
+    return logging.getLogger('ofs_geometry_cache_test')
+
+
+def _reader_spy():
+    return patch.object(geom.shapefile, 'Reader',
+                        wraps=geom.shapefile.Reader)
+
+
+def test_geometry_is_pickled_and_reused(extents, logger):
+    with _reader_spy() as reader:
+        first = geom.ofs_geometry('cbofs', str(extents), logger)
+        assert (extents / 'ofs_extents' / 'cbofs_geometry.pkl').is_file()
+        geom._geometry_cache.clear()
+        second = geom.ofs_geometry('cbofs', str(extents), logger)
+    assert reader.call_count == 1
+    assert second == first
+
+
+def test_shapefile_change_invalidates_cache(extents, logger):
+    shp = extents / 'ofs_extents' / 'cbofs.shp'
+    with _reader_spy() as reader:
+        geom.ofs_geometry('cbofs', str(extents), logger)
+        stat = shp.stat()
+        os.utime(shp, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        geom.ofs_geometry('cbofs', str(extents), logger)
+    assert reader.call_count == 2
+
+
+def test_use_cache_false_rereads(extents, logger):
+    with _reader_spy() as reader:
+        geom.ofs_geometry('cbofs', str(extents), logger)
+        geom.ofs_geometry('cbofs', str(extents), logger, use_cache=False)
+    assert reader.call_count == 2
+
+
+def test_corrupt_cache_file_is_ignored(extents, logger):
+    (extents / 'ofs_extents' / 'cbofs_geometry.pkl').write_bytes(b'junk')
+    mask, lat_1, lat_2, lon_1, lon_2 = geom.ofs_geometry(
+        'cbofs', str(extents), logger)
+    assert lat_1 < lat_2 and lon_1 < lon_2
+    assert len(mask) > 3
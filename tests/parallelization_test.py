@@ -156,7 +156,7 @@ class TestParallelConfig:
         int_keys = [
             'obs_coops_workers', 'obs_usgs_workers', 'obs_ndbc_workers',
             'obs_chs_workers', 'model_download_workers', 'skill_workers',
-            'ha_workers', 'plot_workers',
+            'ha_workers', 'plot_workers', 'schism_station_workers',
         ]
         for key in int_keys:
             assert config[key] >= 1, f'{key} should be >= 1'
@@ -168,7 +168,7 @@ class TestParallelConfig:
         all_keys = [
             'obs_coops_workers', 'obs_usgs_workers', 'obs_ndbc_workers',
             'obs_chs_workers', 'model_download_workers', 'skill_workers',
-            'ha_workers', 'plot_workers',
+            'ha_workers', 'plot_workers', 'schism_station_workers',
         ]
         for key in all_keys:
             result = _auto_workers(key)
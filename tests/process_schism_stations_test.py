@@ -0,0 +1,204 @@
+"""
+Tests for the SCHISM staout loaders in
+``bin/utils/process_schism_stations_cli.py``.
+"""
+
+import importlib.util
+import logging
+import sys
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PROCESS_SCHISM_PATH = (
+    REPO_ROOT / 'bin' / 'utils' / 'process_schism_stations_cli.py')
+
+NSTA, NVRT, NT = 3, 2, 60
+
+
+@pytest.fixture(scope='module')
+def pss():
+    spec = importlib.util.spec_from_file_location(
+        'process_schism_stations_under_test', PROCESS_SCHISM_PATH)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules['process_schism_stations_under_test'] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+@pytest.fixture
+def outputs(tmp_path):
+    """A LOOFS2-style output dir holding one 1D and one 2D staout file."""
+    out_dir = tmp_path / '2025' / '010106' / 'outputs'
+    out_dir.mkdir(parents=True)
+    rows_1d, rows_2d = [], []
+    for k in range(NT):
+        secs = 360.0 * (k + 1)
+        rows_1d.append([secs] + [k + sta / 10 for sta in range(NSTA)])
+        rows_2d.append([secs] + [-k - sta / 10 for sta in range(NSTA)])
+        # Profile row: NSTA x NVRT values, then NSTA x NVRT depths
+        rows_2d.append([secs] + [k * 100 + i for i in range(NSTA * NVRT)]
+                       + [-i for i in range(NSTA * NVRT)])
+    rows_2d[0][1] = -999999.0
+    for name, rows in (('staout_1', rows_1d), ('staout_5', rows_2d)):
+        with open(out_dir / name, 'w') as f:
+            for row in rows:
+                f.write(' ' + ' '.join(f'{v:.6E}' for v in row) + '\n')
+    return out_dir.as_posix()
+
+
+def test_load_1d_station_files(pss, outputs):
+    data, t, t_seconds = pss.load_1d_station_files(
+        outputs, 'staout_1', logging.getLogger())
+    assert data.shape == (NT, NSTA)
+    np.testing.assert_allclose(data[5], [5.0, 5.1, 5.2], rtol=1e-6)
+    assert t_seconds.dtype == np.int64
+    assert t_seconds[0] == 360 and t_seconds[-1] == 21600
+    assert t[0] == datetime(2025, 1, 1, 0, 6)
+    assert t[-1] == datetime(2025, 1, 1, 6)
+
+
+def test_load_1d_station_files_with_basedate(pss, outputs):
+    basedate = pss.get_basedate(outputs)
+    assert basedate == datetime(2025, 1, 1)
+    data, t, _ = pss.load_1d_station_files(
+        outputs, 'staout_1', logging.getLogger(), basedate)
+    assert data.shape == (NT, NSTA)
+    assert t[0] == datetime(2025, 1, 1, 0, 6)
+
+
+def test_load_2d_station_files(pss, outputs):
+    prof, prof_z, surf = pss.load_2d_station_files(
+        outputs, 'staout_5', logging.getLogger())
+    assert surf.shape == (NT, NSTA)
+    assert prof.shape == prof_z.shape == (NT, NSTA, NVRT)
+    assert np.isnan(surf[0, 0])
+    np.testing.assert_allclose(surf[1], [-1.0, -1.1, -1.2], rtol=1e-6)
+    np.testing.assert_array_equal(prof[2, 1], [202, 203])
+    np.testing.assert_array_equal(prof_z[2, 1], [-2, -3])
+    for arr in (prof, prof_z, surf):
+        assert arr.dtype == np.float32
+        assert arr.flags['C_CONTIGUOUS']
+
+
+def test_get_station_info(pss, tmp_path):
+    (tmp_path / 'station.in').write_text(
+        '1 0 0 0 0 0 0 0 0\n'
+        '2\n'
+        '1 1000000.0 800000.0 0\n'
+        '2 1100000.0 850000.0 0\n')
+    df = pss.get_station_info(None, str(tmp_path), logging.getLogger())
+    assert list(df.columns) == ['ID_num', 'WHAT IS THIS', 'lon', 'lat']
+    transformer = pss.Transformer.from_crs('EPSG:3174', 'EPSG:4326',
+                                           always_xy=True)
+    lon, lat = transformer.transform(1100000.0, 850000.0)
+    assert df['lon'].iloc[1] == pytest.approx(lon)
+    assert df['lat'].iloc[1] == pytest.approx(lat)
+
+
+def test_get_station_info_any_whitespace(pss, tmp_path):
+    (tmp_path / 'station.in').write_text(
+        '1 0 0 0 0 0 0 0 0 !on/off flags\n'
+        '2 !number of stations\n'
+        '  1\t1000000.0   800000.0 0 !first\n'
+        '2  1100000.0 850000.0  0\n')
+    df = pss.get_station_info(None, str(tmp_path), logging.getLogger())
+    assert list(df['ID_num']) == [1, 2]
+    assert df['ID_num'].max() == 2
+
+
+def test_make_dir_list_reports_missing_dirs_once(pss, tmp_path):
+    (tmp_path / '2025' / '0101' '06' / 'outputs').mkdir(parents=True)
+    # Hours off the 6-hourly cycles snap to the first and last cycle
+    prop = SimpleNamespace(start_dt=datetime(2025, 1, 1, 3),
+                           end_dt=datetime(2025, 1, 1, 13),
+                           filepath=tmp_path.as_posix())
+    logger = MagicMock()
+    dir_list = pss.make_dir_list(prop, logger)
+    assert dir_list == [f'{tmp_path.as_posix()}/2025/0101{hr}/outputs'
+                        for hr in ('00', '06', '12', '18')]
+    logger.error.assert_called_once()
+    assert logger.error.call_args.args[1:3] == (3, 4)
+
+
+def test_load_station_file_logs_and_skips_missing(pss, outputs):
+    logger = MagicMock()
+    prof, prof_z, surf = pss.load_station_file(outputs, 'staout_5', logger)
+    assert prof.shape == prof_z.shape == (NT, NSTA, NVRT)
+    assert surf.shape == (NT, NSTA)
+    assert pss.load_station_file(outputs, 'staout_6', logger) is None
+    logger.error.assert_called_once()
+
+
+def test_find_station_info_uses_first_station_in(pss, tmp_path):
+    dirs = []
+    for hr in ('00', '06'):
+        out_dir = tmp_path / f'0101{hr}' / 'outputs'
+        out_dir.mkdir(parents=True)
+        dirs.append(out_dir.as_posix())
+    (tmp_path / '010106' / 'station.in').write_text(
+        '1 0 0 0 0 0 0 0 0\n1\n1 1000000.0 800000.0 0\n')
+    df = pss.find_station_info(None, dirs, logging.getLogger())
+    assert list(df['ID_num']) == [1]
+    assert pss.find_station_info(None, dirs[:1], logging.getLogger()) is None
+
+
+def test_create_directories(pss, tmp_path):
+    (tmp_path / 'a').mkdir()
+    logger = MagicMock()
+    pss.create_directories([str(tmp_path / 'a'), str(tmp_path / 'b' / 'c')],
+                           logger)
+    assert (tmp_path / 'b' / 'c').is_dir()
+    logger.info.assert_called_once()
+    (tmp_path / 'f').touch()
+    with pytest.raises(SystemExit):
+        pss.create_directories([str(tmp_path / 'f' / 'g')], logger)
+
+
+def test_make_datetime_list(pss):
+    dates = pss.make_datetime_list(datetime(2024, 12, 31, 12),
+                                   datetime(2025, 1, 1, 12), 6)
+    assert dates == [datetime(2024, 12, 31, 12), datetime(2024, 12, 31, 18),
+                     datetime(2025, 1, 1), datetime(2025, 1, 1, 6),
+                     datetime(2025, 1, 1, 12)]
+    assert all(type(date) is datetime for date in dates)
+    assert pss.make_datetime_list(datetime(2025, 1, 2),
+                                  datetime(2025, 1, 1), 24) == []
+
+
+@pytest.mark.parametrize('parallel_enabled, workers', [(False, 1), (True, 1)])
+def test_process_days_runs_serially(pss, parallel_enabled, workers):
+    dates = [datetime(2025, 1, 1), datetime(2025, 1, 2)]
+    day_dirs = {'20250101': ['a'], '20250102': ['b']}
+    prop = SimpleNamespace(config_file='my.conf')
+    config = {'parallel_enabled': parallel_enabled,
+              'schism_station_workers': workers}
+    logger = MagicMock()
+    with patch.object(pss.utils, 'get_parallel_config',
+                      return_value=config) as get_config, \
+            patch.object(pss, 'process_day',
+                         side_effect=[ValueError('bad'), None]) as day, \
+            patch.object(pss, 'ProcessPoolExecutor') as pool:
+        pss.process_days(dates, day_dirs, ['o1', 'o2'], None, prop, logger)
+    get_config.assert_called_once_with(logger, 'my.conf')
+    pool.assert_not_called()
+    assert [c.args[:3] for c in day.call_args_list] == [
+        (dates[0], ['a'], 'o1'), (dates[1], ['b'], 'o2')]
+    assert logger.error.call_args.args[1] == '20250101'
+
+
+def test_process_days_pool_size_from_config(pss):
+    dates = [datetime(2025, 1, day) for day in (1, 2, 3)]
+    config = {'parallel_enabled': True, 'schism_station_workers': 2}
+    with patch.object(pss.utils, 'get_parallel_config',
+                      return_value=config), \
+            patch.object(pss, 'ProcessPoolExecutor') as pool, \
+            patch.object(pss, 'as_completed', return_value=[]):
+        pss.process_days(dates, {}, ['o1', 'o2', 'o3'], None,
+                         SimpleNamespace(), MagicMock())
+    pool.assert_called_once_with(max_workers=2)
@@ -0,0 +1,90 @@
+"""
+Tests for per-source station dispatch in ``_process_variable_obs``.
+
+Every data source in a station ctl file gets its own thread pool, the pools
+run side by side, and ``prop.jobs`` (CLI ``-j``) overrides the configured
+per-source worker counts while keeping the CO-OPS currents cap.
+"""
+
+import importlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import patch
+
+gso = importlib.import_module(
+    'ofs_skill.obs_retrieval.get_station_observations')
+
+_CFG = {
+    'obs_coops_workers': 6,
+    'obs_usgs_workers': 2,
+    'obs_ndbc_workers': 6,
+    'obs_chs_workers': 1,
+}
+
+
+def _ctl(*sources):
+    info = [[f'st{i}', f'st{i}_wl', f'Station {i}', src]
+            for i, src in enumerate(sources)]
+    meta = [['0.0', '0.0', '0.0'] for _ in sources]
+    return info, meta
+
+
+def _run(tmp_path, variable, sources, jobs=None):
+    pool_sizes = []
+    fetched = []
+
+    def _pool(max_workers):
+        pool_sizes.append(max_workers)
+        return ThreadPoolExecutor(max_workers=max_workers)
+
+    def _fetch(station_info, *args):
+        fetched.append(station_info[0])
+        return station_info[0]
+
+    prop = SimpleNamespace(jobs=jobs)
+    with patch.object(gso, 'station_ctl_file_extract',
+                      return_value=_ctl(*sources)), \
+            patch.object(gso, 'get_parallel_config', return_value=_CFG), \
+            patch.object(gso, 'ThreadPoolExecutor', side_effect=_pool), \
+            patch.object(gso, '_fetch_and_format_station',
+                         side_effect=_fetch):
+        blank = gso._process_variable_obs(
+            variable, prop, 'MLLW', ['MLLW'], '20240101', '20240102',
+            '20240101-00:00:00', '20240102-00:00:00', str(tmp_path),
+            'cbofs', ['co-ops'], [variable], str(tmp_path), str(tmp_path),
+            logging.getLogger('station_obs_dispatch_test'),
+        )
+    return blank, pool_sizes, sorted(fetched)
+
+
+def test_config_worker_counts_used_without_jobs(tmp_path):
+    blank, sizes, fetched = _run(
+        tmp_path, 'water_level', ['CO-OPS', 'USGS', 'NDBC', 'CO-OPS'])
+    assert blank is False
+    assert sizes == [6, 2, 6]
+    assert fetched == ['st0', 'st1', 'st2', 'st3']
+
+
+def test_jobs_overrides_worker_counts(tmp_path):
+    _, sizes, _ = _run(tmp_path, 'salinity', ['CO-OPS', 'USGS', 'CHS'],
+                       jobs=16)
+    assert sizes == [16, 16, 16]
+
+
+def test_jobs_keeps_coops_currents_cap(tmp_path):
+    _, sizes, _ = _run(tmp_path, 'currents', ['CO-OPS', 'NDBC'], jobs=16)
+    assert sizes == [2, 16]
+
+
+def test_unsupported_source_dispatches_nothing(tmp_path):
+    blank, sizes, fetched = _run(tmp_path, 'water_level', ['CO-OPS', 'XYZ'])
+    assert blank is False
+    assert sizes == []
+    assert fetched == []
+
+
+def test_existing_obs_files_are_reused(tmp_path):
+    (tmp_path / 'st0_cbofs_wl_station.obs').write_text('')
+    _, _, fetched = _run(tmp_path, 'water_level', ['CO-OPS', 'USGS'])
+    assert fetched == ['st1']